@@ -2,18 +2,41 @@
 """
 Add HowTo + FAQPage schemas to N8N template HTML files in bulk
 Usage: python add_schemas_bulk.py [--limit N] [--dry-run]
+       python add_schemas_bulk.py --all [--jobs N]
+
+With --all every template in the CSV is processed in one run (in parallel
+with --jobs). Finished slugs are appended to a checkpoint file, so an
+interrupted run resumes where it stopped; the checkpoint is removed once
+a run completes without errors. Only pages that got the schema (or already
+had it) are checkpointed: missing pages are retried on the next run.
+
+Rewritten pages are recorded in site_manifest.json (each --all worker
+saves its entries after every batch).
 """
 
 import argparse
-import csv
 import json
 import re
 import sys
 from pathlib import Path
-from bs4 import BeautifulSoup
 
-BASE_URL = "https://www.automationscookbook.com"
+from build_pool import map_chunks, resolve_jobs
+from catalogue import load_catalogue
+from html_rewriter import parse_html
+from output_writer import write_if_changed
+from page_enrichment import SCHEMA_COMMENT, dump_schema_json, generate_schema_graph
+from site_manifest import load_site_manifest, relative_path
+
 WORKSPACE_DIR = Path(__file__).parent
+CHECKPOINT_FILE = WORKSPACE_DIR / ".add_schemas_checkpoint"
+CHUNK_SIZE = 100
+
+# Statuses of add_schemas_to_html() written to the --all checkpoint
+CHECKPOINT_STATUSES = ('success', 'present')
+
+# Raw-bytes marker of a page that already has the enhanced schema (or the
+# HowTo/FAQPage JSON-LD that has_existing_schema() accepts)
+SCHEMA_MARKER = re.compile(rb'"@graph"\s*:|"@type"\s*:\s*"(?:HowTo|FAQPage)"')
 
 def extract_software_names(title):
     """Extract software A and B from title"""
@@ -29,154 +52,12 @@ def extract_software_names(title):
     
     return None, None
 
-def generate_howto_schema(template_data, html_url):
-    """Generate HowTo schema for a template"""
-    software_a = template_data.get('software_a', 'Software A')
-    software_b = template_data.get('software_b', 'Software B')
-    title = template_data.get('titulo_pagina', '')
-    description = template_data.get('descricao_curta', '')
-    steps = template_data.get('passos_resumo', '').split('|')
-    
-    schema = {
-        "@context": "https://schema.org",
-        "@type": "HowTo",
-        "@id": f"{html_url}#howto",
-        "name": title,
-        "description": description,
-        "image": f"{BASE_URL}/assets/integrations/{software_a.lower()}-{software_b.lower()}.png",
-        "totalTime": "PT15M",
-        "estimatedCost": {
-            "@type": "MonetaryAmount",
-            "currency": "BRL",
-            "value": "0"
-        },
-        "tool": [
-            {"@type": "HowToTool", "name": "n8n (self-hosted ou cloud)"},
-            {"@type": "HowToTool", "name": f"Conta {software_a} com API"},
-            {"@type": "HowToTool", "name": f"Conta {software_b} com API"}
-        ],
-        "supply": [
-            {"@type": "HowToSupply", "name": f"Credenciais de API do {software_a}"},
-            {"@type": "HowToSupply", "name": f"API key do {software_b}"}
-        ],
-        "step": []
-    }
-    
-    # Add steps
-    for i, step_text in enumerate(steps, 1):
-        if step_text.strip():
-            schema["step"].append({
-                "@type": "HowToStep",
-                "position": i,
-                "name": step_text.strip(),
-                "text": f"No n8n, configure o node '{step_text.strip()}' seguindo as instruções da documentação oficial.",
-                "url": f"{html_url}#step{i}"
-            })
-    
-    return schema
-
-def generate_faq_schema(template_data, html_url):
-    """Generate FAQPage schema for a template"""
-    software_a = template_data.get('software_a', 'Software A')
-    software_b = template_data.get('software_b', 'Software B')
-    
-    schema = {
-        "@context": "https://schema.org",
-        "@type": "FAQPage",
-        "@id": f"{html_url}#faq",
-        "mainEntity": [
-            {
-                "@type": "Question",
-                "name": "Quanto tempo leva para configurar esta integração?",
-                "acceptedAnswer": {
-                    "@type": "Answer",
-                    "text": f"A configuração completa da integração entre {software_a} e {software_b} no n8n leva aproximadamente 15 minutos, incluindo criação de credenciais de API e testes iniciais."
-                }
-            },
-            {
-                "@type": "Question",
-                "name": f"Quais planos do {software_a} e {software_b} são necessários?",
-                "acceptedAnswer": {
-                    "@type": "Answer",
-                    "text": f"Você precisa de planos que permitam acesso à API em ambas as plataformas. Verifique a documentação oficial de {software_a} e {software_b} para requisitos específicos de API."
-                }
-            },
-            {
-                "@type": "Question",
-                "name": "Este template é gratuito?",
-                "acceptedAnswer": {
-                    "@type": "Answer",
-                    "text": "Sim, todos os templates do Automations Cookbook são 100% gratuitos e open-source sob licença MIT. Você pode usar, modificar e distribuir livremente."
-                }
-            },
-            {
-                "@type": "Question",
-                "name": "Preciso ter conhecimentos de programação?",
-                "acceptedAnswer": {
-                    "@type": "Answer",
-                    "text": "Não é necessário. O n8n é uma plataforma no-code/low-code. Este template já vem pronto para importar e usar. Conhecimentos básicos de APIs ajudam, mas não são obrigatórios."
-                }
-            },
-            {
-                "@type": "Question",
-                "name": "Como faço para personalizar este workflow?",
-                "acceptedAnswer": {
-                    "@type": "Answer",
-                    "text": "Após importar o template JSON no n8n, você pode adicionar ou remover nodes, ajustar lógicas com nodes IF/Switch, e personalizar mensagens e dados usando expressões do n8n."
-                }
-            },
-            {
-                "@type": "Question",
-                "name": "O workflow funciona em tempo real?",
-                "acceptedAnswer": {
-                    "@type": "Answer",
-                    "text": f"Sim! Quando configurado com triggers (webhooks ou polling), o n8n processa dados em tempo real entre {software_a} e {software_b}, geralmente em menos de 5 segundos."
-                }
-            }
-        ]
-    }
-    
-    return schema
-
-def generate_breadcrumb_schema(template_data, html_url):
-    """Generate BreadcrumbList schema"""
-    slug = template_data.get('slug_url', '')
-    title = template_data.get('titulo_pagina', '')
-    
-    schema = {
-        "@context": "https://schema.org",
-        "@type": "BreadcrumbList",
-        "@id": f"{html_url}#breadcrumb",
-        "itemListElement": [
-            {
-                "@type": "ListItem",
-                "position": 1,
-                "name": "Home",
-                "item": BASE_URL
-            },
-            {
-                "@type": "ListItem",
-                "position": 2,
-                "name": "Integrações N8N",
-                "item": f"{BASE_URL}/integracoes/"
-            },
-            {
-                "@type": "ListItem",
-                "position": 3,
-                "name": title,
-                "item": html_url
-            }
-        ]
-    }
-    
-    return schema
-
-def has_existing_schema(soup):
+def has_existing_schema(doc):
     """Check if HTML already has schema.org structured data"""
-    scripts = soup.find_all('script', {'type': 'application/ld+json'})
+    scripts = doc.find_all('script', attrs={'type': 'application/ld+json'})
     for script in scripts:
         try:
-            data = json.loads(script.string)
+            data = json.loads(script.get_text())
             if isinstance(data, dict):
                 if data.get('@type') in ['HowTo', 'FAQPage'] or '@graph' in data:
                     return True
@@ -184,115 +65,86 @@ def has_existing_schema(soup):
             continue
     return False
 
-def add_schemas_to_html(html_path, template_data, dry_run=False):
-    """Add schemas to HTML file"""
+def has_schema_marker(raw):
+    """Fast check on the raw file bytes, before paying for a full parse"""
+    return SCHEMA_MARKER.search(raw) is not None
+
+def add_schemas_to_html(html_path, template_data, dry_run=False, site=None):
+    """Add schemas to HTML file
+
+    Returns 'success' when schemas were added, 'present' when the page
+    already had them, 'skipped' when it is missing or has no <head> and
+    'error' on errors. Rewritten pages are recorded in site (SiteManifest).
+    """
     
     if not html_path.exists():
         print(f"  ⚠️  File not found: {html_path}")
-        return False
+        return 'skipped'
     
     try:
-        with open(html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with open(html_path, 'rb') as f:
+            raw = f.read()
         
-        soup = BeautifulSoup(content, 'html.parser')
-        
-        # Check if already has schemas
-        if has_existing_schema(soup):
+        if has_schema_marker(raw):
             print(f"  ℹ️  Already has schema, skipping: {html_path.name}")
-            return False
+            return 'present'
         
-        # Generate URL
-        slug = template_data.get('slug_url', '')
-        html_url = f"{BASE_URL}/integracoes/{slug}.html"
+        content = raw.decode('utf-8')
+        doc = parse_html(content)
         
-        # Generate schemas
-        howto_schema = generate_howto_schema(template_data, html_url)
-        faq_schema = generate_faq_schema(template_data, html_url)
-        breadcrumb_schema = generate_breadcrumb_schema(template_data, html_url)
+        # Check if already has schemas
+        if has_existing_schema(doc):
+            print(f"  ℹ️  Already has schema, skipping: {html_path.name}")
+            return 'present'
         
-        # Combine in @graph
-        combined_schema = {
-            "@context": "https://schema.org",
-            "@graph": [howto_schema, faq_schema, breadcrumb_schema]
-        }
+        # HowTo + FAQPage + BreadcrumbList in @graph (same as build.py's schema plugin)
+        combined_schema = generate_schema_graph(template_data)
         
         # Create script tag
-        schema_json = json.dumps(combined_schema, indent=2, ensure_ascii=False)
+        schema_json = dump_schema_json(combined_schema)
         
         # Find head tag
-        head = soup.find('head')
+        head = doc.head
         if not head:
             print(f"  ⚠️  No <head> tag found: {html_path.name}")
-            return False
+            return 'skipped'
         
         # Insert schema script (replace existing if any)
-        existing_schema = head.find('script', {'type': 'application/ld+json'})
+        existing_schema = head.find('script', attrs={'type': 'application/ld+json'})
         if existing_schema:
-            existing_schema.extract()
-        
-        # Add comment before schema
-        schema_comment = soup.new_tag('comment')
-        schema_comment.string = ' Enhanced Schema.org (HowTo + FAQPage + BreadcrumbList) '
+            existing_schema.remove()
         
-        new_script = soup.new_tag('script', type='application/ld+json')
-        new_script.string = f"\n{schema_json}\n    "
-        
-        # Insert before </head>
-        head.append(soup.new_string('\n    '))
-        head.append(schema_comment)
-        head.append(soup.new_string('\n    '))
-        head.append(new_script)
-        head.append(soup.new_string('\n    '))
+        # Insert comment + schema before </head>
+        head.append_html(f'\n    {SCHEMA_COMMENT}\n'
+                         f'    <script type="application/ld+json">\n{schema_json}\n    </script>\n    ')
         
         if dry_run:
             print(f"  🔍 [DRY RUN] Would add schemas to: {html_path.name}")
-            return True
+            return 'success'
         
         # Write back
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(str(soup))
+        output = doc.serialize()
+        write_if_changed(html_path, output)
+        if site is not None:
+            site.record_content(relative_path(WORKSPACE_DIR, html_path), output)
         
         print(f"  ✅ Added schemas to: {html_path.name}")
-        return True
+        return 'success'
         
     except Exception as e:
         print(f"  ❌ Error processing {html_path.name}: {str(e)}")
-        return False
+        return 'error'
 
-def main():
-    parser = argparse.ArgumentParser(description='Add Schema.org to N8N templates in bulk')
-    parser.add_argument('--limit', type=int, default=20, help='Number of templates to process (default: 20)')
-    parser.add_argument('--dry-run', action='store_true', help='Show what would be done without making changes')
-    parser.add_argument('--skip', type=int, default=0, help='Skip first N templates')
-    args = parser.parse_args()
-    
-    print("🚀 Adding Schema.org to N8N Templates\n")
+def process_range(templates, skip, limit, dry_run):
+    """Sequential --skip/--limit mode"""
+    templates_to_process = templates[skip:skip + limit]
     
-    # Read CSV
-    csv_file = WORKSPACE_DIR / "automacoes_db.csv"
-    if not csv_file.exists():
-        print(f"❌ CSV not found: {csv_file}")
-        sys.exit(1)
-    
-    templates = []
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            templates.append(row)
-    
-    print(f"📊 Found {len(templates)} templates in CSV\n")
-    
-    # Apply skip and limit
-    templates_to_process = templates[args.skip:args.skip + args.limit]
-    
-    print(f"🎯 Processing {len(templates_to_process)} templates (skip: {args.skip}, limit: {args.limit})\n")
-    if args.dry_run:
-        print("🔍 DRY RUN MODE - No files will be modified\n")
+    print(f"🎯 Processing {len(templates_to_process)} templates (skip: {skip}, limit: {limit})\n")
     
     success_count = 0
     skip_count = 0
     error_count = 0
+    site = None if dry_run else load_site_manifest(WORKSPACE_DIR)
     
     for i, template in enumerate(templates_to_process, 1):
         slug = template.get('slug_url', '')
@@ -307,13 +159,126 @@ def main():
         
         html_path = WORKSPACE_DIR / "integracoes" / f"{slug}.html"
         
-        result = add_schemas_to_html(html_path, template, args.dry_run)
-        if result:
+        status = add_schemas_to_html(html_path, template, dry_run, site)
+        if status == 'success':
             success_count += 1
-        elif result is False:
-            skip_count += 1
-        else:
+        elif status == 'error':
             error_count += 1
+        else:
+            skip_count += 1
+    
+    if site is not None:
+        site.save()
+    
+    return success_count, skip_count, error_count, len(templates_to_process)
+
+# ==================== BATCH RUNNER (--all) ====================
+
+_worker_dry_run = False
+_worker_site = None
+
+def init_worker(dry_run):
+    """Store per-process options (and the site manifest) for process_chunk"""
+    global _worker_dry_run, _worker_site
+    _worker_dry_run = dry_run
+    _worker_site = None if dry_run else load_site_manifest(WORKSPACE_DIR)
+
+def process_template(template, dry_run, site=None):
+    """Process one CSV row; returns a status of add_schemas_to_html()"""
+    slug = template.get('slug_url', '')
+    if not slug:
+        return 'skipped'
+    html_path = WORKSPACE_DIR / "integracoes" / f"{slug}.html"
+    return add_schemas_to_html(html_path, template, dry_run, site)
+
+def process_chunk(templates):
+    """Process a batch of rows; returns [(slug, status), ...]
+
+    The site manifest is saved before returning (save() merges with the
+    other workers' entries), so every checkpointed page is recorded.
+    """
+    results = [(template.get('slug_url', ''), process_template(template, _worker_dry_run, _worker_site))
+               for template in templates]
+    if _worker_site is not None:
+        _worker_site.save()
+    return results
+
+def load_checkpoint(path):
+    """Slugs finished by previous (interrupted) --all runs"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return {line.strip() for line in f if line.strip()}
+    except FileNotFoundError:
+        return set()
+
+def run_all(templates, jobs, dry_run, checkpoint_path):
+    """Process the whole CSV in parallel batches, resuming from the checkpoint"""
+    done = set() if dry_run else load_checkpoint(checkpoint_path)
+    pending = [t for t in templates if t.get('slug_url', '') and t.get('slug_url', '') not in done]
+
+    print(f"🎯 Processing {len(pending)} templates with {jobs} process(es)")
+    if done:
+        print(f"♻️  Resuming: {len(done)} templates already done ({checkpoint_path.name})")
+    print()
+
+    counts = {'success': 0, 'present': 0, 'skipped': 0, 'error': 0}
+    checkpoint = None if dry_run else open(checkpoint_path, 'a', encoding='utf-8')
+    try:
+        chunks = map_chunks(process_chunk, pending, jobs, chunk_size=CHUNK_SIZE,
+                            initializer=init_worker, initargs=(dry_run,))
+        processed = 0
+        for results in chunks:
+            for slug, status in results:
+                counts[status] += 1
+                if checkpoint and status in CHECKPOINT_STATUSES:
+                    checkpoint.write(f"{slug}\n")
+            if checkpoint:
+                checkpoint.flush()
+            processed += len(results)
+            print(f"📦 {processed}/{len(pending)} templates")
+    finally:
+        if checkpoint:
+            checkpoint.close()
+
+    if not dry_run and counts['error'] == 0 and checkpoint_path.exists():
+        checkpoint_path.unlink()
+    return counts, len(pending)
+
+def main():
+    parser = argparse.ArgumentParser(description='Add Schema.org to N8N templates in bulk')
+    parser.add_argument('--limit', type=int, default=20, help='Number of templates to process (default: 20)')
+    parser.add_argument('--dry-run', action='store_true', help='Show what would be done without making changes')
+    parser.add_argument('--skip', type=int, default=0, help='Skip first N templates')
+    parser.add_argument('--all', action='store_true', help='Process every template in one resumable run')
+    parser.add_argument('--jobs', type=int, default=1, help='Worker processes for --all (0 = all cores)')
+    parser.add_argument('--checkpoint', type=Path, default=CHECKPOINT_FILE,
+                        help=f'Checkpoint file for --all (default: {CHECKPOINT_FILE.name})')
+    parser.add_argument('--restart', action='store_true', help='Ignore the checkpoint and start --all from scratch')
+    args = parser.parse_args()
+    
+    print("🚀 Adding Schema.org to N8N Templates\n")
+    
+    # Read CSV
+    csv_file = WORKSPACE_DIR / "automacoes_db.csv"
+    if not csv_file.exists():
+        print(f"❌ CSV not found: {csv_file}")
+        sys.exit(1)
+    
+    templates = load_catalogue(csv_file).rows
+    
+    print(f"📊 Found {len(templates)} templates in CSV\n")
+    
+    if args.dry_run:
+        print("🔍 DRY RUN MODE - No files will be modified\n")
+    
+    if args.all:
+        if args.restart and args.checkpoint.exists():
+            args.checkpoint.unlink()
+        counts, total = run_all(templates, resolve_jobs(args.jobs), args.dry_run, args.checkpoint)
+        success_count, error_count = counts['success'], counts['error']
+        skip_count = counts['present'] + counts['skipped']
+    else:
+        success_count, skip_count, error_count, total = process_range(templates, args.skip, args.limit, args.dry_run)
     
     # Summary
     print(f"\n{'='*60}")
@@ -322,7 +287,7 @@ def main():
     print(f"✅ Success: {success_count}")
     print(f"ℹ️  Skipped: {skip_count} (already have schemas or not found)")
     print(f"❌ Errors:  {error_count}")
-    print(f"📝 Total:   {len(templates_to_process)}")
+    print(f"📝 Total:   {total}")
     
     if args.dry_run:
         print(f"\n🔍 This was a DRY RUN - no files were modified")
@@ -332,7 +297,10 @@ def main():
         print(f"\n📝 Next steps:")
         print(f"   1. Test with Google Rich Results Test")
         print(f"   2. Commit changes to git")
-        print(f"   3. Run again with --skip {args.skip + args.limit} to process next batch")
+        if error_count and args.all:
+            print(f"   3. Run again with --all to retry the {error_count} failed templates")
+        elif not args.all:
+            print(f"   3. Run again with --skip {args.skip + args.limit} to process next batch (or use --all)")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,99 @@
+/**
+ * 🔎 Catalog Search
+ * Consulta o índice invertido pré-construído no build (search_index.py)
+ * em vez de varrer todas as integrações a cada tecla.
+ *
+ * Uso:
+ *   CatalogSearch.load('search-index.json').then(index => {
+ *       const ids = CatalogSearch.query(index, 'notificacao slack', 100);
+ *   });
+ */
+
+const CatalogSearch = (() => {
+    const cache = {};
+
+    // Mesma normalização do fold() em search_index.py
+    function fold(text) {
+        return text.normalize('NFD').replace(/[\u0300-\u036f]/g, '').toLowerCase();
+    }
+
+    function tokenize(text) {
+        return fold(text).match(/[a-z0-9]+/g) || [];
+    }
+
+    // Uma requisição por URL; se falhar, sai do cache para a próxima tentar de novo
+    function load(url) {
+        if (!cache[url]) {
+            cache[url] = fetch(url).then(response => {
+                if (!response.ok) throw new Error(`${url}: HTTP ${response.status}`);
+                return response.json();
+            }).then(index => {
+                index.decoded = new Array(index.tokens.length);
+                return index;
+            }).catch(error => {
+                delete cache[url];
+                throw error;
+            });
+        }
+        return cache[url];
+    }
+
+    // Decodifica (uma vez) a lista de ids de um token
+    function posting(index, position) {
+        if (!index.decoded[position]) {
+            const ids = [];
+            let current = 0;
+            for (const delta of index.postings[position]) {
+                current += delta;
+                ids.push(current);
+            }
+            index.decoded[position] = ids;
+        }
+        return index.decoded[position];
+    }
+
+    // Primeira posição em index.tokens >= prefix (busca binária)
+    function lowerBound(tokens, prefix) {
+        let low = 0;
+        let high = tokens.length;
+        while (low < high) {
+            const mid = (low + high) >> 1;
+            if (tokens[mid] < prefix) low = mid + 1;
+            else high = mid;
+        }
+        return low;
+    }
+
+    // Ids de todos os documentos com algum token começando por prefix
+    function matchPrefix(index, prefix) {
+        const ids = new Set();
+        for (let i = lowerBound(index.tokens, prefix); i < index.tokens.length; i++) {
+            if (!index.tokens[i].startsWith(prefix)) break;
+            for (const id of posting(index, i)) ids.add(id);
+        }
+        return ids;
+    }
+
+    /**
+     * Retorna os ids (em ordem do catálogo) dos documentos em que cada
+     * termo da busca é prefixo de algum token ("face ads" -> Facebook Ads).
+     */
+    function query(index, text, limit) {
+        const terms = tokenize(text);
+        if (terms.length === 0) return [];
+
+        const sets = terms.map(term => matchPrefix(index, term));
+        sets.sort((a, b) => a.size - b.size);
+
+        const result = [];
+        for (const id of sets[0]) {
+            if (sets.every(set => set.has(id))) result.push(id);
+        }
+        result.sort((a, b) => a - b);
+        return limit ? result.slice(0, limit) : result;
+    }
+
+    return { fold, load, query };
+})();
+
+window.CatalogSearch = CatalogSearch;
@@ -2,11 +2,17 @@
 """
 Script para expandir posts do blog para mínimo de 600 palavras
 Gera conteúdo técnico específico baseado no título e tema
+
+Roda da raiz do repositório (usa html_rewriter.py):
+    python -m blog.expand_posts
 """
 
 import os
 import re
-from bs4 import BeautifulSoup
+
+from html_rewriter import parse_html
+
+BLOG_DIR = os.path.dirname(os.path.abspath(__file__))
 
 def generate_detailed_content(title, description, category):
     """Gera conteúdo técnico detalhado baseado no tema"""
@@ -341,18 +347,18 @@ jobs:
 
 def expand_html_file(filename):
     """Expande um arquivo HTML com conteúdo completo"""
-    filepath = filename
+    filepath = os.path.join(BLOG_DIR, filename)
     
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        soup = BeautifulSoup(content, 'html.parser')
+        doc = parse_html(content)
         
         # Extrair informações
-        title = soup.find('h1')
-        description = soup.find('p', class_=None)  # primeiro p
-        category_badge = soup.find('span', class_='inline-block')
+        title = doc.find('h1')
+        description = doc.find('p')  # primeiro p
+        category_badge = doc.find('span', class_='inline-block')
         
         if title and description and category_badge:
             title_text = title.get_text()
@@ -363,20 +369,17 @@ def expand_html_file(filename):
             new_content = generate_detailed_content(title_text, desc_text, category)
             
             # Encontrar o div.prose e substituir seu conteúdo
-            prose_div = soup.find('div', class_='prose')
+            prose_div = doc.find('div', class_='prose')
             if prose_div:
                 # Limpar conteúdo existente (manter apenas estrutura)
                 prose_div.clear()
                 
                 # Adicionar novo conteúdo
-                from bs4 import BeautifulSoup as BS
-                new_soup = BS(new_content, 'html.parser')
-                for element in new_soup:
-                    prose_div.append(element)
+                prose_div.append_html(new_content)
                 
                 # Salvar arquivo atualizado
                 with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(str(soup.prettify()))
+                    f.write(doc.serialize())
                 
                 return True, title_text
         
@@ -388,7 +391,7 @@ def expand_html_file(filename):
 # Main execution
 if __name__ == "__main__":
     # Ler lista de posts curtos
-    with open('short_posts.txt', 'r') as f:
+    with open(os.path.join(BLOG_DIR, 'short_posts.txt'), 'r') as f:
         short_posts = [line.strip() for line in f.readlines()]
     
     print(f"🚀 Expandindo {len(short_posts)} posts...\n")
@@ -2,19 +2,26 @@
 """
 Script para atualizar automaticamente os filtros de categoria do blog
 Analisa os badges dos posts e cria botões de filtro dinamicamente
+
+Roda da raiz do repositório (usa html_rewriter.py):
+    python -m blog.update_filters
 """
 
+import os
 import re
-from bs4 import BeautifulSoup
 from collections import Counter
 
+from html_rewriter import parse_html
+
+BLOG_INDEX = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'index.html')
+
 def extract_categories():
     """Extrai todas as categorias dos posts"""
-    with open('index.html', 'r', encoding='utf-8') as f:
+    with open(BLOG_INDEX, 'r', encoding='utf-8') as f:
         content = f.read()
     
-    soup = BeautifulSoup(content, 'html.parser')
-    articles = soup.find_all('article')
+    doc = parse_html(content)
+    articles = doc.find_all('article')
     
     categories = []
     for article in articles:
@@ -146,7 +153,7 @@ def update_index_html():
     filter_script = generate_filter_script(category_map)
     
     # Ler arquivo atual
-    with open('index.html', 'r', encoding='utf-8') as f:
+    with open(BLOG_INDEX, 'r', encoding='utf-8') as f:
         content = f.read()
     
     # Substituir botões de filtro
@@ -160,7 +167,7 @@ def update_index_html():
     content = re.sub(pattern, replacement, content, flags=re.DOTALL)
     
     # Salvar arquivo atualizado
-    with open('index.html', 'w', encoding='utf-8') as f:
+    with open(BLOG_INDEX, 'w', encoding='utf-8') as f:
         f.write(content)
     
     print("\n✅ index.html atualizado com sucesso!")
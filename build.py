@@ -1,14 +1,41 @@
-import csv
+import argparse
 import os
 import json
 from datetime import datetime
 import hashlib
 
+import catalogue as catalogue_model  # 'catalogue' é o nome das variáveis locais
+import html_slots
+import page_enrichment
+import search_index
+import shared_assets
+import template_engine
+from template_engine import compile_template
+from page_enrichment import AVAILABLE_PLUGINS, enrich_page, load_plugins, plugins_signature
+from build_pool import map_chunks, resolve_jobs
+from catalogue import CatalogueError, load_catalogue, split_steps
+from output_writer import WriteStats, write_if_changed
+from search_index import build_search_index, dump_search_index
+from shared_assets import ASSETS_DIR as SHARED_ASSETS_DIR, SharedAssets, sample_rows
+from site_manifest import load_site_manifest
+
 # ==================== CONFIGURAÇÕES ====================
 CSV_FILE = 'automacoes_db.csv'
 TEMPLATE_FILE = 'template_page.html'
 OUTPUT_DIR = 'integracoes'
 MAIN_INDEX = 'index.html'
+MANIFEST_FILE = 'build_manifest.json'
+MANIFEST_VERSION = 1
+
+# Índice do diretório: cards por página e payload de busca carregado sob demanda
+INDEX_PAGE_SIZE = 100
+SEARCH_INDEX_FILE = 'search-index.json'
+
+# Placeholders preenchidos pelo gerador (não vêm direto de colunas do CSV)
+COMPUTED_FIELDS = ('tags_html', 'lista_passos', 'json_steps')
+
+# Enriquecimentos aplicados no render (ver page_enrichment.py)
+DEFAULT_PLUGINS = AVAILABLE_PLUGINS
 
 # Emoji map para categorias
 EMOJI_MAP = {
@@ -61,26 +88,17 @@ def create_steps_html(steps_str):
     """Cria lista de passos em HTML"""
     if not steps_str:
         return "<li>Importe o JSON e configure as credenciais.</li>"
-    steps = steps_str.split('|')
     html = ""
-    for i, step in enumerate(steps, 1):
-        step = step.strip()
-        if step:
-            html += f'<li class="mb-3 flex gap-3"><span class="flex-shrink-0 flex items-center justify-center h-6 w-6 rounded-full bg-indigo-100 text-indigo-700 text-sm font-bold">{i}</span><span>{step}</span></li>'
+    for i, step in enumerate(split_steps(steps_str), 1):
+        html += f'<li class="mb-3 flex gap-3"><span class="flex-shrink-0 flex items-center justify-center h-6 w-6 rounded-full bg-indigo-100 text-indigo-700 text-sm font-bold">{i}</span><span>{step}</span></li>'
     return html
 
 def create_json_steps(steps_str):
-    """Gera steps para Schema.org JSON-LD"""
-    if not steps_str:
-        return ""
-    steps = steps_str.split('|')
+    """Gera steps para Schema.org JSON-LD (texto escapado com json.dumps)"""
     json_steps = []
-    for step in steps:
-        step = step.strip()
-        if step:
-            # Escapar aspas para JSON
-            step_escaped = step.replace('"', '\\"')
-            json_steps.append(f'{{"@type": "HowToStep", "text": "{step_escaped}"}}')
+    for step in split_steps(steps_str):
+        step_json = json.dumps({"@type": "HowToStep", "text": step}, ensure_ascii=False)
+        json_steps.append(step_json.replace('</', '<\\/'))
     return ",\n".join(json_steps)
 
 def slugify(text):
@@ -91,32 +109,139 @@ def sanitize_html(text):
     """Remove caracteres perigosos"""
     return text.replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
 
+# ==================== MANIFESTO DE BUILD ====================
+
+def hash_text(text):
+    """Retorna o SHA-256 (hex) de um texto"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def hash_row(row):
+    """Hash estável de uma linha do CSV (independe da ordem das colunas)"""
+    return hash_text(json.dumps(dict(row), sort_keys=True, ensure_ascii=False))
+
+def get_generator_hash():
+    """Hash do código do gerador: mudanças nele invalidam o manifesto
+
+    Inclui todo módulo que muda o HTML gerado: o template compilado, os
+    plugins (e os slots que eles preenchem), os assets compartilhados, o
+    modelo de linha/split_steps do catálogo e o índice de busca.
+    """
+    sources = []
+    for path in (__file__, template_engine.__file__, page_enrichment.__file__, html_slots.__file__,
+                 shared_assets.__file__, catalogue_model.__file__, search_index.__file__):
+        with open(path, 'r', encoding='utf-8') as f:
+            sources.append(f.read())
+    return hash_text('\n'.join(sources))
+
+def load_manifest():
+    """Carrega o manifesto do último build (ou um manifesto vazio)"""
+    try:
+        with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {'pages': {}}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {'pages': {}}
+    return manifest
+
+def save_manifest(pages, template_hash, generator_hash, plugins='', assets=()):
+    """Grava o manifesto com row hash + template hash + output hash por slug"""
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'template_hash': template_hash,
+        'generator_hash': generator_hash,
+        'plugins': plugins,
+        'shared_assets': list(assets),
+        'pages': pages,
+    }
+    write_if_changed(MANIFEST_FILE, json.dumps(manifest, indent=1, ensure_ascii=False, sort_keys=True))
+
+def remove_stale_pages(previous_pages, current_slugs):
+    """Remove páginas geradas anteriormente cujo slug saiu do CSV"""
+    removed = []
+    for slug in sorted(set(previous_pages) - current_slugs):
+        filepath = os.path.join(OUTPUT_DIR, f"{slug}.html")
+        if os.path.exists(filepath):
+            os.remove(filepath)
+        removed.append(slug)
+        print(f"🗑️  Removido: {slug}.html")
+    return removed
+
+def remove_stale_assets(previous_names, current_names):
+    """Remove assets compartilhados do build anterior que não são mais usados"""
+    for name in sorted(set(previous_names) - set(current_names)):
+        filepath = os.path.join(SHARED_ASSETS_DIR, name)
+        if os.path.exists(filepath):
+            os.remove(filepath)
+            print(f"🗑️  Removido: {filepath}")
+
+def index_page_filename(page_number):
+    """Nome do arquivo de uma página do índice paginado (página 1 = index.html)"""
+    return 'index.html' if page_number == 1 else f'pagina-{page_number}.html'
+
+def build_search_docs(templates):
+    """Documentos do índice de busca (ver search_index.py)"""
+    docs = []
+    for t in templates:
+        docs.append({
+            'file': t['slug'],
+            'name': t['titulo'],
+            'label': f"{get_emoji(t['tags'])} {t['software_a']} → {t['software_b']}",
+            'keywords': [tag.strip() for tag in t['tags'].split(',')] + [t['software_a'], t['software_b']],
+        })
+    return docs
+
+def render_pagination_nav(page_number, page_count):
+    """Navegação entre páginas do índice"""
+    if page_count <= 1:
+        return ''
+    links = []
+    if page_number > 1:
+        links.append(f'<a href="{index_page_filename(page_number - 1)}" rel="prev" class="px-3 py-2 rounded-lg border border-slate-300 bg-white hover:border-indigo-400">← Anterior</a>')
+    for number in range(1, page_count + 1):
+        if number == page_number:
+            links.append(f'<span class="px-3 py-2 rounded-lg bg-indigo-600 text-white font-medium">{number}</span>')
+        elif number in (1, page_count) or abs(number - page_number) <= 2:
+            links.append(f'<a href="{index_page_filename(number)}" class="px-3 py-2 rounded-lg border border-slate-300 bg-white hover:border-indigo-400">{number}</a>')
+        elif abs(number - page_number) == 3:
+            links.append('<span class="px-2 py-2 text-slate-400">…</span>')
+    if page_number < page_count:
+        links.append(f'<a href="{index_page_filename(page_number + 1)}" rel="next" class="px-3 py-2 rounded-lg border border-slate-300 bg-white hover:border-indigo-400">Próxima →</a>')
+    return ('        <nav id="pagination" class="flex flex-wrap items-center justify-center gap-2 mt-10 text-sm" aria-label="Paginação">\n            '
+            + '\n            '.join(links) + '\n        </nav>\n')
+
 # ==================== GERAÇÃO DE ÍNDICE ====================
 
-def generate_index_page(templates):
-    """Gera index.html otimizado com busca e filtros"""
-    
-    # Criar dados para filtro JavaScript
-    templates_json = json.dumps(templates)
-    
-    index_content = f'''<!DOCTYPE html>
+def render_index_page(page_templates, page_number, page_count, total):
+    """Renderiza uma página do índice paginado"""
+    filename = '' if page_number == 1 else index_page_filename(page_number)
+    title_suffix = f' - Página {page_number}' if page_number > 1 else ''
+    pagination_links = ''
+    if page_number > 1:
+        pagination_links += f'    <link rel="prev" href="{index_page_filename(page_number - 1)}">\n'
+    if page_number < page_count:
+        pagination_links += f'    <link rel="next" href="{index_page_filename(page_number + 1)}">\n'
+
+    # Partes do documento, unidas uma única vez no final
+    parts = [f'''<!DOCTYPE html>
 <html lang="pt-BR" itemscope itemtype="http://schema.org/CollectionPage">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     
     <!-- SEO -->
-    <title>Guias Completos de Integrações N8N | {len(templates)}+ Tutoriais Passo a Passo | AI Factory</title>
-    <meta name="description" content="{len(templates)}+ guias passo a passo sobre como integrar ferramentas populares com N8N. Tutoriais com exemplos práticos e templates JSON.">
+    <title>Guias Completos de Integrações N8N | {total}+ Tutoriais Passo a Passo{title_suffix} | AI Factory</title>
+    <meta name="description" content="{total}+ guias passo a passo sobre como integrar ferramentas populares com N8N. Tutoriais com exemplos práticos e templates JSON.">
     <meta name="keywords" content="n8n, integrações, automação, workflow, tutorial, guia">
     <meta name="author" content="AI Factory">
-    <link rel="canonical" href="https://felipejac.github.io/fabrica-n8n/integracoes/">
+    <link rel="canonical" href="https://felipejac.github.io/fabrica-n8n/integracoes/{filename}">
+{pagination_links}
     
     <!-- Open Graph -->
     <meta property="og:title" content="Guias Completos de Integrações N8N">
-    <meta property="og:description" content="{len(templates)}+ guias passo a passo sobre como integrar ferramentas populares com N8N.">
+    <meta property="og:description" content="{total}+ guias passo a passo sobre como integrar ferramentas populares com N8N.">
     <meta property="og:type" content="website">
-    <meta property="og:url" content="https://felipejac.github.io/fabrica-n8n/integracoes/">
+    <meta property="og:url" content="https://felipejac.github.io/fabrica-n8n/integracoes/{filename}">
     
     <!-- Tailwind CSS -->
     <script src="https://cdn.tailwindcss.com"></script>
@@ -142,7 +267,7 @@ def generate_index_page(templates):
                 <nav class="flex items-center gap-4">
                     <a href="../index.html" class="text-sm text-slate-600 hover:text-indigo-600 transition-colors">← Voltar</a>
                     <span class="text-slate-300">|</span>
-                    <span class="text-sm font-medium text-indigo-600">Integrações ({len(templates)})</span>
+                    <span class="text-sm font-medium text-indigo-600">Integrações ({total})</span>
                 </nav>
             </div>
         </div>
@@ -153,10 +278,10 @@ def generate_index_page(templates):
         <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 text-center">
             <h1 class="text-4xl font-bold mb-4">Guias de Integrações N8N</h1>
             <p class="text-lg text-slate-300 max-w-2xl mx-auto mb-6">
-                {len(templates)}+ tutoriais passo a passo para conectar suas ferramentas favoritas.
+                {total}+ tutoriais passo a passo para conectar suas ferramentas favoritas.
             </p>
             <div class="flex items-center justify-center gap-4 text-sm">
-                <span class="bg-indigo-600/20 text-indigo-200 px-3 py-1 rounded-full">📚 {len(templates)}+ Guias</span>
+                <span class="bg-indigo-600/20 text-indigo-200 px-3 py-1 rounded-full">📚 {total}+ Guias</span>
                 <span class="bg-green-600/20 text-green-200 px-3 py-1 rounded-full">✅ 100% Gratuito</span>
                 <span class="bg-purple-600/20 text-purple-200 px-3 py-1 rounded-full">🎯 Passo a Passo</span>
             </div>
@@ -169,7 +294,8 @@ def generate_index_page(templates):
             <input 
                 type="text" 
                 id="searchInput" 
-                onkeyup="filterCards()" 
+                oninput="filterCards()" 
+                onfocus="loadSearchData()" 
                 placeholder="Buscar integração (ex: WordPress, Shopify)..." 
                 class="w-full px-4 py-3 rounded-lg border border-slate-300 focus:ring-2 focus:ring-indigo-500 focus:outline-none shadow-sm"
             >
@@ -179,24 +305,29 @@ def generate_index_page(templates):
     <!-- Grid de Integrações -->
     <main class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 pb-12">
         <div class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6" id="integrationsGrid">
-'''
+''']
     
     # Adicionar cards
-    for t in templates:
+    for t in page_templates:
         emoji = get_emoji(t['tags'])
-        index_content += f'''            <a href="{t['slug']}" class="integration-card block bg-white p-6 rounded-xl shadow-sm border border-slate-200 hover:shadow-lg hover:border-indigo-300 transition-all group">
+        parts.append(f'''            <a href="{t['slug']}" class="integration-card block bg-white p-6 rounded-xl shadow-sm border border-slate-200 hover:shadow-lg hover:border-indigo-300 transition-all group">
                 <div class="text-xs uppercase font-bold text-indigo-600 mb-2">{emoji} {t['software_a']} → {t['software_b']}</div>
                 <h2 class="font-bold text-slate-900 mb-2 group-hover:text-indigo-600 transition-colors line-clamp-2">{sanitize_html(t['titulo'])}</h2>
                 <p class="text-sm text-slate-600 line-clamp-2">{sanitize_html(t['desc'])}</p>
             </a>
-'''
+''')
     
-    index_content += '''        </div>
+    parts.append('''        </div>
+
+        <!-- Resultados da busca (preenchidos a partir de search-index.json) -->
+        <div class="hidden grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6" id="searchResults"></div>
 
         <div id="noResults" class="hidden text-center py-12">
             <p class="text-slate-500 text-lg">Nenhuma integração encontrada para sua busca.</p>
         </div>
-    </main>
+''')
+    parts.append(render_pagination_nav(page_number, page_count))
+    parts.append('''    </main>
 
     <!-- Footer -->
     <footer class="bg-white border-t border-slate-200 mt-12 py-8">
@@ -206,57 +337,173 @@ def generate_index_page(templates):
         </div>
     </footer>
 
+    <script src="../assets/js/catalog-search.js"></script>
     <script>
-        // Dados das integrações para filtro
-        const integrations = '''
-    
-    # Adicionar dados para busca
-    for t in templates:
-        keywords = ','.join([tag.strip() for tag in t['tags'].split(',')] + [t['software_a'].lower(), t['software_b'].lower()])
-        index_content += f'''{{
-            name: '{sanitize_html(t["titulo"])}',
-            file: '{t["slug"]}',
-            keywords: ['{keywords.replace(",", "','")}']
-        }},
-'''
-    
-    index_content += '''        ];
+        // Índice de busca pré-construído, carregado sob demanda (cacheável, fora do HTML)
+        const MAX_RESULTS = 100;
 
-        // Função de filtro
+        function loadSearchData() {
+            return CatalogSearch.load('search-index.json');
+        }
+
+        function renderResult(item) {
+            const [file, name, label] = item;
+            const card = document.createElement('a');
+            card.href = file;
+            card.className = 'integration-card block bg-white p-6 rounded-xl shadow-sm border border-slate-200 hover:shadow-lg hover:border-indigo-300 transition-all group';
+            const header = document.createElement('div');
+            header.className = 'text-xs uppercase font-bold text-indigo-600 mb-2';
+            header.textContent = label;
+            const title = document.createElement('h2');
+            title.className = 'font-bold text-slate-900 mb-2 group-hover:text-indigo-600 transition-colors line-clamp-2';
+            title.textContent = name;
+            card.append(header, title);
+            return card;
+        }
+
+        // Função de filtro; só a busca mais recente mexe nos resultados
+        let filterTimer = null;
+        let filterRequest = 0;
         function filterCards() {
-            const searchTerm = document.getElementById('searchInput').value.toLowerCase();
-            const cards = document.querySelectorAll('.integration-card');
-            let visibleCount = 0;
-
-            cards.forEach((card, index) => {
-                const integration = integrations[index];
-                const matchesSearch = integration.name.toLowerCase().includes(searchTerm) ||
-                    integration.keywords.some(kw => kw.includes(searchTerm));
-
-                if (matchesSearch || searchTerm === '') {
-                    card.style.display = 'block';
-                    visibleCount++;
-                } else {
-                    card.style.display = 'none';
-                }
-            });
-
-            document.getElementById('noResults').classList.toggle('hidden', visibleCount > 0);
+            clearTimeout(filterTimer);
+            filterTimer = setTimeout(runFilter, 120);
+        }
+
+        async function runFilter() {
+            const request = ++filterRequest;
+            const searchTerm = document.getElementById('searchInput').value.trim().toLowerCase();
+            const grid = document.getElementById('integrationsGrid');
+            const results = document.getElementById('searchResults');
+            const pagination = document.getElementById('pagination');
+
+            if (searchTerm === '') {
+                grid.classList.remove('hidden');
+                results.classList.add('hidden');
+                if (pagination) pagination.classList.remove('hidden');
+                document.getElementById('noResults').classList.add('hidden');
+                return;
+            }
+
+            const index = await loadSearchData();
+            if (request !== filterRequest) return;
+            const matches = CatalogSearch.query(index, searchTerm, MAX_RESULTS).map(id => index.docs[id]);
+
+            results.replaceChildren(...matches.map(renderResult));
+            grid.classList.add('hidden');
+            results.classList.remove('hidden');
+            if (pagination) pagination.classList.add('hidden');
+            document.getElementById('noResults').classList.toggle('hidden', matches.length > 0);
         }
 
         window.filterCards = filterCards;
+        window.loadSearchData = loadSearchData;
     </script>
 </body>
 </html>
-'''
-    
-    with open(os.path.join(OUTPUT_DIR, 'index.html'), 'w', encoding='utf-8') as f:
-        f.write(index_content)
-    print(f"✅ Índice do diretório gerado: {len(templates)} integrações indexadas")
-
-
-def generate():
-    """Função principal de geração"""
+''')
+    return ''.join(parts)
+
+def remove_stale_index_pages(page_count, site=None):
+    """Remove páginas do índice além da última (o catálogo encolheu)"""
+    number = page_count + 1
+    while os.path.exists(os.path.join(OUTPUT_DIR, index_page_filename(number))):
+        os.remove(os.path.join(OUTPUT_DIR, index_page_filename(number)))
+        if site is not None:
+            site.remove(f"{OUTPUT_DIR}/{index_page_filename(number)}")
+        print(f"🗑️  Removido: {index_page_filename(number)}")
+        number += 1
+
+def generate_index_page(templates, stats=None, site=None):
+    """Gera o índice paginado (INDEX_PAGE_SIZE cards por página) e o índice de busca
+
+    Com site (SiteManifest), as páginas do índice são registradas no manifesto do site.
+    """
+    total = len(templates)
+    page_count = max(1, -(-total // INDEX_PAGE_SIZE))
+
+    for page_number in range(1, page_count + 1):
+        start = (page_number - 1) * INDEX_PAGE_SIZE
+        page_templates = templates[start:start + INDEX_PAGE_SIZE]
+        html = render_index_page(page_templates, page_number, page_count, total)
+        write_if_changed(os.path.join(OUTPUT_DIR, index_page_filename(page_number)), html, stats)
+        if site is not None:
+            site.record_content(f"{OUTPUT_DIR}/{index_page_filename(page_number)}", html)
+
+    remove_stale_index_pages(page_count, site)
+
+    payload = dump_search_index(build_search_index(build_search_docs(templates)))
+    write_if_changed(os.path.join(OUTPUT_DIR, SEARCH_INDEX_FILE), payload, stats)
+    print(f"✅ Índice do diretório gerado: {total} integrações em {page_count} páginas (+ {SEARCH_INDEX_FILE})")
+
+
+def render_page(template, row, plugins=(), shared=None):
+    """Renderiza a página HTML de uma linha do CSV com o template compilado
+
+    Os plugins de enriquecimento (schema, phase3, analytics) são aplicados
+    ao HTML renderizado, então a página já sai completa do build. Com
+    shared, os blocos inline comuns a todas as páginas viram referências
+    aos assets em assets/shared/ (ver shared_assets.py).
+    """
+    context = dict(row)
+    context['tags_html'] = create_tags_html(row.get('tags', ''))
+    context['lista_passos'] = create_steps_html(row.get('passos_resumo', ''))
+    context['json_steps'] = create_json_steps(row.get('passos_resumo', ''))
+    page = enrich_page(template.render(context), row, plugins)
+    return shared.apply(page) if shared else page
+
+def build_index_entry(row, filename):
+    """Metadados de uma página para o índice do diretório"""
+    return {
+        'slug': filename,
+        'titulo': row.get('titulo_pagina', 'Sem Título'),
+        'desc': row.get('descricao_curta', ''),
+        'software_a': row.get('software_a', ''),
+        'software_b': row.get('software_b', ''),
+        'tags': row.get('tags', ''),
+    }
+
+# Template compilado, plugins e assets compartilhados de cada processo do pool (ver init_render_worker)
+_worker_template = None
+_worker_plugins = ()
+_worker_shared = None
+
+def init_render_worker(template_content, plugin_names=(), measurement_id=None, shared=None):
+    """Compila o template e carrega os plugins uma vez por processo"""
+    global _worker_template, _worker_plugins, _worker_shared
+    _worker_template = compile_template(template_content)
+    _worker_plugins = load_plugins(plugin_names, measurement_id)
+    _worker_shared = shared
+
+def render_chunk(rows):
+    """Renderiza e grava um lote de (slug, linha)
+
+    Devolve a lista de (slug, arquivo, output hash, bytes, mtime_ns) e o
+    WriteStats do lote.
+    """
+    results = []
+    stats = WriteStats()
+    for slug, row in rows:
+        page = render_page(_worker_template, row, _worker_plugins, _worker_shared)
+        filename = f"{slug}.html"
+        filepath = os.path.join(OUTPUT_DIR, filename)
+        write_if_changed(filepath, page, stats)
+        results.append((slug, filename, hash_text(page), len(page.encode('utf-8')),
+                        os.stat(filepath).st_mtime_ns))
+    return results, stats
+
+def generate(incremental=False, jobs=1, plugin_names=DEFAULT_PLUGINS, measurement_id=None):
+    """Função principal de geração
+
+    Com incremental=True, só regenera as linhas cujo conteúdo (row hash),
+    template ou gerador mudaram desde o último build registrado em
+    MANIFEST_FILE. Páginas de slugs removidos do CSV são apagadas.
+
+    Com jobs > 1, as páginas são renderizadas em lotes por um pool de
+    processos; o índice continua na ordem do CSV.
+
+    plugin_names escolhe os enriquecimentos aplicados no render (ver
+    page_enrichment.py); analytics só entra com um measurement_id.
+    """
     print(f"🚀 Iniciando a fábrica de integrações otimizada...")
     print(f"📂 Pasta de saída: {OUTPUT_DIR}/")
     
@@ -268,68 +515,144 @@ def generate():
         print(f"❌ Erro: '{TEMPLATE_FILE}' não encontrado.")
         return
 
-    # 2. Ler CSV e Gerar Páginas
+    template = compile_template(template_content)
+    template_hash = hash_text(template_content)
+    generator_hash = get_generator_hash()
+    try:
+        plugins = load_plugins(plugin_names, measurement_id)
+    except ValueError as e:
+        print(f"❌ Erro: {e}")
+        return
+    plugin_signature = plugins_signature(plugins)
+    print(f"🧩 Enriquecimentos: {plugin_signature or 'nenhum'}")
+    if 'analytics' in plugin_names and not measurement_id:
+        print("ℹ️  analytics desativado: defina --measurement-id ou GA_MEASUREMENT_ID")
+    previous = load_manifest()
+    previous_pages = previous.get('pages', {})
+
+    if incremental:
+        if previous.get('generator_hash') != generator_hash:
+            print("ℹ️  Gerador alterado desde o último build: todas as páginas serão regeneradas")
+            incremental = False
+        elif previous.get('template_hash') != template_hash:
+            print("ℹ️  Template alterado desde o último build: todas as páginas serão regeneradas")
+            incremental = False
+        elif previous.get('plugins', '') != plugin_signature:
+            print("ℹ️  Enriquecimentos alterados desde o último build: todas as páginas serão regeneradas")
+            incremental = False
+        else:
+            print(f"♻️  Modo incremental: {len(previous_pages)} páginas no manifesto")
+
+    # 2. Ler CSV e decidir o que precisa ser gerado
     generated_templates = []
+    pages = {}
+    pending = {}
+    row_hashes = {}
+    write_stats = WriteStats()
     count = 0
+    skipped = 0
     start_time = datetime.now()
     
     try:
-        with open(CSV_FILE, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            
-            for row in reader:
-                # Dados básicos
-                page = template_content
-                slug = row.get('slug_url', '').strip()
-                
-                if not slug:
-                    continue
-
-                # ===== SUBSTITUIÇÕES SIMPLES =====
-                for key, value in row.items():
-                    placeholder = f"{{{{ {key} }}}}"
-                    page = page.replace(placeholder, value)
-
-                # ===== SUBSTITUIÇÕES COMPLEXAS =====
-                tags_html = create_tags_html(row.get('tags', ''))
-                page = page.replace('{{ tags_html }}', tags_html)
-
-                steps_html = create_steps_html(row.get('passos_resumo', ''))
-                page = page.replace('{{ lista_passos }}', steps_html)
-                
-                json_steps = create_json_steps(row.get('passos_resumo', ''))
-                page = page.replace('{{ json_steps }}', json_steps)
-
-                # ===== SALVAR ARQUIVO =====
-                filename = f"{slug}.html"
-                filepath = os.path.join(OUTPUT_DIR, filename)
-                
-                with open(filepath, 'w', encoding='utf-8') as out:
-                    out.write(page)
-                
-                # Guardar info para o índice
-                generated_templates.append({
-                    'slug': filename,
-                    'titulo': row.get('titulo_pagina', 'Sem Título'),
-                    'desc': row.get('descricao_curta', ''),
-                    'software_a': row.get('software_a', ''),
-                    'software_b': row.get('software_b', ''),
-                    'tags': row.get('tags', ''),
-                })
-                
-                print(f"📄 Gerado: {filename}")
-                count += 1
-
+        catalogue = load_catalogue(CSV_FILE)
     except FileNotFoundError:
         print(f"❌ Erro: '{CSV_FILE}' não encontrado.")
         return
+    except CatalogueError as e:
+        print(f"❌ Erro: {e}")
+        return
 
-    # 3. Gerar Índice do diretório
-    generate_index_page(generated_templates)
+    # Placeholders que nenhuma coluna do CSV preenche
+    unknown = template.unknown_placeholders(catalogue.fieldnames + list(COMPUTED_FIELDS))
+    if unknown:
+        print(f"⚠️  Placeholders sem valor no template: {', '.join(unknown)}")
+
+    # Blocos inline comuns a todas as páginas -> assets/shared/<hash>.css|js
+    sample = sample_rows(row for row in catalogue if (row.get('slug_url') or '').strip())
+    shared = SharedAssets.detect([render_page(template, row, plugins) for row in sample])
+    shared.write(stats=write_stats)
+    if shared:
+        print(f"📦 Assets compartilhados: {', '.join(shared.names)} "
+              f"(-{shared.saved_bytes() / 1024:.1f}KB por página)")
+    if incremental and previous.get('shared_assets', []) != shared.names:
+        print("ℹ️  Assets compartilhados alterados desde o último build: todas as páginas serão regeneradas")
+        incremental = False
+    remove_stale_assets(previous.get('shared_assets', []), shared.names)
+
+    without_slug = 0
+    for row in catalogue:
+        # Dados básicos
+        slug = (row.get('slug_url') or '').strip()
+        
+        if not slug:
+            without_slug += 1
+            continue
+
+        filename = f"{slug}.html"
+        filepath = os.path.join(OUTPUT_DIR, filename)
+        row_hash = hash_row(row)
+
+        # Guardar info para o índice
+        generated_templates.append(build_index_entry(row, filename))
+
+        # ===== PULAR LINHAS INALTERADAS =====
+        entry = previous_pages.get(slug)
+        if (incremental and entry
+                and entry.get('row_hash') == row_hash
+                and entry.get('template_hash') == template_hash
+                and os.path.exists(filepath)):
+            pages[slug] = entry
+            skipped += 1
+            continue
+
+        # Slug repetido: vale a última linha, como na geração sequencial
+        pending[slug] = row
+        row_hashes[slug] = row_hash
+
+    if without_slug:
+        print(f"⚠️  {without_slug} linhas sem slug_url ignoradas (detalhes: python validate_catalogue.py {CSV_FILE})")
+
+    # Manifesto do site (integracoes/ só é listado na primeira vez)
+    site = load_site_manifest('.')
+    site.ensure_section(OUTPUT_DIR)
+
+    # 3. Renderizar e salvar (em lotes, opcionalmente em paralelo)
+    if jobs > 1:
+        print(f"⚙️  Gerando {len(pending)} páginas com {jobs} processos...")
+
+    chunks = map_chunks(render_chunk, list(pending.items()), jobs,
+                        initializer=init_render_worker,
+                        initargs=(template_content, tuple(plugin_names), measurement_id, shared))
+    for chunk_number, (results, chunk_stats) in enumerate(chunks, 1):
+        write_stats.add(chunk_stats)
+        for slug, filename, output_hash, size, mtime_ns in results:
+            site.record(f"{OUTPUT_DIR}/{filename}", size, output_hash, mtime_ns)
+            pages[slug] = {
+                'row_hash': row_hashes[slug],
+                'template_hash': template_hash,
+                'output_hash': output_hash,
+            }
+            if jobs == 1:
+                print(f"📄 Gerado: {filename}")
+            count += 1
+        if jobs > 1:
+            print(f"📦 Lote {chunk_number}: {len(results)} páginas")
+
+    # 4. Remover páginas de slugs que saíram do CSV
+    removed = remove_stale_pages(previous_pages, set(pages))
+    for slug in removed:
+        site.remove(f"{OUTPUT_DIR}/{slug}.html")
 
-    # 4. Atualizar menu do index.html principal (OPCIONAL)
+    # 5. Gerar Índice do diretório
+    generate_index_page(generated_templates, write_stats, site)
+
+    # 6. Atualizar menu do index.html principal (OPCIONAL)
     update_main_index(generated_templates)
 
+    # 7. Registrar manifestos (build incremental e páginas do site)
+    save_manifest(pages, template_hash, generator_hash, plugin_signature, shared.names)
+    site.save()
+
     # ===== ESTATÍSTICAS =====
     elapsed_time = (datetime.now() - start_time).total_seconds()
     avg_time = (elapsed_time / count * 1000) if count > 0 else 0
@@ -339,10 +662,15 @@ def generate():
     print(f"{'='*60}")
     print(f"📊 Estatísticas:")
     print(f"   • Páginas geradas: {count}")
+    print(f"   • Páginas inalteradas (puladas): {skipped}")
+    print(f"   • Páginas removidas: {len(removed)}")
     print(f"   • Tempo total: {elapsed_time:.2f}s")
     print(f"   • Tempo por página: {avg_time:.2f}ms")
-    print(f"   • Taxa: {count/elapsed_time:.0f} páginas/segundo")
+    print(f"   • Taxa: {count/elapsed_time:.0f} páginas/segundo" if elapsed_time > 0 else "   • Taxa: -")
+    print(f"   • Arquivos: {write_stats.summary()}")
+    print(f"   • Processos: {jobs}")
     print(f"   • Pasta: {OUTPUT_DIR}/")
+    print(f"   • Manifesto: {MANIFEST_FILE}")
     print(f"{'='*60}\n")
 
 def update_main_index(templates):
@@ -359,12 +687,23 @@ def update_main_index(templates):
                 f'<!-- INTEGRATIONS_COUNT: {len(templates)} -->\n                <button onclick="switchView(\'integrations\')" id="nav-integrations"'
             )
             
-            with open(MAIN_INDEX, 'w', encoding='utf-8') as f:
-                f.write(main_content)
+            write_if_changed(MAIN_INDEX, main_content)
             
             print(f"✅ Index.html principal atualizado com {len(templates)} integrações")
     except Exception as e:
         print(f"⚠️  Aviso ao atualizar index.html: {e}")
 
 if __name__ == "__main__":
-    generate()
+    parser = argparse.ArgumentParser(description='Gera as páginas de integração N8N a partir do CSV')
+    parser.add_argument('--incremental', action='store_true',
+                        help=f'Regenera apenas linhas alteradas desde o último build ({MANIFEST_FILE})')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Número de processos para renderizar as páginas (0 = todos os núcleos)')
+    parser.add_argument('--plugins', nargs='*', choices=AVAILABLE_PLUGINS, default=list(DEFAULT_PLUGINS),
+                        help='Enriquecimentos aplicados no render (padrão: todos; sem valores = nenhum)')
+    parser.add_argument('--measurement-id', default=os.environ.get('GA_MEASUREMENT_ID'),
+                        help='GA4 Measurement ID para o plugin analytics (padrão: $GA_MEASUREMENT_ID)')
+    args = parser.parse_args()
+
+    generate(incremental=args.incremental, jobs=resolve_jobs(args.jobs),
+             plugin_names=args.plugins, measurement_id=args.measurement_id)
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Pipeline único de build do site
+
+Modela cada gerador/pós-processador como um estágio com entradas, saídas e
+dependências declaradas, roda estágios independentes em paralelo, pula os
+que não têm entradas alteradas e imprime uma tabela de tempos por estágio.
+
+Um estágio roda quando:
+    • as entradas declaradas (arquivos de origem + o próprio script) mudaram
+      desde a última execução bem-sucedida (.build_pipeline_state.json),
+    • alguma saída declarada não existe, ou
+    • algum estágio do qual ele depende (direta ou indiretamente) rodou
+      nesta execução — inclusive através de um estágio pulado por falta
+      de configuração.
+
+Uso:
+    python build_pipeline.py                  # pipeline completo
+    python build_pipeline.py --jobs 8         # até 8 processos por estágio de render
+    python build_pipeline.py --only sitemaps  # apenas um estágio (e o que ele precisa)
+    python build_pipeline.py --force          # ignora o estado salvo
+    python build_pipeline.py --list           # mostra o DAG
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+STATE_FILE = BASE_DIR / '.build_pipeline_state.json'
+
+
+class Stage:
+    """Um passo do pipeline"""
+
+    def __init__(self, name, command, inputs=(), outputs=(), after=(), env=(), optional=False, description=''):
+        self.name = name
+        self.command = command          # lista de argumentos (sem o interpretador)
+        self.inputs = list(inputs)      # arquivos de origem
+        self.outputs = list(outputs)    # arquivos que precisam existir depois
+        self.after = list(after)        # estágios que precisam terminar antes
+        self.env = list(env)            # variáveis de ambiente obrigatórias
+        self.optional = optional        # só roda quando pedido explicitamente
+        self.description = description
+
+    @property
+    def script(self):
+        return self.command[0]
+
+    def missing_env(self):
+        return [name for name in self.env if not os.environ.get(name)]
+
+
+def build_stages(jobs):
+    """Define o DAG de estágios do site"""
+    jobs_arg = ['--jobs', str(jobs)]
+    return [
+        Stage('templates', ['generate_templates_10k.py'],
+              outputs=['automacoes_db.csv'], optional=True,
+              description='Expande o catálogo N8N (automacoes_db.csv)'),
+        Stage('validate', ['validate_catalogue.py'],
+              inputs=['automacoes_db.csv', 'automacoes_db.parquet', 'catalogue.py'], after=['templates'],
+              description='Valida o catálogo N8N (rejeições em automacoes_db_rejects.csv)'),
+        Stage('build', ['build.py', '--incremental'] + jobs_arg,
+              inputs=['automacoes_db.csv', 'automacoes_db.parquet', 'template_page.html', 'template_engine.py',
+                      'catalogue.py', 'page_enrichment.py', 'html_slots.py', 'shared_assets.py', 'build_pool.py',
+                      'output_writer.py', 'search_index.py'],
+              outputs=['integracoes/index.html'], after=['templates', 'validate'],
+              description='Páginas de integração N8N (já com schema, Phase 3 e GA4)'),
+        # depois do build: os dois regravam site_manifest.json
+        Stage('build_zapier', ['build_zapier.py'] + jobs_arg,
+              inputs=['automacoes_zapier_db.csv', 'template_engine.py', 'catalogue.py', 'shared_assets.py',
+                      'build_pool.py', 'output_writer.py', 'search_index.py'],
+              outputs=['integracoes-zapier/index.html'], after=['build'],
+              description='Páginas de templates Zapier'),
+        Stage('categories', ['generate_category_pages.py'],
+              inputs=['automacoes_db.csv', 'automacoes_db.parquet'],
+              outputs=['integracoes/crm/index.html'], after=['templates'],
+              description='Índices por categoria'),
+        Stage('site_manifest', ['site_manifest.py', '--refresh', '.', 'blog'],
+              inputs=['blog'], outputs=['site_manifest.json'], after=['build', 'build_zapier', 'categories'],
+              description='Manifesto das páginas (raiz e blog/; integrações vêm do build)'),
+        Stage('analytics', ['integrate_google_analytics.py', '--measurement-id', '$GA_MEASUREMENT_ID'],
+              after=['site_manifest'], env=['GA_MEASUREMENT_ID'],
+              description='Snippet GA4 nas páginas fora de integracoes/'),
+        Stage('sitemaps', ['generate_sitemaps.py'],
+              inputs=['automacoes_db.csv', 'automacoes_db.parquet', 'automacoes_zapier_db.csv'],
+              outputs=['sitemap-index.xml'], after=['site_manifest'],
+              description='Sitemaps segmentados'),
+        Stage('llm_endpoint', ['update_llm_endpoint.py'],
+              inputs=['automacoes_db.csv', 'automacoes_db.parquet', 'automacoes_zapier_db.csv'],
+              outputs=['llm.html'], after=['site_manifest'],
+              description='Estatísticas do /llm'),
+        Stage('i18n', ['i18n_service.py', '--all', '--incremental', '--languages', 'en'] + jobs_arg,
+              inputs=['i18n_service.py'],
+              outputs=['translated/manifest.json'], after=['analytics'],
+              description='Traduções em translated/'),
+    ]
+
+
+# ==================== ESTADO ====================
+
+def fingerprint(stage):
+    """Assinatura das entradas de um estágio (comando + tamanho/mtime do script e entradas)"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps(stage.command).encode('utf-8'))
+    for name in [stage.script] + stage.inputs:
+        path = BASE_DIR / name
+        try:
+            info = path.stat()
+        except FileNotFoundError:
+            digest.update(f'{name}:missing'.encode('utf-8'))
+            continue
+        digest.update(f'{name}:{info.st_size}:{info.st_mtime_ns}'.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def load_state():
+    try:
+        with open(STATE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_state(state):
+    with open(STATE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+
+
+# ==================== EXECUÇÃO ====================
+
+def select_stages(stages, only, include_optional):
+    """Filtra os estágios pedidos (com --only, inclui as dependências)"""
+    by_name = {stage.name: stage for stage in stages}
+    if only:
+        unknown = [name for name in only if name not in by_name]
+        if unknown:
+            raise SystemExit(f"❌ Estágio desconhecido: {', '.join(unknown)}")
+        selected = set()
+        pending = list(only)
+        while pending:
+            name = pending.pop()
+            if name in selected:
+                continue
+            selected.add(name)
+            pending.extend(dep for dep in by_name[name].after if not by_name[dep].optional or dep in only)
+        return [stage for stage in stages if stage.name in selected]
+    return [stage for stage in stages if include_optional or not stage.optional]
+
+
+def run_stage(stage, log_dir):
+    """Executa o script do estágio; a saída vai para um log por estágio"""
+    command = [sys.executable] + [os.path.expandvars(arg) for arg in stage.command]
+    log_path = log_dir / f'{stage.name}.log'
+    start = time.perf_counter()
+    with open(log_path, 'w', encoding='utf-8') as log:
+        result = subprocess.run(command, cwd=BASE_DIR, stdout=log, stderr=subprocess.STDOUT)
+    return result.returncode, time.perf_counter() - start, log_path
+
+
+def run_pipeline(stages, workers, force=False, dry_run=False):
+    """Roda o DAG; devolve a lista de (estágio, status, segundos)"""
+    state = {} if force else load_state()
+    names = {stage.name for stage in stages}
+    deps = {stage.name: [dep for dep in stage.after if dep in names] for stage in stages}
+    log_dir = BASE_DIR / '.build_logs'
+    log_dir.mkdir(exist_ok=True)
+
+    status = {}
+    timings = {}
+    changed = set()    # estágios que rodaram ou têm um ancestral que rodou
+    remaining = {stage.name: stage for stage in stages}
+    running = {}
+
+    def ready(stage):
+        return all(dep in status for dep in deps[stage.name])
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while remaining or running:
+            for name, stage in list(remaining.items()):
+                if not ready(stage):
+                    continue
+                del remaining[name]
+
+                if any(status[dep] == 'falhou' for dep in deps[name]):
+                    status[name] = 'falhou'
+                    timings[name] = 0.0
+                    print(f"⛔ {name}: dependência falhou")
+                    continue
+                upstream_ran = any(dep in changed for dep in deps[name])
+                if stage.missing_env():
+                    # não roda, mas repassa a mudança: os dependentes ainda
+                    # precisam rodar se algo antes dele rodou
+                    if upstream_ran:
+                        changed.add(name)
+                    status[name] = 'não configurado'
+                    timings[name] = 0.0
+                    print(f"⚙️  {name}: defina {', '.join(stage.missing_env())} para habilitar")
+                    continue
+
+                current = fingerprint(stage)
+                outputs_ok = all((BASE_DIR / out).exists() for out in stage.outputs)
+                if state.get(name) == current and outputs_ok and not upstream_ran:
+                    status[name] = 'inalterado'
+                    timings[name] = 0.0
+                    print(f"⏭️  {name}: entradas inalteradas")
+                    continue
+
+                if dry_run:
+                    status[name] = 'rodaria'
+                    timings[name] = 0.0
+                    changed.add(name)
+                    print(f"🔍 {name}: rodaria ({' '.join(stage.command)})")
+                    continue
+
+                print(f"▶️  {name}: {' '.join(stage.command)}")
+                running[executor.submit(run_stage, stage, log_dir)] = (stage, current)
+
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, current = running.pop(future)
+                returncode, elapsed, log_path = future.result()
+                timings[stage.name] = elapsed
+                changed.add(stage.name)
+                if returncode == 0:
+                    status[stage.name] = 'ok'
+                    state[stage.name] = fingerprint(stage)
+                    print(f"✅ {stage.name}: {elapsed:.1f}s")
+                else:
+                    status[stage.name] = 'falhou'
+                    state.pop(stage.name, None)
+                    print(f"❌ {stage.name}: código {returncode} (ver {log_path.relative_to(BASE_DIR)})")
+
+    if not dry_run:
+        save_state(state)
+    return [(stage, status[stage.name], timings[stage.name]) for stage in stages]
+
+
+def print_timing_table(results, total_elapsed):
+    """Tabela final com status e tempo de cada estágio"""
+    print(f"\n{'='*60}")
+    print(f"{'Estágio':<16}{'Status':<18}{'Tempo':>10}")
+    print(f"{'-'*60}")
+    for stage, stage_status, elapsed in results:
+        print(f"{stage.name:<16}{stage_status:<18}{elapsed:>9.1f}s")
+    print(f"{'-'*60}")
+    useful = sum(elapsed for _, _, elapsed in results)
+    print(f"{'Soma dos estágios':<34}{useful:>9.1f}s")
+    print(f"{'Tempo total (parede)':<34}{total_elapsed:>9.1f}s")
+    print(f"{'='*60}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pipeline completo de build do site')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Processos usados pelos estágios de render (build.py / build_zapier.py)')
+    parser.add_argument('--parallel', type=int, default=3, help='Estágios rodando ao mesmo tempo')
+    parser.add_argument('--only', nargs='+', help='Rodar apenas estes estágios (e suas dependências)')
+    parser.add_argument('--expand', action='store_true', help='Incluir a expansão do catálogo (generate_templates_10k.py)')
+    parser.add_argument('--force', action='store_true', help='Ignorar o estado salvo e rodar tudo')
+    parser.add_argument('--dry-run', action='store_true', help='Mostrar o que rodaria sem executar')
+    parser.add_argument('--list', action='store_true', help='Listar estágios e dependências')
+    args = parser.parse_args()
+
+    stages = select_stages(build_stages(args.jobs), args.only, args.expand)
+
+    if args.list:
+        for stage in stages:
+            after = f" (depois de: {', '.join(stage.after)})" if stage.after else ''
+            print(f"• {stage.name:<14} {stage.description}{after}")
+        return
+
+    print("🏭 Pipeline de build")
+    print(f"   Estágios: {', '.join(stage.name for stage in stages)}\n")
+    start = time.perf_counter()
+    results = run_pipeline(stages, args.parallel, force=args.force, dry_run=args.dry_run)
+    print_timing_table(results, time.perf_counter() - start)
+
+    if any(stage_status == 'falhou' for _, stage_status, _ in results):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Geração paralela de páginas para build.py e build_zapier.py
+
+As linhas do CSV são divididas em lotes (chunks) contíguos, processados em
+um pool de processos. Os resultados voltam na mesma ordem do CSV, então o
+índice gerado depois é idêntico ao da geração sequencial.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_CHUNK_SIZE = 250
+
+
+def resolve_jobs(jobs):
+    """Converte o valor de --jobs em número de processos (0 = todos os núcleos)"""
+    if jobs is None or jobs < 1:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def chunked(items, size):
+    """Divide uma lista em lotes contíguos de até size itens"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def map_chunks(func, items, jobs=1, chunk_size=DEFAULT_CHUNK_SIZE, initializer=None, initargs=()):
+    """Aplica func a cada lote e devolve os resultados na ordem original
+
+    Com jobs=1 tudo roda no processo atual (sem custo de pool). func e
+    initializer precisam ser funções de módulo para poderem ser serializadas.
+    """
+    chunks = list(chunked(items, chunk_size))
+
+    if jobs <= 1 or len(chunks) <= 1:
+        if initializer:
+            initializer(*initargs)
+        for chunk in chunks:
+            yield func(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(chunks)),
+                             initializer=initializer, initargs=initargs) as executor:
+        yield from executor.map(func, chunks)
@@ -1,14 +1,26 @@
-import csv
+import argparse
 import os
 import json
 from datetime import datetime
 import hashlib
 
+from template_engine import compile_template
+from build_pool import map_chunks, resolve_jobs
+from catalogue import CatalogueError, load_catalogue, split_steps
+from output_writer import WriteStats, write_if_changed
+from search_index import build_search_index, dump_search_index
+from shared_assets import SharedAssets, sample_rows
+from site_manifest import load_site_manifest
+
 # ==================== CONFIGURAÇÕES ====================
 CSV_FILE = 'automacoes_zapier_db.csv'
 TEMPLATE_FILE = 'template_page_zapier.html'
 OUTPUT_DIR = 'integracoes-zapier'
 MAIN_INDEX = 'index.html'
+SEARCH_INDEX_FILE = 'search-index.json'
+
+# Placeholders preenchidos pelo gerador (não vêm direto de colunas do CSV)
+COMPUTED_FIELDS = ('tags_html', 'lista_passos', 'json_steps')
 
 # Emoji map para categorias
 EMOJI_MAP = {
@@ -73,26 +85,17 @@ def create_steps_html(steps_str):
     """Cria lista de passos em HTML"""
     if not steps_str:
         return "<li>Conecte as contas no Zapier e configure o Zap.</li>"
-    steps = steps_str.split('|')
     html = ""
-    for i, step in enumerate(steps, 1):
-        step = step.strip()
-        if step:
-            html += f'<li class="mb-3 flex gap-3"><span class="flex-shrink-0 flex items-center justify-center h-6 w-6 rounded-full bg-orange-100 text-orange-700 text-sm font-bold">{i}</span><span>{step}</span></li>'
+    for i, step in enumerate(split_steps(steps_str), 1):
+        html += f'<li class="mb-3 flex gap-3"><span class="flex-shrink-0 flex items-center justify-center h-6 w-6 rounded-full bg-orange-100 text-orange-700 text-sm font-bold">{i}</span><span>{step}</span></li>'
     return html
 
 def create_json_steps(steps_str):
-    """Gera steps para Schema.org JSON-LD"""
-    if not steps_str:
-        return ""
-    steps = steps_str.split('|')
+    """Gera steps para Schema.org JSON-LD (texto escapado com json.dumps)"""
     json_steps = []
-    for step in steps:
-        step = step.strip()
-        if step:
-            # Escapar aspas para JSON
-            step_escaped = step.replace('"', '\\"')
-            json_steps.append(f'{{"@type": "HowToStep", "text": "{step_escaped}"}}')
+    for step in split_steps(steps_str):
+        step_json = json.dumps({"@type": "HowToStep", "text": step}, ensure_ascii=False)
+        json_steps.append(step_json.replace('</', '<\\/'))
     return ",\n".join(json_steps)
 
 def slugify(text):
@@ -103,15 +106,48 @@ def sanitize_html(text):
     """Remove caracteres perigosos"""
     return text.replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
 
+def apply_zapier_vocabulary(text):
+    """Ajusta vocabulário N8N -> Zapier"""
+    text = text.replace('workflow n8n', 'Zap')
+    text = text.replace('Workflow n8n', 'Zap')
+    text = text.replace('N8N', 'Zapier')
+    text = text.replace('n8n', 'Zapier')
+    return text
+
+def render_page(template, row, shared=None):
+    """Renderiza a página HTML de uma linha do CSV com o template compilado
+
+    O vocabulário Zapier é aplicado à página inteira, depois do render: uma
+    ocorrência pode começar no template e terminar num valor do CSV. Com
+    shared, os blocos inline comuns viram referências a assets/shared/
+    (ver shared_assets.py).
+    """
+    context = dict(row)
+    context['tags_html'] = create_tags_html(row.get('tags', ''))
+    context['lista_passos'] = create_steps_html(row.get('passos_resumo', ''))
+    context['json_steps'] = create_json_steps(row.get('passos_resumo', ''))
+    page = apply_zapier_vocabulary(template.render(context))
+    return shared.apply(page) if shared else page
+
+def build_search_docs(templates):
+    """Documentos do índice de busca (ver search_index.py), na ordem dos cards"""
+    docs = []
+    for t in templates:
+        docs.append({
+            'file': t['slug'],
+            'name': t['titulo'],
+            'label': f"{get_emoji(t['tags'])} {t['software_a']} → {t['software_b']}",
+            'keywords': [tag.strip() for tag in t['tags'].split(',')] + [t['software_a'], t['software_b']],
+        })
+    return docs
+
 # ==================== GERAÇÃO DE ÍNDICE ====================
 
-def generate_index_page(templates):
-    """Gera index.html otimizado com busca e filtros"""
-    
-    # Criar dados para filtro JavaScript
-    templates_json = json.dumps(templates)
+def generate_index_page(templates, stats=None, site=None):
+    """Gera index.html otimizado com busca e filtros (registrado em site, se informado)"""
     
-    index_content = f'''<!DOCTYPE html>
+    # Partes do documento, unidas uma única vez no final
+    parts = [f'''<!DOCTYPE html>
 <html lang="pt-BR" itemscope itemtype="http://schema.org/CollectionPage">
 <head>
     <meta charset="UTF-8">
@@ -202,7 +238,8 @@ def generate_index_page(templates):
             <input 
                 type="text" 
                 id="searchInput" 
-                onkeyup="filterCards()" 
+                oninput="filterCards()" 
+                onfocus="loadSearchData()" 
                 placeholder="Buscar Zap (ex: Shopify, Gmail, Slack)..." 
                 class="w-full px-4 py-3 rounded-lg border border-slate-300 focus:ring-2 focus:ring-orange-500 focus:outline-none shadow-sm"
             >
@@ -212,12 +249,12 @@ def generate_index_page(templates):
     <!-- Grid de Integrações -->
     <main class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 pb-12">
         <div class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6" id="integrationsGrid">
-'''
+''']
     
     # Adicionar cards
     for t in templates:
         emoji = get_emoji(t['tags'])
-        index_content += f'''            <a href="{t['slug']}" class="integration-card block bg-white p-6 rounded-xl shadow-sm border border-slate-200 hover:shadow-lg hover:border-orange-300 transition-all group">
+        parts.append(f'''            <a href="{t['slug']}" class="integration-card block bg-white p-6 rounded-xl shadow-sm border border-slate-200 hover:shadow-lg hover:border-orange-300 transition-all group">
                 <div class="text-xs uppercase font-bold text-orange-600 mb-2">{emoji} {t['software_a']} → {t['software_b']}</div>
                 <h2 class="font-bold text-slate-900 mb-2 group-hover:text-orange-600 transition-colors line-clamp-2">{sanitize_html(t['titulo'])}</h2>
                 <p class="text-sm text-slate-600 line-clamp-2">{sanitize_html(t['desc'])}</p>
@@ -225,9 +262,9 @@ def generate_index_page(templates):
                     <span class="text-xs text-orange-600 font-medium">⚡ Zapier</span>
                 </div>
             </a>
-'''
+''')
     
-    index_content += '''        </div>
+    parts.append('''        </div>
 
         <div id="noResults" class="hidden text-center py-12">
             <p class="text-slate-500 text-lg">Nenhum Zap encontrado para sua busca.</p>
@@ -260,128 +297,167 @@ def generate_index_page(templates):
         </div>
     </footer>
 
+    <script src="../assets/js/catalog-search.js"></script>
     <script>
-        // Dados das integrações para filtro
-        const integrations = [
-'''
-    
-    # Adicionar dados para busca
-    for t in templates:
-        keywords = ','.join([tag.strip() for tag in t['tags'].split(',')] + [t['software_a'].lower(), t['software_b'].lower()])
-        index_content += f'''            {{
-                name: '{sanitize_html(t["titulo"])}',
-                file: '{t["slug"]}',
-                keywords: ['{keywords.replace(",", "','")}']
-            }},
-'''
-    
-    index_content += '''        ];
+        // Índice de busca pré-construído (ids = posição do card na grade)
+        function loadSearchData() {
+            return CatalogSearch.load('search-index.json');
+        }
 
-        // Função de filtro
-        function filterCards() {
-            const searchTerm = document.getElementById('searchInput').value.toLowerCase();
+        // Função de filtro; só a busca mais recente mexe nos cards
+        let filterRequest = 0;
+        async function filterCards() {
+            const request = ++filterRequest;
+            const searchTerm = document.getElementById('searchInput').value.trim();
             const cards = document.querySelectorAll('.integration-card');
-            let visibleCount = 0;
-
-            cards.forEach((card, index) => {
-                const integration = integrations[index];
-                const matchesSearch = integration.name.toLowerCase().includes(searchTerm) ||
-                    integration.keywords.some(kw => kw.includes(searchTerm));
-
-                if (matchesSearch || searchTerm === '') {
-                    card.style.display = 'block';
-                    visibleCount++;
-                } else {
-                    card.style.display = 'none';
-                }
-            });
+            let visibleCount = cards.length;
+
+            if (searchTerm === '') {
+                cards.forEach(card => { card.style.display = 'block'; });
+            } else {
+                const index = await loadSearchData();
+                if (request !== filterRequest) return;
+                const matches = new Set(CatalogSearch.query(index, searchTerm));
+                visibleCount = matches.size;
+                cards.forEach((card, i) => {
+                    card.style.display = matches.has(i) ? 'block' : 'none';
+                });
+            }
 
             document.getElementById('noResults').classList.toggle('hidden', visibleCount > 0);
         }
 
         window.filterCards = filterCards;
+        window.loadSearchData = loadSearchData;
     </script>
 </body>
 </html>
-'''
+''')
     
-    with open(os.path.join(OUTPUT_DIR, 'index.html'), 'w', encoding='utf-8') as f:
-        f.write(index_content)
+    html = ''.join(parts)
+    write_if_changed(os.path.join(OUTPUT_DIR, 'index.html'), html, stats)
+    if site is not None:
+        site.record_content(f"{OUTPUT_DIR}/index.html", html)
+
+    payload = dump_search_index(build_search_index(build_search_docs(templates)))
+    write_if_changed(os.path.join(OUTPUT_DIR, SEARCH_INDEX_FILE), payload, stats)
     print(f"✅ Índice Zapier gerado: {len(templates)} templates indexados")
 
 
-def generate():
-    """Função principal de geração"""
+# Template compilado e assets compartilhados de cada processo do pool (ver init_render_worker)
+_worker_template = None
+_worker_shared = None
+
+def init_render_worker(template_content, shared=None):
+    """Compila o template uma vez por processo"""
+    global _worker_template, _worker_shared
+    _worker_template = compile_template(template_content)
+    _worker_shared = shared
+
+def render_chunk(rows):
+    """Renderiza e grava um lote de (slug, linha)
+
+    Devolve a lista de (arquivo, hash, bytes, mtime_ns) e o WriteStats do lote.
+    """
+    results = []
+    stats = WriteStats()
+    for slug, row in rows:
+        page = render_page(_worker_template, row, _worker_shared)
+        filename = f"{slug}.html"
+        filepath = os.path.join(OUTPUT_DIR, filename)
+        write_if_changed(filepath, page, stats)
+        data = page.encode('utf-8')
+        results.append((filename, hashlib.sha256(data).hexdigest(), len(data), os.stat(filepath).st_mtime_ns))
+    return results, stats
+
+def generate(jobs=1):
+    """Função principal de geração (jobs > 1 renderiza em um pool de processos)"""
     print(f"⚡ Iniciando geração de templates Zapier...")
     print(f"📂 Pasta de saída: {OUTPUT_DIR}/")
     
     # 1. Verificar se template existe, senão usar template inline
     template_content = get_zapier_template()
+    template = compile_template(template_content)
 
     # 2. Ler CSV e Gerar Páginas
     generated_templates = []
+    pending = {}
+    write_stats = WriteStats()
     count = 0
     start_time = datetime.now()
     
     try:
-        with open(CSV_FILE, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            
-            for row in reader:
-                # Dados básicos
-                page = template_content
-                slug = row.get('slug_url', '').strip()
-                
-                if not slug:
-                    continue
-
-                # ===== SUBSTITUIÇÕES SIMPLES =====
-                for key, value in row.items():
-                    placeholder = f"{{{{ {key} }}}}"
-                    page = page.replace(placeholder, value)
-
-                # ===== SUBSTITUIÇÕES COMPLEXAS =====
-                tags_html = create_tags_html(row.get('tags', ''))
-                page = page.replace('{{ tags_html }}', tags_html)
-
-                steps_html = create_steps_html(row.get('passos_resumo', ''))
-                page = page.replace('{{ lista_passos }}', steps_html)
-                
-                json_steps = create_json_steps(row.get('passos_resumo', ''))
-                page = page.replace('{{ json_steps }}', json_steps)
-
-                # Ajustar vocabulário para Zapier
-                page = page.replace('workflow n8n', 'Zap')
-                page = page.replace('Workflow n8n', 'Zap')
-                page = page.replace('N8N', 'Zapier')
-                page = page.replace('n8n', 'Zapier')
-
-                # ===== SALVAR ARQUIVO =====
-                filename = f"{slug}.html"
-                filepath = os.path.join(OUTPUT_DIR, filename)
-                
-                with open(filepath, 'w', encoding='utf-8') as out:
-                    out.write(page)
-                
-                # Guardar info para o índice
-                generated_templates.append({
-                    'slug': filename,
-                    'titulo': row.get('titulo_pagina', 'Sem Título'),
-                    'desc': row.get('descricao_curta', ''),
-                    'software_a': row.get('software_a', ''),
-                    'software_b': row.get('software_b', ''),
-                    'tags': row.get('tags', ''),
-                })
-                
-                print(f"⚡ Gerado: {filename}")
-                count += 1
-
+        catalogue = load_catalogue(CSV_FILE)
     except FileNotFoundError:
         print(f"❌ Erro: '{CSV_FILE}' não encontrado.")
         return
+    except CatalogueError as e:
+        print(f"❌ Erro: {e}")
+        return
+
+    # Placeholders que nenhuma coluna do CSV preenche
+    unknown = template.unknown_placeholders(catalogue.fieldnames + list(COMPUTED_FIELDS))
+    if unknown:
+        print(f"⚠️  Placeholders sem valor no template: {', '.join(unknown)}")
+
+    # Blocos inline comuns a todas as páginas -> assets/shared/<hash>.css|js
+    sample = sample_rows(row for row in catalogue if (row.get('slug_url') or '').strip())
+    shared = SharedAssets.detect([render_page(template, row) for row in sample])
+    shared.write(stats=write_stats)
+    if shared:
+        print(f"📦 Assets compartilhados: {', '.join(shared.names)} "
+              f"(-{shared.saved_bytes() / 1024:.1f}KB por página)")
+
+    without_slug = 0
+    for row in catalogue:
+        # Dados básicos
+        slug = (row.get('slug_url') or '').strip()
+        
+        if not slug:
+            without_slug += 1
+            continue
+
+        filename = f"{slug}.html"
+
+        # Guardar info para o índice
+        generated_templates.append({
+            'slug': filename,
+            'titulo': row.get('titulo_pagina', 'Sem Título'),
+            'desc': row.get('descricao_curta', ''),
+            'software_a': row.get('software_a', ''),
+            'software_b': row.get('software_b', ''),
+            'tags': row.get('tags', ''),
+        })
+
+        # Slug repetido: vale a última linha, como na geração sequencial
+        pending[slug] = row
+
+    if without_slug:
+        print(f"⚠️  {without_slug} linhas sem slug_url ignoradas (detalhes: python validate_catalogue.py {CSV_FILE})")
+
+    # Manifesto do site (integracoes-zapier/ só é listado na primeira vez)
+    site = load_site_manifest('.')
+    site.ensure_section(OUTPUT_DIR)
+
+    # ===== RENDERIZAR E SALVAR (em lotes, opcionalmente em paralelo) =====
+    if jobs > 1:
+        print(f"⚙️  Gerando {len(pending)} Zaps com {jobs} processos...")
+
+    chunks = map_chunks(render_chunk, list(pending.items()), jobs,
+                        initializer=init_render_worker, initargs=(template_content, shared))
+    for chunk_number, (results, chunk_stats) in enumerate(chunks, 1):
+        write_stats.add(chunk_stats)
+        for filename, output_hash, size, mtime_ns in results:
+            site.record(f"{OUTPUT_DIR}/{filename}", size, output_hash, mtime_ns)
+            if jobs == 1:
+                print(f"⚡ Gerado: {filename}")
+        if jobs > 1:
+            print(f"📦 Lote {chunk_number}: {len(results)} Zaps")
+        count += len(results)
 
     # 3. Gerar Índice do diretório
-    generate_index_page(generated_templates)
+    generate_index_page(generated_templates, write_stats, site)
+    site.save()
 
     # ===== ESTATÍSTICAS =====
     elapsed_time = (datetime.now() - start_time).total_seconds()
@@ -395,6 +471,8 @@ def generate():
     print(f"   • Tempo total: {elapsed_time:.2f}s")
     print(f"   • Tempo por Zap: {avg_time:.2f}ms")
     print(f"   • Taxa: {count/elapsed_time:.0f} páginas/segundo")
+    print(f"   • Arquivos: {write_stats.summary()}")
+    print(f"   • Processos: {jobs}")
     print(f"   • Pasta: {OUTPUT_DIR}/")
     print(f"{'='*60}\n")
 
@@ -549,4 +627,9 @@ def get_zapier_template():
 
 
 if __name__ == "__main__":
-    generate()
+    parser = argparse.ArgumentParser(description='Gera as páginas de templates Zapier a partir do CSV')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Número de processos para renderizar as páginas (0 = todos os núcleos)')
+    args = parser.parse_args()
+
+    generate(jobs=resolve_jobs(args.jobs))
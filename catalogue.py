@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Catálogo de integrações carregado uma vez e compartilhado pelos scripts
+
+Em vez de cada ferramenta abrir automacoes_db.csv com csv.DictReader e
+montar sua própria lista de dicts, todas usam load_catalogue():
+
+    • linhas compactas (CatalogueRow, com __slots__): tupla de valores +
+      índice de colunas compartilhado, mas com a interface de dict que os
+      scripts já usam (row['slug_url'], row.get('tags', ''), dict(row));
+    • índices por slug, software e tag, montados sob demanda;
+    • valores repetidos (softwares, eventos, tags...) guardados uma única
+      vez, na memória e no snapshot;
+    • snapshot binário (pickle) em .catalogue_cache/, ao lado do CSV,
+      válido enquanto o CSV tiver o mesmo tamanho + mtime (ou, se o mtime
+      mudou, o mesmo SHA-256), então o catálogo de 10k+ linhas carrega em
+      milissegundos;
+    • validação única do esquema (colunas obrigatórias);
+    • backend colunar opcional (Parquet, ver columnar_catalogue.py), com
+      projeção de colunas em load_columns() e contagem em count_rows().
+
+Uso:
+    from catalogue import load_catalogue
+    catalogue = load_catalogue()                 # automacoes_db.csv
+    row = catalogue.by_slug['facebook-ads-para-google-sheets-n8n']
+    rows = catalogue.with_software('Slack')
+
+    python catalogue.py                          # estatísticas + tempo de carga
+    python catalogue.py automacoes_zapier_db.csv --rebuild
+"""
+
+import argparse
+import csv
+import hashlib
+import os
+import pickle
+import re
+import time
+from functools import cached_property
+from pathlib import Path
+
+import columnar_catalogue
+from output_writer import write_atomic
+
+BASE_DIR = Path(__file__).parent
+N8N_CSV = BASE_DIR / 'automacoes_db.csv'
+ZAPIER_CSV = BASE_DIR / 'automacoes_zapier_db.csv'
+CACHE_DIR_NAME = '.catalogue_cache'
+SNAPSHOT_VERSION = 1
+
+# Colunas que todo CSV de catálogo (N8N ou Zapier) precisa ter
+REQUIRED_FIELDS = ('software_a', 'software_b', 'titulo_pagina', 'slug_url')
+
+# passos_resumo: "Passo 1|Passo 2|..."; versões antigas do gerador usavam
+# uma linha numerada por passo ("1. Passo 1\n2. Passo 2")
+STEP_SEPARATOR = '|'
+STEP_NUMBER_PATTERN = re.compile(r'^\d+[.)]\s*')
+
+
+class CatalogueError(ValueError):
+    """CSV de catálogo com esquema inválido"""
+
+
+class CatalogueRow:
+    """Uma linha do catálogo, com interface de dict somente leitura"""
+
+    __slots__ = ('_columns', '_values')
+
+    def __init__(self, columns, values):
+        self._columns = columns  # dict coluna -> posição, compartilhado por todas as linhas
+        self._values = values
+
+    def __getitem__(self, key):
+        return self._values[self._columns[key]]
+
+    def get(self, key, default=None):
+        index = self._columns.get(key)
+        return default if index is None else self._values[index]
+
+    def __contains__(self, key):
+        return key in self._columns
+
+    def keys(self):
+        return self._columns.keys()
+
+    def values(self):
+        return self._values
+
+    def items(self):
+        return zip(self._columns, self._values)
+
+    def as_dict(self):
+        """dict igual ao que o csv.DictReader produziria para esta linha"""
+        return dict(zip(self._columns, self._values))
+
+    def __getattr__(self, name):
+        try:
+            return self._values[self._columns[name]]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getstate__(self):
+        return self._columns, self._values
+
+    def __setstate__(self, state):
+        self._columns, self._values = state
+
+    def __repr__(self):
+        return f"CatalogueRow({self.get('slug_url')!r})"
+
+
+class Catalogue:
+    """Linhas de um CSV de catálogo + índices"""
+
+    def __init__(self, path, fieldnames, rows):
+        self.path = Path(path)
+        self.fieldnames = list(fieldnames)
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __getitem__(self, index):
+        return self.rows[index]
+
+    def column(self, name, default=''):
+        """Valores de uma coluna, na ordem do CSV"""
+        return [row.get(name, default) for row in self.rows]
+
+    @cached_property
+    def by_slug(self):
+        """slug -> linha (slug repetido: vale a última, como no build)"""
+        index = {}
+        for row in self.rows:
+            slug = (row.get('slug_url') or '').strip()
+            if slug:
+                index[slug] = row
+        return index
+
+    @cached_property
+    def by_software(self):
+        """nome do software (minúsculas) -> linhas em que aparece como origem ou destino"""
+        index = {}
+        for row in self.rows:
+            names = {(row.get('software_a') or '').strip().lower(),
+                     (row.get('software_b') or '').strip().lower()}
+            for name in names - {''}:
+                index.setdefault(name, []).append(row)
+        return index
+
+    @cached_property
+    def by_tag(self):
+        """tag (minúsculas) -> linhas com a tag"""
+        index = {}
+        for row in self.rows:
+            tags = {tag.strip().lower() for tag in (row.get('tags') or '').split(',')}
+            for tag in tags - {''}:
+                index.setdefault(tag, []).append(row)
+        return index
+
+    def with_software(self, name):
+        return self.by_software.get(name.strip().lower(), [])
+
+    def with_tag(self, tag):
+        return self.by_tag.get(tag.strip().lower(), [])
+
+
+def split_steps(steps):
+    """Passos de passos_resumo (sem vazios), aceitando '|' ou uma linha numerada por passo"""
+    if not steps:
+        return []
+    if STEP_SEPARATOR not in steps and '\n' in steps:
+        parts = [STEP_NUMBER_PATTERN.sub('', line.strip()) for line in steps.splitlines()]
+    else:
+        parts = steps.split(STEP_SEPARATOR)
+    return [part.strip() for part in parts if part.strip()]
+
+
+# ==================== CSV E SNAPSHOT ====================
+
+def validate_fieldnames(path, fieldnames):
+    """Confere as colunas obrigatórias do catálogo"""
+    missing = [name for name in REQUIRED_FIELDS if name not in (fieldnames or [])]
+    if missing:
+        raise CatalogueError(f"{Path(path).name}: colunas obrigatórias ausentes: {', '.join(missing)}")
+
+
+def read_csv(path):
+    """Lê o CSV (fieldnames, linhas como tuplas), com o mesmo preenchimento do DictReader
+
+    Valores iguais viram o mesmo objeto str: as colunas repetitivas ocupam
+    memória uma vez só e o pickle as grava como referência.
+    """
+    shared = {}
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        fieldnames = next(reader, [])
+        validate_fieldnames(path, fieldnames)
+        width = len(fieldnames)
+        rows = []
+        for values in reader:
+            if not values:
+                continue  # o DictReader também pula linhas vazias
+            if len(values) < width:
+                values = values + [None] * (width - len(values))
+            rows.append(tuple([shared.setdefault(value, value) for value in values[:width]]))
+    return fieldnames, rows
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def snapshot_path(path):
+    path = Path(path)
+    return path.parent / CACHE_DIR_NAME / f"{path.name}.pickle"
+
+
+def load_snapshot(path, info):
+    """Snapshot válido para o CSV atual (ou None); atualiza o mtime se só ele mudou"""
+    try:
+        with open(snapshot_path(path), 'rb') as f:
+            snapshot = pickle.load(f)
+    except (FileNotFoundError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    if snapshot.get('version') != SNAPSHOT_VERSION or snapshot.get('size') != info.st_size:
+        return None
+    if snapshot.get('mtime_ns') != info.st_mtime_ns:
+        if snapshot.get('sha256') != file_digest(path):
+            return None
+        snapshot['mtime_ns'] = info.st_mtime_ns
+        save_snapshot(path, snapshot)
+    return snapshot
+
+
+def save_snapshot(path, snapshot):
+    snapshot_path(path).parent.mkdir(exist_ok=True)
+    write_atomic(snapshot_path(path), pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def build_catalogue(path, fieldnames, value_rows):
+    columns = {name: index for index, name in enumerate(fieldnames)}
+    return Catalogue(path, fieldnames, [CatalogueRow(columns, values) for values in value_rows])
+
+
+def resolve_path(path):
+    """Caminho absoluto do catálogo: o store colunar ao lado do CSV, se estiver em uso
+
+    O store (automacoes_db.parquet/, ver columnar_catalogue.py) é usado
+    quando existe, o pyarrow está instalado e ele não é mais antigo que o
+    CSV; senão vale o próprio CSV.
+    """
+    path = Path(path)
+    if not path.is_absolute():
+        path = Path.cwd() / path
+    if columnar_catalogue.is_store(path) or not columnar_catalogue.available():
+        return path
+    store = columnar_catalogue.store_path(path)
+    store_mtime = columnar_catalogue.store_mtime_ns(store) if store.is_dir() else 0
+    if store_mtime and (not path.exists() or store_mtime >= path.stat().st_mtime_ns):
+        return store
+    return path
+
+
+_loaded = {}
+
+
+def load_catalogue(path=N8N_CSV, use_cache=True):
+    """Carrega um catálogo (uma vez por processo; CSV via snapshot quando possível)
+
+    Aceita o CSV ou o store colunar (.parquet). Levanta FileNotFoundError se
+    o catálogo não existe e CatalogueError se o esquema é inválido.
+    """
+    path = resolve_path(path)
+    if columnar_catalogue.is_store(path):
+        key = (str(path), columnar_catalogue.store_mtime_ns(path))
+        if use_cache and key in _loaded:
+            return _loaded[key]
+        fieldnames, value_rows = columnar_catalogue.read_store(path)
+        catalogue = build_catalogue(path, fieldnames, value_rows)
+        _loaded[key] = catalogue
+        return catalogue
+
+    info = os.stat(path)
+    key = (str(path), info.st_size, info.st_mtime_ns)
+    if use_cache and key in _loaded:
+        return _loaded[key]
+
+    snapshot = load_snapshot(path, info) if use_cache else None
+    if snapshot is None:
+        fieldnames, value_rows = read_csv(path)
+        snapshot = {
+            'version': SNAPSHOT_VERSION,
+            'size': info.st_size,
+            'mtime_ns': info.st_mtime_ns,
+            'sha256': file_digest(path),
+            'fieldnames': fieldnames,
+            'rows': value_rows,
+        }
+        if use_cache:
+            save_snapshot(path, snapshot)
+
+    catalogue = build_catalogue(path, snapshot['fieldnames'], snapshot['rows'])
+    _loaded[key] = catalogue
+    return catalogue
+
+
+def load_columns(path, names):
+    """{coluna: valores} só das colunas pedidas (as que não existem ficam de fora)
+
+    Com o store colunar, só essas colunas são lidas do disco.
+    """
+    path = resolve_path(path)
+    if columnar_catalogue.is_store(path):
+        return columnar_catalogue.read_columns(path, names)
+    catalogue = load_catalogue(path)
+    return {name: catalogue.column(name) for name in names if name in catalogue.fieldnames}
+
+
+def count_rows(path):
+    """Número de linhas do catálogo (com o store colunar, só pelos metadados)"""
+    path = resolve_path(path)
+    if columnar_catalogue.is_store(path):
+        return columnar_catalogue.count_rows(path)
+    return len(load_catalogue(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Carrega o catálogo e mostra estatísticas')
+    parser.add_argument('csv', nargs='?', default=str(N8N_CSV), help='CSV do catálogo (padrão: automacoes_db.csv)')
+    parser.add_argument('--rebuild', action='store_true', help='Ignorar o snapshot e reler o CSV')
+    args = parser.parse_args()
+
+    if args.rebuild:
+        snapshot_path(args.csv).unlink(missing_ok=True)
+
+    start = time.perf_counter()
+    catalogue = load_catalogue(args.csv)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"📚 {catalogue.path.name}: {len(catalogue)} linhas em {elapsed:.1f}ms")
+    print(f"   • Slugs únicos: {len(catalogue.by_slug)}")
+    print(f"   • Softwares: {len(catalogue.by_software)}")
+    print(f"   • Tags: {len(catalogue.by_tag)}")
+    if columnar_catalogue.is_store(catalogue.path):
+        print("   • Backend: store colunar (Parquet)")
+    else:
+        print(f"   • Snapshot: {snapshot_path(catalogue.path)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Catálogo em SQLite para consultas indexadas (categoria, software, tag, texto)
+
+As ferramentas de categoria/prioridade perguntavam "este template cita
+algum destes softwares?" varrendo software_a + software_b + tags de cada
+linha para cada categoria e cada palavra-chave. Aqui o catálogo vira um
+banco local com:
+
+    • templates: uma linha por template (id = posição no CSV), com índice
+      por slug e por tipo de evento;
+    • softwares / tags: vocabulário (valores distintos, em minúsculas) e
+      tabelas de ligação indexadas template_softwares / template_tags;
+    • templates_fts: FTS5 sobre título, descrição, caso de uso, softwares
+      e tags, para busca textual.
+
+Uma consulta por palavra-chave percorre só o vocabulário (algumas centenas
+de nomes) e segue o índice até os templates, em vez de todas as linhas.
+O banco fica em .catalogue_cache/<csv>.sqlite e é recriado sozinho quando
+o catálogo muda.
+
+Uso:
+    from catalogue_db import open_catalogue_db, template_ids_matching
+    db = open_catalogue_db('automacoes_db.csv')
+    ids = template_ids_matching(db, ['HubSpot', 'Pipedrive'])
+
+    python catalogue_db.py --software hubspot
+    python catalogue_db.py --search "leads whatsapp"
+"""
+
+import argparse
+import os
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+import columnar_catalogue
+from catalogue import CACHE_DIR_NAME, N8N_CSV, load_catalogue, resolve_path
+
+SCHEMA_VERSION = 1
+FTS_COLUMNS = ('titulo_pagina', 'descricao_curta', 'caso_uso_resumido', 'software_a', 'software_b', 'tags')
+
+
+def database_path(path):
+    path = Path(path)
+    return path.parent / CACHE_DIR_NAME / f"{path.name}.sqlite"
+
+
+def source_signature(path):
+    """Identifica a versão do catálogo de origem (CSV ou store colunar)"""
+    if columnar_catalogue.is_store(path):
+        return f"{SCHEMA_VERSION}:store:{columnar_catalogue.store_mtime_ns(path)}"
+    info = path.stat()
+    return f"{SCHEMA_VERSION}:csv:{info.st_size}:{info.st_mtime_ns}"
+
+
+def split_tags(tags):
+    return {tag.strip().lower() for tag in (tags or '').split(',')} - {''}
+
+
+def create_schema(db, fieldnames):
+    columns = ', '.join(f'"{name}" TEXT' for name in fieldnames)
+    db.executescript(f'''
+        CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE templates (id INTEGER PRIMARY KEY, {columns});
+        CREATE INDEX templates_slug ON templates (slug_url);
+        CREATE TABLE softwares (id INTEGER PRIMARY KEY, name TEXT UNIQUE);
+        CREATE TABLE tags (id INTEGER PRIMARY KEY, name TEXT UNIQUE);
+        CREATE TABLE template_softwares (template_id INTEGER, software_id INTEGER);
+        CREATE TABLE template_tags (template_id INTEGER, tag_id INTEGER);
+    ''')
+    if 'tipo_evento' in fieldnames:
+        db.execute('CREATE INDEX templates_event ON templates (tipo_evento)')
+
+
+def create_indexes(db):
+    """Índices das tabelas de ligação (criados depois da carga, que fica mais rápida)"""
+    db.executescript('''
+        CREATE INDEX template_softwares_software ON template_softwares (software_id, template_id);
+        CREATE INDEX template_tags_tag ON template_tags (tag_id, template_id);
+    ''')
+
+
+def create_fts(db, fieldnames):
+    """Índice FTS5 (ignorado se o SQLite foi compilado sem FTS5)"""
+    columns = [name for name in FTS_COLUMNS if name in fieldnames]
+    try:
+        db.execute(f"CREATE VIRTUAL TABLE templates_fts USING fts5({', '.join(columns)}, "
+                   "content='templates', content_rowid='id', tokenize='unicode61 remove_diacritics 2')")
+    except sqlite3.OperationalError:
+        return False
+    db.execute("INSERT INTO templates_fts(templates_fts) VALUES ('rebuild')")
+    return True
+
+
+def build_database(catalogue, db_path, signature):
+    """Cria o banco a partir do catálogo (arquivo temporário + rename)"""
+    db_path.parent.mkdir(exist_ok=True)
+    tmp_path = db_path.with_name(f'{db_path.name}.{os.getpid()}.tmp')
+    tmp_path.unlink(missing_ok=True)
+
+    fieldnames = catalogue.fieldnames
+    db = sqlite3.connect(tmp_path)
+    try:
+        create_schema(db, fieldnames)
+        placeholders = ', '.join('?' * (len(fieldnames) + 1))
+        db.executemany(f'INSERT INTO templates VALUES ({placeholders})',
+                       ((index, *row.values()) for index, row in enumerate(catalogue)))
+
+        softwares = {}
+        tags = {}
+        software_links = []
+        tag_links = []
+        for index, row in enumerate(catalogue):
+            names = {(row.get('software_a') or '').strip().lower(),
+                     (row.get('software_b') or '').strip().lower()} - {''}
+            for name in names:
+                software_links.append((index, softwares.setdefault(name, len(softwares))))
+            for tag in split_tags(row.get('tags')):
+                tag_links.append((index, tags.setdefault(tag, len(tags))))
+        db.executemany('INSERT INTO softwares VALUES (?, ?)', ((i, name) for name, i in softwares.items()))
+        db.executemany('INSERT INTO tags VALUES (?, ?)', ((i, name) for name, i in tags.items()))
+        db.executemany('INSERT INTO template_softwares VALUES (?, ?)', software_links)
+        db.executemany('INSERT INTO template_tags VALUES (?, ?)', tag_links)
+        create_indexes(db)
+
+        has_fts = create_fts(db, fieldnames)
+        db.executemany('INSERT INTO meta VALUES (?, ?)',
+                       [('source', signature), ('fts', '1' if has_fts else '0')])
+        db.commit()
+    finally:
+        db.close()
+    tmp_path.replace(db_path)
+
+
+def open_catalogue_db(path=N8N_CSV, rebuild=False):
+    """Conexão (somente leitura) com o banco do catálogo, recriando-o se estiver desatualizado"""
+    path = resolve_path(path)
+    db_path = database_path(path)
+    signature = source_signature(path)
+
+    current = None
+    if db_path.exists() and not rebuild:
+        try:
+            with closing(sqlite3.connect(db_path)) as db:
+                current = db.execute("SELECT value FROM meta WHERE key = 'source'").fetchone()
+        except sqlite3.DatabaseError:
+            current = None
+    if current is None or current[0] != signature:
+        build_database(load_catalogue(path), db_path, signature)
+
+    db = sqlite3.connect(f'{db_path.as_uri()}?mode=ro', uri=True)
+    db.row_factory = sqlite3.Row
+    return db
+
+
+# ==================== CONSULTAS ====================
+
+def _ids(cursor):
+    return [row[0] for row in cursor]
+
+
+def _keyword_clause(keywords):
+    """WHERE do vocabulário: nome contém alguma das palavras-chave (sem diferenciar maiúsculas)"""
+    clause = ' OR '.join('instr(name, ?) > 0' for _ in keywords)
+    return clause, [keyword.lower() for keyword in keywords]
+
+
+def template_ids_matching(db, keywords):
+    """ids (ordem do CSV) dos templates cujo software ou tag contém alguma palavra-chave"""
+    if not keywords:
+        return []
+    clause, params = _keyword_clause(keywords)
+    return _ids(db.execute(f'''
+        SELECT template_id FROM template_softwares
+         WHERE software_id IN (SELECT id FROM softwares WHERE {clause})
+        UNION
+        SELECT template_id FROM template_tags
+         WHERE tag_id IN (SELECT id FROM tags WHERE {clause})
+        ORDER BY 1
+    ''', params + params))
+
+
+def template_ids_with_software(db, name):
+    return _ids(db.execute('''
+        SELECT template_id FROM template_softwares
+         WHERE software_id = (SELECT id FROM softwares WHERE name = ?)
+         ORDER BY 1
+    ''', (name.strip().lower(),)))
+
+
+def template_ids_with_tag(db, tag):
+    return _ids(db.execute('''
+        SELECT template_id FROM template_tags
+         WHERE tag_id = (SELECT id FROM tags WHERE name = ?)
+         ORDER BY 1
+    ''', (tag.strip().lower(),)))
+
+
+def template_ids_with_event(db, event):
+    return _ids(db.execute('SELECT id FROM templates WHERE tipo_evento = ? ORDER BY id', (event,)))
+
+
+def search(db, query, limit=20):
+    """Busca textual (FTS5, ordenada por relevância); lista de sqlite3.Row"""
+    if db.execute("SELECT value FROM meta WHERE key = 'fts'").fetchone()[0] != '1':
+        raise RuntimeError("SQLite sem FTS5: busca textual indisponível")
+    return db.execute('''
+        SELECT templates.* FROM templates_fts
+          JOIN templates ON templates.id = templates_fts.rowid
+         WHERE templates_fts MATCH ?
+         ORDER BY rank LIMIT ?
+    ''', (query, limit)).fetchall()
+
+
+def fetch_templates(db, ids):
+    """Linhas completas de uma lista de ids, na mesma ordem"""
+    rows = {}
+    ids = list(ids)
+    for start in range(0, len(ids), 500):
+        chunk = ids[start:start + 500]
+        query = f"SELECT * FROM templates WHERE id IN ({', '.join('?' * len(chunk))})"
+        rows.update((row['id'], row) for row in db.execute(query, chunk))
+    return [rows[i] for i in ids]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Consultas indexadas ao catálogo (SQLite)')
+    parser.add_argument('csv', nargs='?', default=str(N8N_CSV), help='Catálogo (padrão: automacoes_db.csv)')
+    parser.add_argument('--software', help='Templates com este software')
+    parser.add_argument('--tag', help='Templates com esta tag')
+    parser.add_argument('--event', help='Templates com este tipo de evento')
+    parser.add_argument('--keywords', nargs='+', help='Templates cujo software/tag contém alguma palavra-chave')
+    parser.add_argument('--search', help='Busca textual (FTS5)')
+    parser.add_argument('--rebuild', action='store_true', help='Recriar o banco')
+    args = parser.parse_args()
+
+    db = open_catalogue_db(args.csv, rebuild=args.rebuild)
+    if args.search:
+        rows = search(db, args.search)
+    elif args.software or args.tag or args.event or args.keywords:
+        if args.software:
+            ids = template_ids_with_software(db, args.software)
+        elif args.tag:
+            ids = template_ids_with_tag(db, args.tag)
+        elif args.event:
+            ids = template_ids_with_event(db, args.event)
+        else:
+            ids = template_ids_matching(db, args.keywords)
+        print(f"🔎 {len(ids)} templates")
+        rows = fetch_templates(db, ids[:20])
+    else:
+        counts = {table: db.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+                  for table in ('templates', 'softwares', 'tags')}
+        print(f"🗄️  {database_path(resolve_path(args.csv))}")
+        print(f"   • Templates: {counts['templates']} | Softwares: {counts['softwares']} | Tags: {counts['tags']}")
+        return
+
+    for row in rows:
+        print(f"   • {row['slug_url']}: {row['titulo_pagina']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Backend colunar (Parquet) opcional para o catálogo
+
+Alternativa ao automacoes_db.csv para catálogos grandes:
+
+    • colunas tipadas: tags e passos_resumo viram listas de strings em vez
+      de texto separado por ',' / '|';
+    • append: novas linhas entram como um novo arquivo part-NNNNN.parquet,
+      sem reescrever o catálogo inteiro;
+    • projeção de colunas: quem só precisa de slug_url (sitemaps,
+      contagens) lê apenas essa coluna, e a contagem de linhas vem dos
+      metadados, sem ler dado nenhum.
+
+O store é um diretório ao lado do CSV (automacoes_db.parquet/). Quando ele
+existe, o pyarrow está instalado e ele não é mais antigo que o CSV,
+load_catalogue('automacoes_db.csv') passa a ler o store; caso contrário
+tudo continua no CSV. Requer pyarrow (pip install pyarrow).
+
+Uso:
+    python columnar_catalogue.py import automacoes_db.csv    # CSV -> automacoes_db.parquet/
+    python columnar_catalogue.py export automacoes_db.parquet [--output automacoes_db.csv]
+    python columnar_catalogue.py info automacoes_db.parquet
+"""
+
+import argparse
+import csv
+import io
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+from output_writer import write_atomic
+
+STORE_SUFFIX = '.parquet'
+PART_PREFIX = 'part-'
+
+# Colunas guardadas como lista, com o separador usado no CSV
+LIST_COLUMNS = {'tags': ',', 'passos_resumo': '|'}
+
+
+def available():
+    return pa is not None
+
+
+def require_pyarrow():
+    if pa is None:
+        raise ImportError("pyarrow não instalado (pip install pyarrow)")
+
+
+def is_store(path):
+    return Path(path).suffix == STORE_SUFFIX
+
+
+def store_path(csv_path):
+    """Diretório do store colunar correspondente a um CSV"""
+    return Path(csv_path).with_suffix(STORE_SUFFIX)
+
+
+def part_files(store):
+    return sorted(Path(store).glob(f'{PART_PREFIX}*{STORE_SUFFIX}'))
+
+
+def store_mtime_ns(store):
+    """mtime do arquivo mais recente do store (0 se vazio)"""
+    return max((part.stat().st_mtime_ns for part in part_files(store)), default=0)
+
+
+# ==================== CONVERSÃO ====================
+
+def store_schema(fieldnames):
+    return pa.schema([
+        pa.field(name, pa.list_(pa.string()) if name in LIST_COLUMNS else pa.string())
+        for name in fieldnames
+    ])
+
+
+def rows_to_table(fieldnames, value_rows):
+    """Linhas do CSV (tuplas de strings) -> tabela Arrow tipada"""
+    columns = []
+    for index, name in enumerate(fieldnames):
+        values = [row[index] for row in value_rows]
+        separator = LIST_COLUMNS.get(name)
+        if separator:
+            # split sem strip: o join na leitura devolve exatamente o texto original
+            values = [None if value is None else (value.split(separator) if value else [])
+                      for value in values]
+        columns.append(values)
+    return pa.table(columns, schema=store_schema(fieldnames))
+
+
+def table_to_rows(table):
+    """Tabela Arrow -> (fieldnames, linhas como tuplas de strings, como no CSV)"""
+    fieldnames = table.schema.names
+    shared = {}
+    columns = []
+    for name in fieldnames:
+        values = table.column(name).to_pylist()
+        separator = LIST_COLUMNS.get(name)
+        if separator:
+            values = [None if value is None else separator.join(value) for value in values]
+        columns.append([shared.setdefault(value, value) for value in values])
+    return fieldnames, list(zip(*columns))
+
+
+# ==================== LEITURA ====================
+
+def read_table(store, columns=None):
+    """Concatena os arquivos do store (na ordem do append), só com as colunas pedidas"""
+    require_pyarrow()
+    parts = part_files(store)
+    if not parts:
+        raise FileNotFoundError(f"Store colunar vazio ou inexistente: {store}")
+    return pa.concat_tables([pq.read_table(part, columns=columns) for part in parts])
+
+
+def read_store(store):
+    """(fieldnames, linhas) do store inteiro; interface igual a catalogue.read_csv"""
+    from catalogue import validate_fieldnames
+
+    table = read_table(store)
+    validate_fieldnames(store, table.schema.names)
+    return table_to_rows(table)
+
+
+def read_fieldnames(store):
+    parts = part_files(store)
+    if not parts:
+        raise FileNotFoundError(f"Store colunar vazio ou inexistente: {store}")
+    return pq.read_schema(parts[0]).names
+
+
+def read_columns(store, names):
+    """{coluna: valores} só das colunas pedidas que existem no store"""
+    existing = [name for name in names if name in read_fieldnames(store)]
+    fieldnames, rows = table_to_rows(read_table(store, columns=existing))
+    return {name: [row[index] for row in rows] for index, name in enumerate(fieldnames)}
+
+
+def count_rows(store):
+    """Número de linhas, lido só dos metadados dos arquivos"""
+    require_pyarrow()
+    parts = part_files(store)
+    if not parts:
+        raise FileNotFoundError(f"Store colunar vazio ou inexistente: {store}")
+    return sum(pq.ParquetFile(part).metadata.num_rows for part in parts)
+
+
+# ==================== ESCRITA ====================
+
+def write_part(store, table, number):
+    buffer = pa.BufferOutputStream()
+    pq.write_table(table, buffer, compression='zstd')
+    write_atomic(Path(store) / f'{PART_PREFIX}{number:05d}{STORE_SUFFIX}', buffer.getvalue().to_pybytes())
+
+
+def append_rows(store, fieldnames, value_rows):
+    """Acrescenta linhas ao store como um novo arquivo (cria o store se preciso)"""
+    require_pyarrow()
+    store = Path(store)
+    store.mkdir(exist_ok=True)
+    parts = part_files(store)
+    if parts:
+        existing = read_fieldnames(store)
+        if list(existing) != list(fieldnames):
+            raise ValueError(f"Colunas diferentes das do store {store.name}: {', '.join(fieldnames)}")
+        number = int(parts[-1].stem[len(PART_PREFIX):]) + 1
+    else:
+        number = 0
+    if value_rows:
+        write_part(store, rows_to_table(fieldnames, value_rows), number)
+    return len(value_rows)
+
+
+def import_csv(csv_path, store=None):
+    """Converte um CSV em store colunar (substitui o store existente)"""
+    from catalogue import read_csv
+
+    require_pyarrow()
+    store = Path(store) if store else store_path(csv_path)
+    fieldnames, value_rows = read_csv(csv_path)
+    store.mkdir(exist_ok=True)
+    old_parts = part_files(store)
+    write_part(store, rows_to_table(fieldnames, value_rows), 0)
+    for part in old_parts:
+        if part.name != f'{PART_PREFIX}00000{STORE_SUFFIX}':
+            part.unlink()
+    return store, len(value_rows)
+
+
+def export_csv(store, csv_path=None):
+    """Grava o store de volta como CSV (para ferramentas que ainda leem o CSV)"""
+    csv_path = Path(csv_path) if csv_path else Path(store).with_suffix('.csv')
+    fieldnames, value_rows = read_store(store)
+    buffer = io.StringIO(newline='')
+    writer = csv.writer(buffer)
+    writer.writerow(fieldnames)
+    writer.writerows(['' if value is None else value for value in row] for row in value_rows)
+    write_atomic(csv_path, buffer.getvalue().encode('utf-8'))
+    return csv_path, len(value_rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Backend colunar (Parquet) do catálogo')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    import_parser = subparsers.add_parser('import', help='CSV -> store colunar')
+    import_parser.add_argument('csv')
+    import_parser.add_argument('--store', help='Diretório do store (padrão: <csv>.parquet)')
+    export_parser = subparsers.add_parser('export', help='Store colunar -> CSV')
+    export_parser.add_argument('store')
+    export_parser.add_argument('--output', help='CSV de saída (padrão: <store>.csv)')
+    info_parser = subparsers.add_parser('info', help='Colunas e número de linhas do store')
+    info_parser.add_argument('store')
+    args = parser.parse_args()
+    require_pyarrow()
+
+    if args.command == 'import':
+        store, count = import_csv(args.csv, args.store)
+        print(f"✅ {count} linhas importadas para {store}/")
+    elif args.command == 'export':
+        csv_path, count = export_csv(args.store, args.output)
+        print(f"✅ {count} linhas exportadas para {csv_path}")
+    else:
+        schema = pq.read_schema(part_files(args.store)[0]) if part_files(args.store) else None
+        print(f"📦 {args.store}: {count_rows(args.store)} linhas em {len(part_files(args.store))} arquivos")
+        for field in schema or []:
+            print(f"   • {field.name}: {field.type}")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,17 +7,15 @@ Adiciona 100+ novos templates focados em casos de uso populares
 import csv
 import os
 
+from catalogue import load_catalogue
+
 def generate_additional_zapier_templates():
     """Gera templates Zapier adicionais para atingir 200+ templates"""
     
     existing_file = 'automacoes_zapier_db.csv'
     
     # Ler templates existentes para evitar duplicatas
-    existing_slugs = set()
-    with open(existing_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            existing_slugs.add(row['slug_url'])
+    existing_slugs = set(load_catalogue(existing_file).by_slug)
     
     print(f"📊 Templates existentes: {len(existing_slugs)}")
     
@@ -8,6 +8,8 @@ Cria 30 artigos completos com SEO otimizado
 import os
 from datetime import datetime
 
+from output_writer import WriteStats, write_if_changed
+
 # Dados dos artigos
 articles = [
     {
@@ -615,6 +617,7 @@ def main():
     blog_dir = "/workspaces/fabrica-n8n/blog"
     
     print("🚀 Gerando 30 artigos de blog com SEO completo...\n")
+    write_stats = WriteStats()
     
     for i, article in enumerate(articles, 1):
         filename = f"{article['slug']}.html"
@@ -622,12 +625,13 @@ def main():
         
         html_content = generate_html(article)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        print(f"✅ [{i}/30] {filename}")
+        if write_if_changed(filepath, html_content, write_stats):
+            print(f"✅ [{i}/30] {filename}")
+        else:
+            print(f"⏭️  [{i}/30] {filename} (inalterado)")
     
     print(f"\n🎉 Todos os 30 artigos foram criados com sucesso em {blog_dir}")
+    print(f"💾 Arquivos: {write_stats.summary()}")
     print("\n📋 Próximos passos:")
     print("1. Atualizar sitemap-blog.xml")
     print("2. Atualizar blog/index.html")
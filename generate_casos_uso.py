@@ -9,6 +9,8 @@ import os
 import re
 from pathlib import Path
 
+from output_writer import WriteStats, write_if_changed
+
 # Dados dos 20 casos de uso
 CASOS_DE_USO = [
     {
@@ -500,14 +502,14 @@ def main():
     print("🚀 Gerando páginas de casos de uso...\n")
     
     slugs = []
+    write_stats = WriteStats()
     
     for i, caso in enumerate(CASOS_DE_USO, 1):
         slug, html = generate_page(caso)
         
         # Salvar arquivo
         output_path = output_dir / f'{slug}.html'
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+        write_if_changed(output_path, html, write_stats)
         
         slugs.append({
             'slug': slug,
@@ -520,6 +522,7 @@ def main():
         print(f"    📄 casos-de-uso/{slug}.html")
     
     print(f"\n🎉 {len(CASOS_DE_USO)} páginas geradas com sucesso!")
+    print(f"💾 Arquivos: {write_stats.summary()}")
     print(f"\n📋 Lista de slugs para atualizar casos-de-uso.html:")
     print("="*60)
     for item in slugs:
@@ -528,9 +531,8 @@ def main():
     
     # Salvar mapeamento para sitemap
     print(f"\n💾 Salvando mapeamento casos_de_uso_slugs.txt...")
-    with open('casos_de_uso_slugs.txt', 'w', encoding='utf-8') as f:
-        for item in slugs:
-            f.write(f"/casos-de-uso/{item['slug']}.html\n")
+    write_if_changed('casos_de_uso_slugs.txt',
+                     ''.join(f"/casos-de-uso/{item['slug']}.html\n" for item in slugs))
     
     print("\n✅ Processo concluído!")
     print("\n📌 Próximos passos:")
@@ -4,10 +4,13 @@ Gerador de páginas de índice por categoria
 Cria /integracoes/crm/, /integracoes/whatsapp/, etc.
 """
 
-import csv
 import os
 from collections import defaultdict
 
+from catalogue import load_catalogue
+from catalogue_db import open_catalogue_db, template_ids_matching
+from output_writer import WriteStats, write_if_changed
+
 CATEGORIES = {
     'crm': {
         'name': 'CRM & Vendas',
@@ -46,10 +49,9 @@ CATEGORIES = {
     }
 }
 
-def template_matches_category(software_a, software_b, tags, category_keywords):
-    """Verifica se template pertence à categoria"""
-    combined = f"{software_a} {software_b} {tags}".lower()
-    return any(keyword.lower() in combined for keyword in category_keywords)
+def category_template_ids(db, category_keywords):
+    """ids (posições no CSV) dos templates da categoria: algum software ou tag contém uma palavra-chave"""
+    return template_ids_matching(db, category_keywords)
 
 def generate_category_page(category_key, category_info, templates):
     """Gera HTML de página de categoria"""
@@ -225,31 +227,30 @@ def main():
     
     # Ler todos os templates
     all_templates = []
-    with open('automacoes_db.csv', 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            all_templates.append({
-                'slug': row['slug_url'],
-                'software_a': row['software_a'],
-                'software_b': row['software_b'],
-                'tipo_evento': row['tipo_evento'],
-                'titulo': row['titulo_pagina'],
-                'descricao': row['descricao_curta'],
-                'tags': row.get('tags', '')
-            })
+    for row in load_catalogue('automacoes_db.csv'):
+        all_templates.append({
+            'slug': row['slug_url'],
+            'software_a': row['software_a'],
+            'software_b': row['software_b'],
+            'tipo_evento': row['tipo_evento'],
+            'titulo': row['titulo_pagina'],
+            'descricao': row['descricao_curta'],
+            'tags': row.get('tags', '')
+        })
     
     print(f"📊 Total de templates carregados: {len(all_templates)}\n")
     
+    # Banco indexado do catálogo (recriado só quando o CSV muda)
+    db = open_catalogue_db('automacoes_db.csv')
+    
     # Criar diretório se não existir
     os.makedirs('integracoes', exist_ok=True)
+    write_stats = WriteStats()
     
     # Gerar página para cada categoria
     for category_key, category_info in CATEGORIES.items():
         # Filtrar templates da categoria
-        category_templates = [
-            t for t in all_templates
-            if template_matches_category(t['software_a'], t['software_b'], t['tags'], category_info['keywords'])
-        ]
+        category_templates = [all_templates[i] for i in category_template_ids(db, category_info['keywords'])]
         
         print(f"{category_info['icon']} {category_info['name']}: {len(category_templates)} templates")
         
@@ -262,13 +263,14 @@ def main():
         
         # Salvar arquivo
         output_file = f"{category_dir}/index.html"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html)
-        
-        print(f"   ✅ Salvo em: {output_file}")
+        if write_if_changed(output_file, html, write_stats):
+            print(f"   ✅ Salvo em: {output_file}")
+        else:
+            print(f"   ⏭️  Inalterado: {output_file}")
     
     print("\n" + "=" * 80)
     print("✅ Páginas de categoria criadas com sucesso!")
+    print(f"💾 Arquivos: {write_stats.summary()}")
     print("=" * 80)
     print("\nPróximos passos:")
     print("1. Revisar as páginas geradas")
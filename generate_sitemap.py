@@ -4,12 +4,13 @@ Gerador automático de sitemap.xml otimizado para SEO e LLMs
 Cria sitemap com todas as 13.269+ páginas de templates
 """
 
-import csv
 import os
 from datetime import datetime
 from xml.etree.ElementTree import Element, SubElement, tostring
 from xml.dom import minidom
 
+from catalogue import load_columns, resolve_path
+
 def generate_sitemap(
     csv_file='automacoes_db.csv',
     base_url='https://www.automationscookbook.com',
@@ -159,49 +160,41 @@ def generate_sitemap(
     # Add template pages from CSV
     print(f"📚 Adicionando templates N8N do CSV...")
     
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        count = 0
+    count = 0
+    for slug in load_columns(csv_file, ['slug_url'])['slug_url']:
+        url_path = f"/integracoes/{slug}.html"
         
-        for row in reader:
-            slug = row['slug_url']
-            url_path = f"/integracoes/{slug}.html"
-            
-            url = SubElement(urlset, 'url')
-            SubElement(url, 'loc').text = f"{base_url}{url_path}"
-            SubElement(url, 'lastmod').text = today
-            SubElement(url, 'changefreq').text = priority_map['templates'][1]
-            SubElement(url, 'priority').text = priority_map['templates'][0]
-            
-            count += 1
-            
-            if count % 1000 == 0:
-                print(f"   {count} templates N8N adicionados...")
-    
+        url = SubElement(urlset, 'url')
+        SubElement(url, 'loc').text = f"{base_url}{url_path}"
+        SubElement(url, 'lastmod').text = today
+        SubElement(url, 'changefreq').text = priority_map['templates'][1]
+        SubElement(url, 'priority').text = priority_map['templates'][0]
+        
+        count += 1
+        
+        if count % 1000 == 0:
+            print(f"   {count} templates N8N adicionados...")
+
     n8n_count = count
     print(f"✅ N8N: {n8n_count} templates")
     
     # Add Zapier template pages from CSV
     zapier_csv = 'automacoes_zapier_db.csv'
-    if os.path.exists(zapier_csv):
+    if resolve_path(zapier_csv).exists():
         print(f"⚡ Adicionando templates Zapier do CSV...")
         
-        with open(zapier_csv, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            zapier_count = 0
+        zapier_count = 0
+        for slug in load_columns(zapier_csv, ['slug_url'])['slug_url']:
+            url_path = f"/integracoes-zapier/{slug}.html"
             
-            for row in reader:
-                slug = row['slug_url']
-                url_path = f"/integracoes-zapier/{slug}.html"
-                
-                url = SubElement(urlset, 'url')
-                SubElement(url, 'loc').text = f"{base_url}{url_path}"
-                SubElement(url, 'lastmod').text = today
-                SubElement(url, 'changefreq').text = priority_map['templates'][1]
-                SubElement(url, 'priority').text = priority_map['templates'][0]
-                
-                zapier_count += 1
-        
+            url = SubElement(urlset, 'url')
+            SubElement(url, 'loc').text = f"{base_url}{url_path}"
+            SubElement(url, 'lastmod').text = today
+            SubElement(url, 'changefreq').text = priority_map['templates'][1]
+            SubElement(url, 'priority').text = priority_map['templates'][0]
+            
+            zapier_count += 1
+
         print(f"✅ Zapier: {zapier_count} templates")
         count = n8n_count + zapier_count
     else:
@@ -4,13 +4,15 @@ Generate segmented sitemaps from CSV databases and file structure
 Usage: python generate_sitemaps.py
 """
 
-import csv
 import os
 from datetime import datetime
 from pathlib import Path
 from xml.etree.ElementTree import Element, SubElement, tostring
 from xml.dom import minidom
 
+from catalogue import load_columns, resolve_path
+from site_manifest import load_site_manifest, section_files
+
 BASE_URL = "https://www.automationscookbook.com"
 OUTPUT_DIR = Path(__file__).parent
 
@@ -88,34 +90,36 @@ def create_n8n_templates_sitemap():
     """Create sitemap-integracoes-n8n.xml from CSV"""
     csv_file = OUTPUT_DIR / "automacoes_db.csv"
     
-    if not csv_file.exists():
+    if not resolve_path(csv_file).exists():
         print(f"⚠️  CSV not found: {csv_file}")
         return False
     
     urlset = Element('urlset', xmlns="http://www.sitemaps.org/schemas/sitemap/0.9")
     
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        count = 0
+    # Only the URL columns are needed (read alone from the columnar store)
+    columns = load_columns(csv_file, ['url_template', 'slug_url'])
+    slugs = columns.get('slug_url', [])
+    url_templates = columns.get('url_template') or [''] * len(slugs)
+    
+    count = 0
+    for url_template, slug in zip(url_templates, slugs):
+        # Try url_template first, fallback to slug_url
+        url_template = (url_template or '').strip()
+        if not url_template:
+            slug = (slug or '').strip()
+            if slug:
+                url_template = f"{BASE_URL}/integracoes/{slug}.html"
+        
+        if not url_template:
+            continue
+        
+        url_elem = SubElement(urlset, 'url')
+        SubElement(url_elem, 'loc').text = url_template
+        SubElement(url_elem, 'lastmod').text = get_last_modified()
+        SubElement(url_elem, 'changefreq').text = "monthly"
+        SubElement(url_elem, 'priority').text = "0.7"
         
-        for row in reader:
-            # Try url_template first, fallback to slug_url
-            url_template = row.get('url_template', '').strip()
-            if not url_template:
-                slug = row.get('slug_url', '').strip()
-                if slug:
-                    url_template = f"{BASE_URL}/integracoes/{slug}.html"
-            
-            if not url_template:
-                continue
-            
-            url_elem = SubElement(urlset, 'url')
-            SubElement(url_elem, 'loc').text = url_template
-            SubElement(url_elem, 'lastmod').text = get_last_modified()
-            SubElement(url_elem, 'changefreq').text = "monthly"
-            SubElement(url_elem, 'priority').text = "0.7"
-            
-            count += 1
+        count += 1
     
     xml_content = prettify_xml(urlset)
     output_file = OUTPUT_DIR / "sitemap-integracoes-n8n.xml"
@@ -130,34 +134,36 @@ def create_zapier_templates_sitemap():
     """Create sitemap-integracoes-zapier.xml from CSV"""
     csv_file = OUTPUT_DIR / "automacoes_zapier_db.csv"
     
-    if not csv_file.exists():
+    if not resolve_path(csv_file).exists():
         print(f"⚠️  CSV not found: {csv_file}")
         return False
     
     urlset = Element('urlset', xmlns="http://www.sitemaps.org/schemas/sitemap/0.9")
     
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        count = 0
+    # Only the URL columns are needed (read alone from the columnar store)
+    columns = load_columns(csv_file, ['url_template', 'slug_url'])
+    slugs = columns.get('slug_url', [])
+    url_templates = columns.get('url_template') or [''] * len(slugs)
+    
+    count = 0
+    for url_template, slug in zip(url_templates, slugs):
+        # Try url_template first, fallback to slug_url
+        url_template = (url_template or '').strip()
+        if not url_template:
+            slug = (slug or '').strip()
+            if slug:
+                url_template = f"{BASE_URL}/integracoes-zapier/{slug}.html"
         
-        for row in reader:
-            # Try url_template first, fallback to slug_url
-            url_template = row.get('url_template', '').strip()
-            if not url_template:
-                slug = row.get('slug_url', '').strip()
-                if slug:
-                    url_template = f"{BASE_URL}/integracoes-zapier/{slug}.html"
-            
-            if not url_template:
-                continue
-            
-            url_elem = SubElement(urlset, 'url')
-            SubElement(url_elem, 'loc').text = url_template
-            SubElement(url_elem, 'lastmod').text = get_last_modified()
-            SubElement(url_elem, 'changefreq').text = "monthly"
-            SubElement(url_elem, 'priority').text = "0.7"
-            
-            count += 1
+        if not url_template:
+            continue
+        
+        url_elem = SubElement(urlset, 'url')
+        SubElement(url_elem, 'loc').text = url_template
+        SubElement(url_elem, 'lastmod').text = get_last_modified()
+        SubElement(url_elem, 'changefreq').text = "monthly"
+        SubElement(url_elem, 'priority').text = "0.7"
+        
+        count += 1
     
     xml_content = prettify_xml(urlset)
     output_file = OUTPUT_DIR / "sitemap-integracoes-zapier.xml"
@@ -178,14 +184,17 @@ def create_blog_sitemap():
     
     urlset = Element('urlset', xmlns="http://www.sitemaps.org/schemas/sitemap/0.9")
     
-    html_files = list(blog_dir.glob("*.html"))
+    # File list (and per-page lastmod) from the site manifest, without listing blog/
+    site = load_site_manifest(OUTPUT_DIR)
+    html_files = section_files("blog", OUTPUT_DIR, site)
     # Exclude index.html and template files
     html_files = [f for f in html_files if f.name not in ['index.html', 'template.html', 'template_page.html']]
     
     for html_file in html_files:
+        entry = site.get(f"blog/{html_file.name}")
         url_elem = SubElement(urlset, 'url')
         SubElement(url_elem, 'loc').text = f"{BASE_URL}/blog/{html_file.name}"
-        SubElement(url_elem, 'lastmod').text = get_last_modified()
+        SubElement(url_elem, 'lastmod').text = entry['lastmod'] if entry else get_last_modified()
         SubElement(url_elem, 'changefreq').text = "weekly"
         SubElement(url_elem, 'priority').text = "0.8"
     
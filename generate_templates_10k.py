@@ -2,14 +2,35 @@
 # -*- coding: utf-8 -*-
 """
 Generator de 10.000+ Templates N8N
-Expande automacoes_db.csv para 10.000 linhas mantendo qualidade e sem duplicatas
+Expande automacoes_db.csv combinando softwares × softwares × eventos, sem
+duplicatas e sem efeitos colaterais na importação.
+
+O gerador é uma função (iter_template_batches) que enumera as combinações
+em lotes: os pedaços de slug/título de cada software e evento são
+calculados uma única vez, então cada linha custa só algumas concatenações.
+As linhas vão direto para o arquivo de saída (sem montar a lista inteira
+em memória), opcionalmente divididas em shards determinísticos (pelo
+CRC32 do slug, o mesmo shard em qualquer execução).
+
+Uso:
+    python generate_templates_10k.py                       # 10.000 novos templates
+    python generate_templates_10k.py --target 300000       # até 381.582 combinações
+    python generate_templates_10k.py --target 100000 --shards 8
 """
 
+import argparse
 import csv
 import os
+import sys
+import zlib
+from contextlib import ExitStack
 from datetime import datetime
 from urllib.parse import quote
 
+import columnar_catalogue
+from catalogue import load_catalogue, resolve_path
+from output_writer import open_atomic
+
 # 80+ softwares de integração
 SOFTWARES = [
     "Salesforce", "HubSpot", "Pipedrive", "RD Station", "Active Campaign", "Keap", "Close.io",
@@ -75,133 +96,222 @@ TAGS = [
     "trigger-based", "rule-based", "ai-powered", "ml-enabled", "intelligent"
 ]
 
-print("\n" + "="*80)
-print("🚀 GERADOR DE 10.000+ TEMPLATES N8N")
-print("="*80 + "\n")
-
-# Ler CSV existente
-existing_entries = set()
-existing_list = []
-
-if os.path.exists("automacoes_db.csv"):
-    print("📖 Lendo CSV existente...")
-    with open("automacoes_db.csv", "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            key = (row["software_a"], row["software_b"], row["tipo_evento"])
-            existing_entries.add(key)
-            existing_list.append(row)
-    print(f"   ✓ {len(existing_list)} templates existentes carregados")
-else:
-    print("⚠️  CSV não encontrado, iniciando do zero")
-
-# Gerar combinações inteligentes
-print("\n📝 Gerando 10.000+ templates únicos...")
-new_entries = []
-target = 10000
-progress_step = 500
-
-# Estratégia: Combinar softwares × eventos × casos de uso
-for i, software_a in enumerate(SOFTWARES):
-    for software_b in SOFTWARES:
-        if software_a == software_b:
-            continue
-        
-        for evento in TIPOS_EVENTOS:
-            # Usar diferentes casos de uso e tags
-            caso_idx = (len(new_entries) % len(CASOS_USO))
-            tags_idx = (len(new_entries) % (len(TAGS) - 4))
-            
-            caso_uso = CASOS_USO[caso_idx]
-            tags = ", ".join(TAGS[tags_idx:tags_idx+4])
-            
-            # Evitar duplicatas
-            key = (software_a, software_b, evento)
-            if key in existing_entries:
-                continue
-            
-            # Gerar slug
-            slug_base = f"{software_a.lower()}-para-{software_b.lower()}-n8n-{evento}"
-            slug = quote(slug_base.replace(" ", "-"), safe="-").lower()
-            
-            # Título
-            titulo = f"{software_a} para {software_b} | Automação de {evento.title()} com n8n"
-            
-            # Descrição
-            descricao = f"Integre {software_a} com {software_b} para automatizar {caso_uso} de forma inteligente e confiável"
-            
-            # URL JSON simulada
-            json_url = f"https://n8n.io/workflows/{slug}"
-            
-            # Passos
-            passos = f"1. Conectar {software_a}\n2. Configurar gatilho de {evento}\n3. Mapear dados\n4. Sincronizar com {software_b}\n5. Testar workflow"
-            
-            entry = {
-                "software_a": software_a,
-                "software_b": software_b,
-                "tipo_evento": evento,
-                "caso_uso_resumido": caso_uso,
-                "titulo_pagina": titulo,
-                "slug_url": slug,
-                "descricao_curta": descricao,
-                "json_n8n_url": json_url,
-                "passos_resumo": passos,
-                "tags": tags
-            }
-            
-            new_entries.append(entry)
-            existing_entries.add(key)
-            
-            if len(new_entries) % progress_step == 0:
-                print(f"   → {len(new_entries)} templates gerados...")
-            
-            if len(new_entries) >= target:
-                break
-        
-        if len(new_entries) >= target:
-            break
-    
-    if len(new_entries) >= target:
-        break
-
-print(f"\n✅ Gerados {len(new_entries)} novos templates únicos\n")
-
-# Mesclar e salvar
-print("📊 Mesclando com existentes...")
-all_entries = existing_list + new_entries
-print(f"   Total: {len(existing_list)} existentes + {len(new_entries)} novos = {len(all_entries)}")
-
-# Salvar CSVs
-fieldnames = [
+FIELDNAMES = [
     "software_a", "software_b", "tipo_evento", "caso_uso_resumido",
     "titulo_pagina", "slug_url", "descricao_curta", "json_n8n_url",
     "passos_resumo", "tags"
 ]
+DEFAULT_TARGET = 10000
+BATCH_SIZE = 10000
+STORE_BATCH_SIZE = 100000  # linhas por arquivo novo no store colunar
+PROGRESS_STEP = 50000
+
+
+def slug_fragment(text):
+    """Pedaço de slug de um nome (minúsculas, espaços -> hífens, URL-encoded)"""
+    return quote(text.lower().replace(" ", "-"), safe="-").lower()
+
+
+def max_combinations():
+    """Total de combinações softwares × softwares × eventos disponíveis"""
+    return len(SOFTWARES) * (len(SOFTWARES) - 1) * len(TIPOS_EVENTOS)
+
+
+def iter_template_batches(existing_keys=frozenset(), target=DEFAULT_TARGET, batch_size=BATCH_SIZE):
+    """Gera as novas linhas (tuplas na ordem de FIELDNAMES) em lotes de até batch_size
+
+    Combinações já presentes em existing_keys ((software_a, software_b,
+    tipo_evento)) são puladas. Caso de uso e tags giram conforme a posição
+    da linha entre as novas, então a saída é determinística.
+    """
+    software_slugs = [slug_fragment(name) for name in SOFTWARES]
+    event_slugs = [slug_fragment(evento) for evento in TIPOS_EVENTOS]
+    event_titles = [evento.title() for evento in TIPOS_EVENTOS]
+    tag_windows = [", ".join(TAGS[i:i + 4]) for i in range(len(TAGS) - 4)]
+    casos = CASOS_USO
+
+    count = 0
+    batch = []
+    for a, software_a in enumerate(SOFTWARES):
+        for b, software_b in enumerate(SOFTWARES):
+            if a == b:
+                continue
+            slug_prefix = f"{software_slugs[a]}-para-{software_slugs[b]}-n8n-"
+            title_prefix = f"{software_a} para {software_b} | Automação de "
+            description_prefix = f"Integre {software_a} com {software_b} para automatizar "
+
+            for e, evento in enumerate(TIPOS_EVENTOS):
+                if (software_a, software_b, evento) in existing_keys:
+                    continue
+
+                slug = slug_prefix + event_slugs[e]
+                caso_uso = casos[count % len(casos)]
+                batch.append((
+                    software_a,
+                    software_b,
+                    evento,
+                    caso_uso,
+                    f"{title_prefix}{event_titles[e]} com n8n",
+                    slug,
+                    f"{description_prefix}{caso_uso} de forma inteligente e confiável",
+                    f"https://n8n.io/workflows/{slug}",
+                    f"Conectar {software_a}|Configurar gatilho de {evento}|Mapear dados|Sincronizar com {software_b}|Testar workflow",
+                    tag_windows[count % len(tag_windows)],
+                ))
+                count += 1
+
+                if count >= target or len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+                    if count >= target:
+                        return
+    if batch:
+        yield batch
+
+
+def shard_of(slug, shards):
+    """Shard determinístico de uma linha (CRC32 do slug)"""
+    return zlib.crc32(slug.encode("utf-8")) % shards
+
+
+def shard_path(output, index, shards):
+    root, ext = os.path.splitext(output)
+    return f"{root}-{index:05d}-of-{shards:05d}{ext}"
 
-print("\n💾 Salvando arquivos CSV...")
-
-for filename in ["automacoes_db.csv", "automacoes_db_merged.csv"]:
-    with open(filename, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(all_entries)
-    
-    size_mb = os.path.getsize(filename) / (1024 * 1024)
-    print(f"   ✅ {filename:30} → {len(all_entries):5} linhas ({size_mb:.1f} MB)")
-
-print("\n" + "="*80)
-print("✅ ESCALADO PARA 10.000+ TEMPLATES!")
-print("="*80)
-print(f"""
+
+def write_csv_outputs(paths, existing_rows, batches, shards=1):
+    """Grava catálogo existente + novas linhas em fluxo; devolve quantas linhas novas
+
+    Com shards == 1 todas as linhas vão para cada arquivo de paths (ex.:
+    automacoes_db.csv e a cópia _merged); com shards > 1, paths tem um
+    arquivo por shard e cada linha vai para o shard do seu slug.
+    """
+    slug_index = FIELDNAMES.index("slug_url")
+    new_count = 0
+    with ExitStack() as stack:
+        writers = [csv.writer(stack.enter_context(open_atomic(path))) for path in paths]
+        for writer in writers:
+            writer.writerow(FIELDNAMES)
+
+        def write(rows):
+            if shards == 1:
+                for writer in writers:
+                    writer.writerows(rows)
+            else:
+                for row in rows:
+                    writers[shard_of(row[slug_index], shards)].writerow(row)
+
+        write([tuple(row.get(name) for name in FIELDNAMES) for row in existing_rows])
+        for batch in batches:
+            write(batch)
+            new_count += len(batch)
+            if new_count % PROGRESS_STEP < len(batch):
+                print(f"   → {new_count} templates gerados...")
+    return new_count
+
+
+def append_to_store(store, batches):
+    """Acrescenta as novas linhas ao store colunar, um arquivo por STORE_BATCH_SIZE linhas"""
+    new_count = 0
+    pending = []
+    for batch in batches:
+        pending.extend(batch)
+        new_count += len(batch)
+        if len(pending) >= STORE_BATCH_SIZE:
+            columnar_catalogue.append_rows(store, FIELDNAMES, pending)
+            pending = []
+            print(f"   → {new_count} templates gerados...")
+    if pending:
+        columnar_catalogue.append_rows(store, FIELDNAMES, pending)
+    return new_count
+
+
+def generate(target=DEFAULT_TARGET, output="automacoes_db.csv", shards=1, merged_copy=True):
+    """Expande o catálogo com até target novos templates; devolve (existentes, novos)"""
+    catalogue_path = resolve_path(output)  # store colunar, se estiver em uso
+    use_store = columnar_catalogue.is_store(catalogue_path)
+    if use_store and shards > 1:
+        raise ValueError("--shards só se aplica à saída CSV (o store colunar já é dividido em arquivos)")
+
+    existing_rows = []
+    if catalogue_path.exists():
+        print(f"📖 Lendo catálogo existente ({catalogue_path.name})...")
+        existing_rows = load_catalogue(catalogue_path).rows
+        print(f"   ✓ {len(existing_rows)} templates existentes carregados")
+    else:
+        print("⚠️  CSV não encontrado, iniciando do zero")
+    existing_keys = {(row["software_a"], row["software_b"], row["tipo_evento"]) for row in existing_rows}
+
+    softwares, eventos = set(SOFTWARES), set(TIPOS_EVENTOS)
+    taken = sum(1 for a, b, evento in existing_keys
+                if a != b and a in softwares and b in softwares and evento in eventos)
+    available = max_combinations() - taken
+    if target > available:
+        print(f"⚠️  Só há {available} combinações novas possíveis (meta: {target})")
+
+    print(f"\n📝 Gerando até {target} templates únicos...")
+    start_time = datetime.now()
+    batches = iter_template_batches(existing_keys, target)
+
+    if use_store:
+        # Store colunar: só as linhas novas são gravadas (novos arquivos no store)
+        new_count = append_to_store(catalogue_path, batches)
+        outputs = [str(catalogue_path)]
+        print("   ℹ️  CSV para outras ferramentas: python columnar_catalogue.py export automacoes_db.parquet")
+    else:
+        if shards > 1:
+            outputs = [shard_path(output, i, shards) for i in range(shards)]
+        else:
+            root, ext = os.path.splitext(output)
+            outputs = [output] + ([f"{root}_merged{ext}"] if merged_copy else [])
+        new_count = write_csv_outputs(outputs, existing_rows, batches, shards)
+
+    elapsed = (datetime.now() - start_time).total_seconds()
+    print(f"\n✅ Gerados {new_count} novos templates únicos em {elapsed:.1f}s")
+    print(f"   Total: {len(existing_rows)} existentes + {new_count} novos = {len(existing_rows) + new_count}")
+    for path in outputs:
+        if os.path.isfile(path):
+            print(f"   ✅ {path:30} ({os.path.getsize(path) / (1024 * 1024):.1f} MB)")
+    return len(existing_rows), new_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Expande o catálogo N8N com combinações de softwares e eventos")
+    parser.add_argument("--target", type=int, default=DEFAULT_TARGET,
+                        help=f"Novos templates a gerar (padrão: {DEFAULT_TARGET}; máximo: {max_combinations()})")
+    parser.add_argument("--output", default="automacoes_db.csv", help="CSV do catálogo (padrão: automacoes_db.csv)")
+    parser.add_argument("--shards", type=int, default=1, help="Dividir a saída em N CSVs determinísticos")
+    parser.add_argument("--no-merged-copy", action="store_true", help="Não gravar a cópia <csv>_merged.csv")
+    args = parser.parse_args()
+    if args.shards < 1:
+        parser.error("--shards precisa ser >= 1")
+
+    print("\n" + "="*80)
+    print("🚀 GERADOR DE TEMPLATES N8N")
+    print("="*80 + "\n")
+
+    try:
+        total_existing, total_new = generate(args.target, args.output, args.shards, not args.no_merged_copy)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print("\n" + "="*80)
+    print("✅ CATÁLOGO EXPANDIDO!")
+    print("="*80)
+    print(f"""
 📊 Estatísticas Finais:
-   • Total de templates: {len(all_entries)}
+   • Total de templates: {total_existing + total_new}
    • Softwares únicos: {len(SOFTWARES)}
    • Tipos de eventos: {len(TIPOS_EVENTOS)}
    • Casos de uso: {len(CASOS_USO)}
    • Tags disponíveis: {len(TAGS)}
-   • Arquivo size: {size_mb:.1f} MB cada
 
 🎯 Próximo passo:
-   python build.py  # Regenerar ~10.000 páginas HTML
+   python build.py  # Regenerar as páginas HTML
 """)
-print("="*80 + "\n")
+    print("="*80 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Camada comum de reescrita de HTML para os pós-processadores em lote
+
+Oferece só as operações que os scripts de SEO/blog realmente usam —
+achar head/main/section por classe ou atributo, inserir HTML antes/depois
+ou dentro de um elemento, trocar um <script> por tipo, ler texto e
+atributos — sobre dois backends:
+
+    • lxml (libxml2, em C): usado quando instalado (está em requirements.txt)
+    • BeautifulSoup + html.parser: fallback puro Python
+
+Uso:
+    doc = parse_html(content)
+    head = doc.head
+    head.append_html('<script>...</script>')
+    for script in doc.find_all('script', attrs={'type': 'application/ld+json'}):
+        data = json.loads(script.get_text())
+    content = doc.serialize()
+
+serialize() devolve o texto original, sem alterações, se nenhum nó foi
+editado. Um documento editado é reserializado inteiro pelo backend, e o
+markup muda também fora do trecho editado:
+
+    • nomes de atributos em minúsculas (viewBox -> viewbox; o parser HTML
+      dos navegadores corrige a caixa dentro de <svg>, então a página
+      renderiza igual);
+    • elementos não-void escritos como <path/> viram <path></path>;
+    • '&' em texto e atributos vira '&amp;';
+    • lxml: caracteres fora de ASCII em href/src são codificados (%XX).
+
+Os scripts em lote só gravam páginas que editaram, então o diff de uma
+passada fica restrito a essas páginas (ver test_html_rewriter.py).
+"""
+
+from abc import ABC, abstractmethod
+
+try:
+    import lxml.html as lxml_html
+except ImportError:
+    lxml_html = None
+
+BACKENDS = ('lxml', 'bs4')
+
+
+def default_backend():
+    """lxml quando disponível, senão BeautifulSoup"""
+    return 'lxml' if lxml_html is not None else 'bs4'
+
+
+def parse_html(html, backend=None):
+    """Faz o parse de um documento HTML completo"""
+    backend = backend or default_backend()
+    if backend == 'lxml':
+        if lxml_html is None:
+            raise ImportError("lxml não instalado (pip install lxml)")
+        return LxmlDocument(html)
+    if backend == 'bs4':
+        return SoupDocument(html)
+    raise ValueError(f"Backend desconhecido: {backend} (opções: {', '.join(BACKENDS)})")
+
+
+def _class_matches(class_value, class_):
+    """class_ é um nome de classe (comparado por token) ou uma função da string completa"""
+    if class_ is None:
+        return True
+    if callable(class_):
+        return bool(class_(class_value))
+    return class_value is not None and class_ in class_value.split()
+
+
+class HtmlDocument(ABC):
+    """Interface comum dos documentos (LxmlDocument e SoupDocument)"""
+
+    backend = None
+
+    @property
+    def head(self):
+        return self.find('head')
+
+    @property
+    def body(self):
+        return self.find('body')
+
+    @abstractmethod
+    def serialize(self):
+        """HTML completo do documento, para gravar de volta
+
+        Sem edições (modified falso), devolve o texto original byte a byte.
+        """
+
+
+# ==================== LXML ====================
+
+def _lxml_fragments(html):
+    """Elementos de um trecho de HTML + o texto que vem antes do primeiro"""
+    stripped = html.lstrip()
+    leading = html[:len(html) - len(stripped)]  # o libxml2 descarta o espaço inicial
+    items = lxml_html.fragments_fromstring(stripped) if stripped else []
+    if items and isinstance(items[0], str):
+        leading += items.pop(0)
+    return leading, items
+
+
+def _lxml_add_text_before(element, text):
+    """Acrescenta texto imediatamente antes de element"""
+    if not text:
+        return
+    previous = element.getprevious()
+    if previous is not None:
+        previous.tail = (previous.tail or '') + text
+    else:
+        parent = element.getparent()
+        parent.text = (parent.text or '') + text
+
+
+class LxmlNode:
+    """Elemento do documento no backend lxml"""
+
+    def __init__(self, element, document=None):
+        self.element = element
+        self.document = document if document is not None else self
+
+    @property
+    def name(self):
+        return self.element.tag
+
+    def _matches(self, element, tag, class_, attrs):
+        if not isinstance(element.tag, str):
+            return False  # comentários e instruções de processamento
+        if tag is not None and element.tag != tag:
+            return False
+        if not _class_matches(element.get('class'), class_):
+            return False
+        return all(element.get(key) == value for key, value in (attrs or {}).items())
+
+    def find_all(self, tag=None, class_=None, attrs=None):
+        return [LxmlNode(el, self.document) for el in self.element.iterdescendants()
+                if self._matches(el, tag, class_, attrs)]
+
+    def find(self, tag=None, class_=None, attrs=None):
+        for el in self.element.iterdescendants():
+            if self._matches(el, tag, class_, attrs):
+                return LxmlNode(el, self.document)
+        return None
+
+    def get(self, attr, default=None):
+        return self.element.get(attr, default)
+
+    def set(self, attr, value):
+        self.document.modified = True
+        self.element.set(attr, value)
+
+    def get_text(self):
+        return self.element.text_content()
+
+    def append_html(self, html):
+        self.document.modified = True
+        leading, items = _lxml_fragments(html)
+        children = list(self.element)
+        if children:
+            children[-1].tail = (children[-1].tail or '') + leading
+        else:
+            self.element.text = (self.element.text or '') + leading
+        self.element.extend(items)
+
+    def prepend_html(self, html):
+        self.document.modified = True
+        leading, items = _lxml_fragments(html)
+        old_text = self.element.text or ''
+        self.element.text = leading
+        for index, item in enumerate(items):
+            self.element.insert(index, item)
+        if items:
+            items[-1].tail = (items[-1].tail or '') + old_text
+        else:
+            self.element.text = leading + old_text
+
+    def insert_before_html(self, html):
+        self.document.modified = True
+        leading, items = _lxml_fragments(html)
+        _lxml_add_text_before(self.element, leading)
+        for item in items:
+            self.element.addprevious(item)
+
+    def insert_after_html(self, html):
+        self.document.modified = True
+        leading, items = _lxml_fragments(html)
+        old_tail = self.element.tail or ''
+        self.element.tail = leading
+        for item in reversed(items):
+            self.element.addnext(item)
+        if items:
+            items[-1].tail = (items[-1].tail or '') + old_tail
+        else:
+            self.element.tail = leading + old_tail
+
+    def replace_html(self, html):
+        self.insert_before_html(html)
+        self.remove()
+
+    def remove(self):
+        """Remove o elemento, mantendo o texto que vinha depois dele"""
+        self.document.modified = True
+        _lxml_add_text_before(self.element, self.element.tail)
+        self.element.getparent().remove(self.element)
+
+    def clear(self):
+        """Remove todo o conteúdo do elemento (mantém tag e atributos)"""
+        self.document.modified = True
+        for child in list(self.element):
+            self.element.remove(child)
+        self.element.text = None
+
+
+class LxmlDocument(LxmlNode, HtmlDocument):
+    """Documento completo no backend lxml"""
+
+    backend = 'lxml'
+
+    def __init__(self, html):
+        super().__init__(lxml_html.document_fromstring(html))
+        self.source = html
+        self.modified = False
+
+    def find_all(self, tag=None, class_=None, attrs=None):
+        return [LxmlNode(el, self.document) for el in self.element.iter()
+                if self._matches(el, tag, class_, attrs)]
+
+    def find(self, tag=None, class_=None, attrs=None):
+        for el in self.element.iter():
+            if self._matches(el, tag, class_, attrs):
+                return LxmlNode(el, self.document)
+        return None
+
+    def serialize(self):
+        if not self.modified:
+            return self.source
+        return lxml_html.tostring(self.element.getroottree(), encoding='unicode')
+
+
+# ==================== BEAUTIFULSOUP ====================
+
+def _soup_fragment(html):
+    from bs4 import BeautifulSoup
+    return list(BeautifulSoup(html, 'html.parser').contents)
+
+
+class SoupNode:
+    """Elemento do documento no backend BeautifulSoup"""
+
+    def __init__(self, tag, document=None):
+        self.tag = tag
+        self.document = document if document is not None else self
+
+    @property
+    def name(self):
+        return self.tag.name
+
+    def _iter_matches(self, tag, class_, attrs):
+        from bs4 import Tag
+        for el in self.tag.descendants:
+            if not isinstance(el, Tag):
+                continue
+            if tag is not None and el.name != tag:
+                continue
+            classes = el.get('class')
+            class_value = ' '.join(classes) if isinstance(classes, list) else classes
+            if not _class_matches(class_value, class_):
+                continue
+            if all(el.get(key) == value for key, value in (attrs or {}).items()):
+                yield el
+
+    def find_all(self, tag=None, class_=None, attrs=None):
+        return [SoupNode(el, self.document) for el in self._iter_matches(tag, class_, attrs)]
+
+    def find(self, tag=None, class_=None, attrs=None):
+        for el in self._iter_matches(tag, class_, attrs):
+            return SoupNode(el, self.document)
+        return None
+
+    def get(self, attr, default=None):
+        value = self.tag.get(attr, default)
+        return ' '.join(value) if isinstance(value, list) else value
+
+    def set(self, attr, value):
+        self.document.modified = True
+        self.tag[attr] = value
+
+    def get_text(self):
+        return self.tag.get_text()
+
+    def append_html(self, html):
+        self.document.modified = True
+        for child in _soup_fragment(html):
+            self.tag.append(child)
+
+    def prepend_html(self, html):
+        self.document.modified = True
+        for index, child in enumerate(_soup_fragment(html)):
+            self.tag.insert(index, child)
+
+    def insert_before_html(self, html):
+        self.document.modified = True
+        for child in _soup_fragment(html):
+            self.tag.insert_before(child)
+
+    def insert_after_html(self, html):
+        self.document.modified = True
+        for child in reversed(_soup_fragment(html)):
+            self.tag.insert_after(child)
+
+    def replace_html(self, html):
+        self.insert_before_html(html)
+        self.remove()
+
+    def remove(self):
+        self.document.modified = True
+        self.tag.extract()
+
+    def clear(self):
+        self.document.modified = True
+        self.tag.clear()
+
+
+class SoupDocument(SoupNode, HtmlDocument):
+    """Documento completo no backend BeautifulSoup"""
+
+    backend = 'bs4'
+
+    def __init__(self, html):
+        from bs4 import BeautifulSoup
+        super().__init__(BeautifulSoup(html, 'html.parser'))
+        self.source = html
+        self.modified = False
+
+    def serialize(self):
+        if not self.modified:
+            return self.source
+        return str(self.tag)
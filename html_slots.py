@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Slots marcados por comentários nas páginas geradas + splice em lote
+
+O template das integrações (template_page.html) delimita os pontos que
+as ferramentas em lote costumam editar com pares de comentários estáveis:
+
+    <!-- slot:jsonld --> ... <!-- /slot:jsonld -->            JSON-LD
+    <!-- slot:meta-description --> ... <!-- /slot:meta-description -->
+    <!-- slot:head-end --><!-- /slot:head-end -->             antes de </head> (GA4)
+    <!-- slot:main-start --><!-- /slot:main-start -->         início de <main>
+    <!-- slot:main-end --><!-- /slot:main-end -->             fim de <main> (Phase 3)
+
+Trocar o conteúdo de um slot não exige parse do HTML: o arquivo é lido via
+mmap, só os bytes entre os marcadores mudam e o resultado é gravado de uma
+vez (rename atômico). O resto da página fica byte a byte igual, então o
+diff no git mostra apenas o trecho alterado.
+
+Uso:
+    python html_slots.py --slot head-end --content-file ga4.html integracoes/
+    python html_slots.py --slot jsonld --content-file schema.html --dry-run integracoes/pagina.html
+    python html_slots.py --list integracoes/pagina.html
+"""
+
+import argparse
+import mmap
+import os
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from build_pool import map_chunks, resolve_jobs
+from output_writer import WriteStats, write_atomic
+
+SLOT_NAME_PATTERN = re.compile(r'<!-- slot:([\w-]+) -->')
+
+
+def slot_markers(name):
+    """Comentários de abertura e fechamento de um slot"""
+    return f'<!-- slot:{name} -->', f'<!-- /slot:{name} -->'
+
+
+def wrap_slot(name, content=''):
+    """Conteúdo já envolto pelos marcadores do slot (para templates/geradores)"""
+    start, end = slot_markers(name)
+    return f'{start}{content}{end}'
+
+
+def find_slot(data, name):
+    """(início, fim) do conteúdo de um slot em str, bytes ou mmap; None se ausente"""
+    start_marker, end_marker = slot_markers(name)
+    if not isinstance(data, str):
+        start_marker, end_marker = start_marker.encode('utf-8'), end_marker.encode('utf-8')
+    start = data.find(start_marker)
+    if start == -1:
+        return None
+    start += len(start_marker)
+    end = data.find(end_marker, start)
+    if end == -1:
+        return None
+    return start, end
+
+
+def get_slot(text, name):
+    """Conteúdo atual de um slot (ou None)"""
+    span = find_slot(text, name)
+    return None if span is None else text[span[0]:span[1]]
+
+
+def fill_slot(text, name, content):
+    """Texto com o conteúdo do slot substituído (None se o slot não existe)"""
+    span = find_slot(text, name)
+    if span is None:
+        return None
+    return text[:span[0]] + content + text[span[1]:]
+
+
+def list_slots(text):
+    """Nomes dos slots presentes, na ordem do documento"""
+    return SLOT_NAME_PATTERN.findall(text)
+
+
+def splice_file(path, slots, stats=None, dry_run=False):
+    """Substitui o conteúdo de um ou mais slots de um arquivo
+
+    slots é um dict {nome: conteúdo}. Retorna 'written', 'unchanged' ou
+    'missing' (algum slot não existe no arquivo; nada é gravado).
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return 'missing'
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            edits = []
+            for name, content in slots.items():
+                span = find_slot(data, name)
+                if span is None:
+                    return 'missing'
+                new = content.encode('utf-8')
+                if data[span[0]:span[1]] != new:
+                    edits.append((span, new))
+
+            if not edits:
+                if stats is not None:
+                    stats.unchanged += 1
+                    stats.bytes_unchanged += size
+                return 'unchanged'
+
+            parts = []
+            position = 0
+            for (start, end), new in sorted(edits):
+                parts.append(data[position:start])
+                parts.append(new)
+                position = end
+            parts.append(data[position:])
+            output = b''.join(parts)
+        mode = os.fstat(f.fileno()).st_mode & 0o777
+
+    if not dry_run:
+        write_atomic(path, output, mode)
+    if stats is not None:
+        stats.written += 1
+        stats.bytes_written += len(output)
+    return 'written'
+
+
+# ==================== LOTE ====================
+
+_worker_slots = {}
+_worker_dry_run = False
+
+
+def init_splice_worker(slots, dry_run):
+    """Guarda os slots e opções de cada processo do pool"""
+    global _worker_slots, _worker_dry_run
+    _worker_slots = slots
+    _worker_dry_run = dry_run
+
+
+def splice_chunk(paths):
+    """Aplica o splice a um lote de arquivos; devolve (WriteStats, arquivos sem o slot)"""
+    stats = WriteStats()
+    missing = []
+    for path in paths:
+        if splice_file(path, _worker_slots, stats, _worker_dry_run) == 'missing':
+            missing.append(path)
+    return stats, missing
+
+
+def collect_html_files(paths):
+    """Expande diretórios em seus *.html (não recursivo)"""
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(str(p) for p in path.glob('*.html')))
+        else:
+            files.append(str(path))
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Atualiza slots marcados nas páginas geradas sem parse de HTML')
+    parser.add_argument('paths', nargs='*', default=['integracoes'], help='Arquivos ou diretórios (padrão: integracoes/)')
+    parser.add_argument('--slot', help='Nome do slot (ex.: head-end, jsonld, main-end)')
+    parser.add_argument('--content', help='Novo conteúdo do slot')
+    parser.add_argument('--content-file', help='Arquivo com o novo conteúdo do slot')
+    parser.add_argument('--list', action='store_true', help='Listar os slots de cada arquivo')
+    parser.add_argument('--jobs', type=int, default=1, help='Processos (0 = todos os núcleos)')
+    parser.add_argument('--dry-run', action='store_true', help='Não gravar, só contar o que mudaria')
+    args = parser.parse_args()
+
+    files = collect_html_files(args.paths)
+
+    if args.list:
+        for path in files:
+            with open(path, 'r', encoding='utf-8') as f:
+                print(f"{path}: {', '.join(list_slots(f.read())) or '(sem slots)'}")
+        return
+
+    if not args.slot or (args.content is None) == (args.content_file is None):
+        parser.error('informe --slot e exatamente um de --content / --content-file')
+
+    if args.content_file:
+        with open(args.content_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+    else:
+        content = args.content
+
+    print(f"🧩 Slot '{args.slot}' em {len(files)} arquivos" + (" (dry-run)" if args.dry_run else ""))
+    start_time = datetime.now()
+    stats = WriteStats()
+    missing = []
+    chunks = map_chunks(splice_chunk, files, resolve_jobs(args.jobs),
+                        initializer=init_splice_worker, initargs=({args.slot: content}, args.dry_run))
+    for chunk_stats, chunk_missing in chunks:
+        stats.add(chunk_stats)
+        missing.extend(chunk_missing)
+
+    elapsed = (datetime.now() - start_time).total_seconds()
+    print(f"✅ {stats.summary()} em {elapsed:.2f}s")
+    if missing:
+        print(f"⚠️  {len(missing)} arquivos sem o slot '{args.slot}' (regenere com build.py):")
+        for path in missing[:10]:
+            print(f"   • {path}")
+        if stats.written + stats.unchanged == 0:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -6,7 +6,11 @@ Melhores práticas: caching, content negotiation, performance
 """
 
 import os
+import hashlib
 import mimetypes
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from flask import Flask, request, send_file, render_template_string, make_response
 from werkzeug.exceptions import NotFound, BadRequest
@@ -16,7 +20,13 @@ from i18n_service import (
     GeoLocationDetector,
     Language,
     Region,
+    SHARED_ASSETS_DIR,
+    TRANSLATED_DIR,
+    TranslationMemory,
+    shared_asset_urls,
 )
+from output_writer import write_atomic
+from site_manifest import MANIFEST_FILE, load_site_manifest
 
 # ============================================================================
 # CONFIGURAÇÃO
@@ -33,6 +43,15 @@ class Config:
     CACHE_DURATION_ASSETS = 86400   # 1 dia para assets
     CACHE_DURATION_DEFAULT = 300    # 5 min padrão
     
+    # Manifesto do site (site_manifest.json): intervalo mínimo entre checagens de mtime
+    SITE_MANIFEST_CHECK_INTERVAL = 30
+    
+    # Tradução sob demanda: páginas sem variante em translated/<lang>/ são
+    # traduzidas do original na primeira requisição e guardadas em um LRU
+    TRANSLATE_ON_DEMAND = os.getenv("I18N_ON_DEMAND", "False").lower() == "true"
+    TRANSLATION_CACHE_MAX_BYTES = int(os.getenv("I18N_CACHE_MAX_MB", "64")) * 1024 * 1024
+    TRANSLATION_CACHE_DIR = os.getenv("I18N_CACHE_DIR")  # spill em disco (opcional)
+    
     # CORS
     ALLOWED_ORIGINS = [
         "localhost:5000",
@@ -47,6 +66,117 @@ class Config:
     GZIP_COMPRESSION = True
     GZIP_LEVEL = 6
 
+def site_manifest_mtime():
+    """mtime do site_manifest.json (None se não existe)"""
+    try:
+        return (Config.BASE_DIR / MANIFEST_FILE).stat().st_mtime_ns
+    except OSError:
+        return None
+
+# ============================================================================
+# CACHE DE TRADUÇÕES SOB DEMANDA
+# ============================================================================
+
+class TranslationCache:
+    """
+    LRU limitado por bytes de páginas traduzidas na hora
+    
+    Chave: (arquivo, idioma); cada entrada guarda o mtime_ns do original e é
+    descartada quando o original muda. Páginas que saem da memória vão para
+    spill_dir (se configurado), de onde voltam sem traduzir de novo; o
+    arquivo de spill recebe o mtime do original, que é conferido na leitura,
+    e o nome inclui a versão da memória de tradução do idioma, então spills
+    de outra versão (de antes de um restart) não são reaproveitados.
+    """
+    
+    def __init__(self, translator, max_bytes: int, spill_dir=None):
+        self.translator = translator
+        self.max_bytes = max_bytes
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        if self.spill_dir:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+        self.entries = OrderedDict()  # (arquivo, idioma) -> (mtime_ns, bytes)
+        self.size = 0
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "spill_hits": 0, "misses": 0, "evictions": 0}
+    
+    def spill_path(self, key) -> Path:
+        filepath, language = key
+        digest = hashlib.sha256(filepath.encode('utf-8')).hexdigest()[:24]
+        return self.spill_dir / f"{language.value}-{TranslationMemory.version(language)}-{digest}.html"
+    
+    def get(self, source_path: Path, filepath: str, language: Language) -> bytes:
+        """Página traduzida (da memória, do spill ou traduzida agora)"""
+        key = (filepath, language)
+        try:
+            mtime_ns = source_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            # removido entre locate_file e aqui
+            raise NotFound(f"Arquivo não encontrado: {filepath}")
+        
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                if entry[0] == mtime_ns:
+                    self.entries.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return entry[1]
+                # Original mudou: descarta a versão antiga
+                self.size -= len(self.entries.pop(key)[1])
+        
+        data = None
+        if self.spill_dir:
+            path = self.spill_path(key)
+            try:
+                if path.stat().st_mtime_ns == mtime_ns:
+                    data = path.read_bytes()
+                    self.stats["spill_hits"] += 1
+            except FileNotFoundError:
+                pass
+        if data is None:
+            try:
+                with open(source_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except FileNotFoundError:
+                raise NotFound(f"Arquivo não encontrado: {filepath}")
+            data = self.translator.translate_html(shared_asset_urls(content, filepath), language).encode('utf-8')
+            self.stats["misses"] += 1
+        
+        with self.lock:
+            self._put(key, mtime_ns, data)
+        return data
+    
+    def _put(self, key, mtime_ns: int, data: bytes):
+        if key in self.entries:
+            self.size -= len(self.entries.pop(key)[1])
+        if len(data) > self.max_bytes:
+            self._spill(key, mtime_ns, data)
+            return
+        self.entries[key] = (mtime_ns, data)
+        self.size += len(data)
+        while self.size > self.max_bytes:
+            old_key, (old_mtime_ns, old_data) = self.entries.popitem(last=False)
+            self.size -= len(old_data)
+            self.stats["evictions"] += 1
+            self._spill(old_key, old_mtime_ns, old_data)
+    
+    def _spill(self, key, mtime_ns: int, data: bytes):
+        if not self.spill_dir:
+            return
+        path = self.spill_path(key)
+        try:
+            if path.stat().st_mtime_ns == mtime_ns:
+                return  # já está no disco
+        except FileNotFoundError:
+            pass
+        write_atomic(path, data)
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    
+    def info(self) -> dict:
+        with self.lock:
+            return {"entries": len(self.entries), "bytes": self.size,
+                    "max_bytes": self.max_bytes, **self.stats}
+
 # ============================================================================
 # APLICAÇÃO FLASK
 # ============================================================================
@@ -60,6 +190,10 @@ def create_app():
     generator = TranslationGenerator(base_dir=str(Config.BASE_DIR))
     i18n = I18nMiddleware(generator)
     geo_detector = GeoLocationDetector()
+    translation_cache = None
+    if Config.TRANSLATE_ON_DEMAND:
+        translation_cache = TranslationCache(generator.translator, Config.TRANSLATION_CACHE_MAX_BYTES,
+                                             Config.TRANSLATION_CACHE_DIR)
     
     # ========================================================================
     # HELPERS
@@ -145,16 +279,23 @@ def create_app():
         return serve_file('index.html', Language.EN)
     
     @app.route('/<lang_code>/<path:filepath>')
+    @app.route(f'/{TRANSLATED_DIR}/<lang_code>/<path:filepath>')
     def serve_translated_file(lang_code: str, filepath: str):
         """
         Rota genérica para arquivos traduzidos
-        Exemplo: /en/integracoes/google-sheets.html
+        Exemplo: /en/integracoes/google-sheets.html ou, no mesmo layout do
+        site estático, /translated/en/integracoes/google-sheets.html
         """
         try:
             language = Language[lang_code.upper()]
         except (KeyError, ValueError):
             raise NotFound(f"Idioma não suportado: {lang_code}")
         
+        # Assets são os mesmos para todos os idiomas: uma URL só, um cache só
+        if filepath.startswith(f'{SHARED_ASSETS_DIR}/'):
+            from flask import redirect
+            return redirect(f'/{filepath}', code=301)
+        
         return serve_file(filepath, language)
     
     @app.route('/integracoes/<filename>')
@@ -168,10 +309,30 @@ def create_app():
         """Serve páginas de integração em inglês"""
         return serve_file(f'integracoes/{filename}', Language.EN)
     
-    def serve_file(filepath: str, language: Language):
+    site_state = {'manifest': generator.site, 'checked': time.monotonic(), 'mtime_ns': site_manifest_mtime()}
+    
+    def get_site_manifest():
+        """Manifesto do site, recarregado se o arquivo mudou (checado a cada poucos segundos)"""
+        now = time.monotonic()
+        if now - site_state['checked'] >= Config.SITE_MANIFEST_CHECK_INTERVAL:
+            site_state['checked'] = now
+            mtime_ns = site_manifest_mtime()
+            if mtime_ns != site_state['mtime_ns']:
+                site_state['manifest'] = load_site_manifest(Config.BASE_DIR)
+                site_state['mtime_ns'] = mtime_ns
+        return site_state['manifest']
+    
+    def locate_file(filepath: str, language: Language):
         """
-        Serve arquivo com cache e compressão
+        (caminho no disco, idioma servido) de um arquivo, ou NotFound
+        Arquivos do manifesto do site dispensam resolve()/exists() no disco
         """
+        site = get_site_manifest()
+        if site.get(filepath) is not None:
+            if language != Language.PT and not site.has_variant(filepath, language.value):
+                language = Language.PT
+            return Config.BASE_DIR / i18n.get_file_path(language, filepath), language
+        
         file_path = i18n.get_file_path(language, filepath)
         full_path = Config.BASE_DIR / file_path
         
@@ -189,14 +350,27 @@ def create_app():
             if language != Language.PT:
                 fallback_path = Config.BASE_DIR / filepath
                 if fallback_path.exists():
-                    return serve_file(filepath, Language.PT)
+                    return locate_file(filepath, Language.PT)
             raise NotFound(f"Arquivo não encontrado: {filepath}")
+        return full_path, language
+    
+    def serve_file(filepath: str, language: Language):
+        """
+        Serve arquivo com cache e compressão
+        """
+        full_path, served_language = locate_file(filepath, language)
         
-        # Servir arquivo
-        response = make_response(send_file(
-            str(full_path),
-            mimetype=get_mimetype(str(full_path))
-        ))
+        # Servir arquivo (ou, sem variante pré-gerada, traduzir o original na hora)
+        if (translation_cache is not None and served_language != language
+                and filepath.endswith('.html')):
+            response = make_response(translation_cache.get(full_path, filepath, language))
+            response.mimetype = 'text/html'
+        else:
+            language = served_language
+            response = make_response(send_file(
+                str(full_path),
+                mimetype=get_mimetype(str(full_path))
+            ))
         
         # Adicionar language cookie
         response.set_cookie('language', language.value, max_age=31536000, path='/')
@@ -269,9 +443,19 @@ def create_app():
         if manifest_path.exists():
             import json
             with open(manifest_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                manifest = json.load(f)
+            # Entradas por arquivo (build incremental) não interessam ao front-end
+            manifest.pop('files', None)
+            return manifest
         return {'error': 'Manifesto não encontrado'}, 404
     
+    @app.route('/api/translation-cache')
+    def api_translation_cache():
+        """Estado do cache de traduções sob demanda"""
+        if translation_cache is None:
+            return {'enabled': False}
+        return {'enabled': True, **translation_cache.info()}
+    
     @app.route('/language-selector.html')
     def language_selector():
         """Página com seletor de idioma"""
@@ -406,6 +590,20 @@ def main():
         action="store_true",
         help="Modo debug"
     )
+    parser.add_argument(
+        "--on-demand",
+        action="store_true",
+        help="Traduzir na hora páginas sem variante em translated/ (padrão: $I18N_ON_DEMAND)"
+    )
+    parser.add_argument(
+        "--cache-mb",
+        type=int,
+        help="Tamanho máximo do cache de traduções em memória, em MB (padrão: $I18N_CACHE_MAX_MB ou 64)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Diretório para o spill em disco do cache de traduções (padrão: $I18N_CACHE_DIR)"
+    )
     parser.add_argument(
         "--generate-translations",
         action="store_true",
@@ -425,6 +623,13 @@ def main():
         generator.generate_translation_manifest()
         print("✅ Traduções geradas com sucesso")
     
+    if args.on_demand:
+        Config.TRANSLATE_ON_DEMAND = True
+    if args.cache_mb is not None:
+        Config.TRANSLATION_CACHE_MAX_BYTES = args.cache_mb * 1024 * 1024
+    if args.cache_dir:
+        Config.TRANSLATION_CACHE_DIR = args.cache_dir
+    
     # Criar e iniciar app
     app = create_app()
     
@@ -434,6 +639,7 @@ def main():
     Host: {args.host}
     Port: {args.port}
     Debug: {args.debug}
+    Tradução sob demanda: {Config.TRANSLATE_ON_DEMAND}
     
     URLs:
     - http://{args.host}:{args.port}/                 (Auto-detect)
@@ -7,7 +7,9 @@ Melhores práticas: gettext, locale detection, content negotiation
 
 import os
 import json
+import posixpath
 import re
+import shutil
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from pathlib import Path
@@ -15,6 +17,10 @@ from enum import Enum
 from datetime import datetime
 import hashlib
 
+from build_pool import map_chunks, resolve_jobs
+from output_writer import write_atomic, write_if_changed
+from site_manifest import load_site_manifest, section_files
+
 # ============================================================================
 # CONFIGURAÇÃO GLOBAL
 # ============================================================================
@@ -357,6 +363,10 @@ class TranslationMemory:
         },
     }
     
+    # Tabelas compiladas por idioma (ver table())
+    _tables: Dict[Language, Dict[str, str]] = {}
+    _versions: Dict[Language, str] = {}
+    
     @staticmethod
     def translate(text: str, language: Language) -> str:
         """
@@ -370,6 +380,32 @@ class TranslationMemory:
             return TranslationMemory.TRANSLATIONS[text].get(language, text)
         
         return text  # Fallback ao original
+    
+    @classmethod
+    def table(cls, language: Language) -> Dict[str, str]:
+        """
+        Tabela texto PT -> texto traduzido de um idioma, compilada uma vez
+        Só entram as entradas que mudam o texto (as demais não precisam de lookup)
+        """
+        if language not in cls._tables:
+            cls._tables[language] = {
+                text: translations[language]
+                for text, translations in cls.TRANSLATIONS.items()
+                if translations.get(language, text) != text
+            }
+        return cls._tables[language]
+    
+    @classmethod
+    def version(cls, language: Language) -> str:
+        """
+        Hash da tabela de um idioma + versão do motor de tradução
+        Muda só quando a tradução desse idioma pode mudar (manifesto incremental)
+        """
+        if language not in cls._versions:
+            payload = json.dumps([HTMLTranslator.ENGINE_VERSION, sorted(cls.table(language).items())],
+                                 ensure_ascii=False)
+            cls._versions[language] = hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+        return cls._versions[language]
 
 # ============================================================================
 # PROCESSADOR DE HTML
@@ -378,16 +414,34 @@ class TranslationMemory:
 class HTMLTranslator:
     """
     Traduz conteúdo HTML mantendo estrutura e IDs
-    Usa regex para preservar tags e atributos
+    Uma única passada pelo documento, token a token (ver TOKEN_PATTERN)
     """
     
+    # Incrementar quando translate_html passar a gerar outra saída
+    # (invalida as traduções registradas em translated/manifest.json)
+    ENGINE_VERSION = 4
+    
+    # Elementos cujo conteúdo nunca é traduzido
+    PRESERVE_ELEMENTS = ('code', 'pre', 'script', 'style', 'textarea')
+    
+    # Atributos traduzidos (content só em <meta>: description, og:title...)
+    TRANSLATABLE_ATTRIBUTES = ('placeholder', 'title', 'alt', 'aria-label')
+    
+    # Tokens do documento, na ordem em que aparecem:
+    #   1. elemento preservado inteiro, ou comentário -> copiado como está
+    #   2. tag                                        -> atributos traduzíveis
+    #   3. texto entre tags                           -> lookup do texto sem espaços das pontas
+    TOKEN_PATTERN = re.compile(
+        r'(<(' + '|'.join(PRESERVE_ELEMENTS) + r')\b[^>]*>.*?</\2\s*>|<!--.*?-->)'
+        r'|(<[^>]*>)'
+        r'|([^<]+)',
+        re.S | re.I
+    )
+    ATTRIBUTE_PATTERN = re.compile(r'(\s(?:' + '|'.join(TRANSLATABLE_ATTRIBUTES) + r')=")([^"]*)(")', re.I)
+    META_ATTRIBUTE_PATTERN = re.compile(r'(\s(?:content|' + '|'.join(TRANSLATABLE_ATTRIBUTES) + r')=")([^"]*)(")', re.I)
+    
     def __init__(self, translation_memory: TranslationMemory):
         self.translations = translation_memory
-        # Elementos que nunca devem ser traduzidos
-        self.preserve_tags = {
-            'code', 'pre', 'script', 'style', 'meta', 
-            'link', 'title', 'id', 'class', 'data-'
-        }
     
     def should_skip_text(self, text: str) -> bool:
         """Verifica se texto deve ser pulado"""
@@ -405,76 +459,168 @@ class HTMLTranslator:
     def translate_html(self, html_content: str, language: Language) -> str:
         """
         Traduz conteúdo HTML preservando estrutura
+        
+        Custo linear no tamanho da página: cada token é visitado uma vez e
+        cada texto/atributo custa um lookup no dicionário do idioma. Os
+        espaços em volta dos textos são mantidos.
         """
         if language == Language.PT:
             return html_content  # Português é original
         
-        result = html_content
-        
-        # 1. Traduzir atributos de títulos e placeholders
-        # <title>...</title>
-        result = re.sub(
-            r'<title>([^<]+)</title>',
-            lambda m: f'<title>{self.translations.translate(m.group(1), language)}</title>',
-            result
-        )
-        
-        # meta name="description"
-        result = re.sub(
-            r'(content=")([^"]+)(")',
-            lambda m: m.group(1) + self.translations.translate(m.group(2), language) + m.group(3)
-            if 'description' in result[max(0, result.rfind(m.group(0), 0, 200)-200):result.rfind(m.group(0))]
-            else m.group(0),
-            result
-        )
+        table = self.translations.table(language)
+        if not table:
+            return html_content
         
-        # 2. Traduzir textos entre tags (mas não inside <code>, <script>, etc)
-        # Pattern: >texto< mas não dentro de tags especiais
-        def translate_text_nodes(match):
-            tag = match.group(1)
-            text = match.group(2)
-            end_tag = match.group(3)
-            
-            # Verificar se está dentro de tag preservada
-            if any(skip in tag.lower() or skip in end_tag.lower() 
-                   for skip in self.preserve_tags):
-                return match.group(0)
-            
-            if self.should_skip_text(text):
-                return match.group(0)
-            
-            translated = self.translations.translate(text.strip(), language)
-            whitespace_prefix = len(text) - len(text.lstrip())
-            whitespace_suffix = len(text) - len(text.rstrip())
-            
-            return (tag + 
-                    ' ' * whitespace_prefix + 
-                    translated + 
-                    ' ' * whitespace_suffix + 
-                    end_tag)
-        
-        result = re.sub(
-            r'(>)\s*([^<>]+?)\s*(<)',
-            translate_text_nodes,
-            result
-        )
+        def translate_value(text):
+            key = text.strip()
+            translated = table.get(key)
+            if translated is None or self.should_skip_text(key):
+                return text
+            start = text.index(key)
+            return text[:start] + translated + text[start + len(key):]
         
-        # 3. Traduzir atributos onclick e data-*
-        def translate_onclick(match):
-            full = match.group(0)
-            # Pular funções e variáveis JavaScript
-            if 'switchView' in full or 'function' in full:
-                return full
-            return full
+        def translate_attribute(match):
+            return match.group(1) + translate_value(match.group(2)) + match.group(3)
         
-        result = re.sub(r'onclick="([^"]*)"', translate_onclick, result)
+        def translate_token(match):
+            tag = match.group(3)
+            if tag is not None:
+                if '="' not in tag:
+                    return tag
+                pattern = self.META_ATTRIBUTE_PATTERN if tag[1:5].lower() == 'meta' else self.ATTRIBUTE_PATTERN
+                return pattern.sub(translate_attribute, tag)
+            text = match.group(4)
+            if text is not None:
+                return translate_value(text)
+            return match.group(1)
         
-        return result
+        return self.TOKEN_PATTERN.sub(translate_token, html_content)
 
 # ============================================================================
 # GERADOR DE ARQUIVOS TRADUCIDOS
 # ============================================================================
 
+TRANSLATED_DIR = "translated"
+TRANSLATION_MANIFEST = "manifest.json"
+
+# Árvore de assets única, compartilhada por todos os idiomas
+SHARED_ASSETS_DIR = "assets"
+
+# src/href relativos (sem esquema, sem "/" nem "#" no início)
+RELATIVE_URL_PATTERN = re.compile(r'(\s(?:src|href)=")(?![a-zA-Z][a-zA-Z0-9+.-]*:|/|#)([^"?#]+)')
+
+def shared_asset_urls(html_content: str, source_file: str) -> str:
+    """
+    Aponta os src/href relativos para assets/ à árvore compartilhada
+    
+    As traduções são publicadas como arquivos estáticos em
+    translated/<lang>/<arquivo> (GitHub Pages), dois níveis abaixo do
+    original, então "../assets/js/app.js" em integracoes/x.html vira
+    "../../../assets/js/app.js": a mesma URL /assets/ do original, em cache
+    uma vez para todos os idiomas, sem copiar assets/ para translated/<lang>/.
+    O servidor Flask serve o mesmo layout em /translated/<lang>/.
+    """
+    source_dir = posixpath.dirname(source_file)
+    translated_dir = posixpath.join(TRANSLATED_DIR, "_", source_dir)  # "_" = diretório do idioma
+    prefix = SHARED_ASSETS_DIR + "/"
+    
+    def rewrite(match):
+        target = posixpath.normpath(posixpath.join(source_dir, match.group(2)))
+        if not target.startswith(prefix):
+            return match.group(0)
+        return match.group(1) + posixpath.relpath(target, translated_dir)
+    
+    return RELATIVE_URL_PATTERN.sub(rewrite, html_content)
+
+def translate_page(translator: HTMLTranslator,
+                   base_dir: Path,
+                   source_file: str,
+                   languages: List[Language],
+                   previous: Optional[Dict] = None,
+                   force: bool = True) -> Tuple[Dict, Dict[str, int], List[str]]:
+    """
+    Lê a página uma vez e grava em translated/<lang>/ as traduções pedidas
+    
+    Sem force, um idioma é pulado quando a entrada anterior do manifesto
+    tem o mesmo hash do original e da memória de tradução e o arquivo
+    traduzido existe.
+    Se o original mudou, as saídas anteriores de idiomas não pedidos neste
+    run continuam na entrada, marcadas como "stale" (o arquivo traduzido
+    é do original antigo).
+    Retorna: (entrada do manifesto, {código_idioma: bytes gravados}, [códigos pulados])
+    """
+    with open(base_dir / source_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    source_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+    content = shared_asset_urls(content, source_file)
+    
+    outputs = dict(previous.get("outputs", {})) if previous else {}
+    if previous and previous.get("source_hash") != source_hash:
+        outputs = {code: dict(output, stale=True) for code, output in outputs.items()}
+    entry = {"source_hash": source_hash, "outputs": outputs}
+    
+    written = {}
+    skipped = []
+    for language in languages:
+        if language == Language.PT:
+            continue  # Português: o original
+        output_path = base_dir / TRANSLATED_DIR / language.value / source_file
+        memory_hash = TranslationMemory.version(language)
+        output = outputs.get(language.value)
+        if (not force and output and not output.get("stale")
+                and output.get("memory_hash") == memory_hash and output_path.exists()):
+            skipped.append(language.value)
+            continue
+        data = translator.translate_html(content, language).encode('utf-8')
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        write_if_changed(output_path, data)
+        outputs[language.value] = {
+            "memory_hash": memory_hash,
+            "output_hash": hashlib.sha256(data).hexdigest(),
+        }
+        written[language.value] = len(data)
+    return entry, written, skipped
+
+# Tradutor e idiomas de cada processo do pool (ver init_translation_worker)
+_worker_translator = None
+_worker_base_dir = None
+_worker_languages = ()
+_worker_force = True
+
+def init_translation_worker(base_dir: str, language_codes: Tuple[str, ...], force: bool = True):
+    """Compila as tabelas de tradução uma vez por processo"""
+    global _worker_translator, _worker_base_dir, _worker_languages, _worker_force
+    _worker_translator = HTMLTranslator(TranslationMemory())
+    _worker_base_dir = Path(base_dir)
+    _worker_languages = [Language(code) for code in language_codes]
+    _worker_force = force
+    for language in _worker_languages:
+        TranslationMemory.version(language)
+
+def translate_chunk(items: List[Tuple[str, Optional[Dict]]]) -> List[Tuple]:
+    """
+    Traduz um lote de (arquivo, entrada anterior do manifesto): cada arquivo é lido uma vez
+    Retorna: [(arquivo, entrada nova, {código_idioma: bytes}, [códigos pulados], erro ou None)]
+    """
+    results = []
+    for source_file, previous in items:
+        try:
+            entry, written, skipped = translate_page(_worker_translator, _worker_base_dir, source_file,
+                                                     _worker_languages, previous, _worker_force)
+        except Exception as e:
+            results.append((source_file, previous, {}, [], str(e)))
+            continue
+        results.append((source_file, entry, written, skipped, None))
+    return results
+
+def load_translation_manifest(translated_dir: Path) -> Dict:
+    """Manifesto de tradução do último run (ou vazio)"""
+    try:
+        with open(translated_dir / TRANSLATION_MANIFEST, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
 class TranslationGenerator:
     """
     Gera arquivos HTML traduzidos em múltiplos idiomas
@@ -483,15 +629,60 @@ class TranslationGenerator:
     
     def __init__(self, base_dir: str = "."):
         self.base_dir = Path(base_dir)
-        self.translated_dir = self.base_dir / "translated"
+        self.translated_dir = self.base_dir / TRANSLATED_DIR
         self.translator = HTMLTranslator(TranslationMemory())
         self.geo_detector = GeoLocationDetector()
+        self.site = load_site_manifest(self.base_dir)
+        # Entradas por arquivo: hash do original + (hash da memória, hash da saída) por idioma
+        self.files = load_translation_manifest(self.translated_dir).get("files", {})
         self.stats = {
             "files_processed": 0,
             "files_translated": 0,
+            "files_unchanged": 0,
+            "files_removed": 0,
             "total_translations": 0,
+            "languages": {},
         }
     
+    def record_translation(self, source_file: str, language_code: str, size: int):
+        """Soma uma variante gravada às estatísticas e ao manifesto do site"""
+        language_stats = self.stats["languages"].setdefault(language_code, {"files": 0, "bytes": 0})
+        language_stats["files"] += 1
+        language_stats["bytes"] += size
+        self.stats["files_translated"] += 1
+        self.site.add_language(Path(source_file).as_posix(), language_code)
+    
+    def record_page(self, source_file: str, entry: Dict, written: Dict[str, int], skipped: List[str]):
+        """Registra o resultado de translate_page (manifesto, estatísticas, manifesto do site)"""
+        self.files[source_file] = entry
+        self.stats["files_processed"] += 1
+        for language_code, size in written.items():
+            self.record_translation(source_file, language_code, size)
+        for language_code in skipped:
+            self.stats["files_unchanged"] += 1
+            self.site.add_language(source_file, language_code)
+        for language_code, output in entry.get("outputs", {}).items():
+            if output.get("stale"):
+                self.site.remove_language(source_file, language_code)
+    
+    def remove_orphans(self, directory: str, current_files: List[str]) -> int:
+        """Apaga as traduções de páginas de directory/ que não existem mais"""
+        prefix = f"{directory}/"
+        current = set(current_files)
+        orphans = [path for path in self.files if path.startswith(prefix) and path not in current]
+        # Todos os idiomas conhecidos, não só os da entrada: um run anterior
+        # pode ter gravado idiomas que não estão mais no manifesto
+        language_codes = {lang.value for lang in Language if lang != Language.PT}
+        for source_file in orphans:
+            language_codes.update(self.files.pop(source_file).get("outputs", {}))
+            for language_code in sorted(language_codes):
+                output_path = self.translated_dir / language_code / source_file
+                if output_path.exists():
+                    output_path.unlink()
+                    print(f"🗑️  Removido: {output_path}")
+            self.stats["files_removed"] += 1
+        return len(orphans)
+    
     def setup_directories(self):
         """Cria estrutura de diretórios para traduções"""
         languages = [Language.EN, Language.ES, Language.FR]
@@ -500,20 +691,22 @@ class TranslationGenerator:
             lang_dir = self.translated_dir / lang.value
             lang_dir.mkdir(parents=True, exist_ok=True)
             
-            # Copiar estrutura de assets
-            assets_src = self.base_dir / "assets"
-            assets_dst = lang_dir / "assets"
-            if assets_src.exists() and not assets_dst.exists():
-                import shutil
-                shutil.copytree(assets_src, assets_dst)
+            # Assets não são mais copiados: as páginas traduzidas apontam
+            # para assets/ (ver shared_asset_urls); cópias antigas são removidas
+            assets_copy = lang_dir / SHARED_ASSETS_DIR
+            if assets_copy.is_dir() and not assets_copy.is_symlink():
+                shutil.rmtree(assets_copy)
+                print(f"🗑️  Removida cópia de assets: {assets_copy}")
         
         print(f"✅ Estrutura de diretórios criada em {self.translated_dir}")
     
     def translate_file(self, 
                       source_file: str,
-                      languages: List[Language] = None) -> Dict[Language, str]:
+                      languages: List[Language] = None,
+                      incremental: bool = False) -> Dict[Language, str]:
         """
         Traduz um arquivo HTML para múltiplos idiomas
+        Com incremental=True, idiomas com tradução atual no manifesto são pulados
         Retorna: {Language: caminho_arquivo_traduzido}
         """
         if languages is None:
@@ -523,53 +716,63 @@ class TranslationGenerator:
         if not source_path.exists():
             raise FileNotFoundError(f"Arquivo não encontrado: {source_path}")
         
-        with open(source_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        source_file = Path(source_file).as_posix()
+        entry, written, skipped = translate_page(self.translator, self.base_dir, source_file, languages,
+                                                 self.files.get(source_file), force=not incremental)
+        self.record_page(source_file, entry, written, skipped)
         
-        self.stats["files_processed"] += 1
-        results = {}
-        
-        for language in languages:
-            if language == Language.PT:
-                # Português: copiar original
-                results[language] = str(source_path)
-                continue
-            
-            # Traduzir
-            translated_content = self.translator.translate_html(content, language)
-            
-            # Salvar
-            lang_dir = self.translated_dir / language.value
-            output_path = lang_dir / source_file
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(translated_content)
-            
-            results[language] = str(output_path)
-            self.stats["files_translated"] += 1
-        
-        return results
+        return {
+            language: str(source_path if language == Language.PT
+                          else self.translated_dir / language.value / source_file)
+            for language in languages
+        }
     
-    def translate_integrations(self, integrations_dir: str = "integracoes"):
+    def translate_integrations(self,
+                               integrations_dir: str = "integracoes",
+                               languages: List[Language] = None,
+                               jobs: int = 1,
+                               incremental: bool = False):
         """
-        Traduz todas as páginas de integrações
+        Traduz todas as páginas de integrações para os idiomas pedidos
+        Com jobs > 1, lotes de páginas são traduzidos em um pool de processos;
+        cada página é lida uma vez e gera todos os idiomas no mesmo worker.
+        Com incremental=True, só páginas (ou idiomas) alterados desde o último
+        run são traduzidos; traduções de páginas removidas são apagadas.
         """
+        if languages is None:
+            languages = [Language.EN]
         integrations_path = self.base_dir / integrations_dir
         
         if not integrations_path.exists():
             print(f"⚠️ Diretório de integrações não encontrado: {integrations_path}")
             return
         
-        html_files = list(integrations_path.glob("*.html"))
-        print(f"📁 Encontrados {len(html_files)} arquivos de integração")
+        # Lista do manifesto do site (sem listar o diretório, se a seção já foi registrada)
+        html_files = section_files(integrations_dir, self.base_dir, self.site)
+        source_files = [html_file.relative_to(self.base_dir).as_posix() for html_file in html_files]
+        language_codes = tuple(lang.value for lang in languages if lang != Language.PT)
+        print(f"📁 Encontrados {len(source_files)} arquivos de integração "
+              f"({', '.join(language_codes) or 'nenhum idioma'}, {jobs} processo(s))")
         
-        for html_file in html_files:
-            relative_path = html_file.relative_to(self.base_dir)
-            try:
-                self.translate_file(str(relative_path), languages=[Language.EN])
-            except Exception as e:
-                print(f"❌ Erro ao traduzir {html_file}: {e}")
+        unchanged_before = self.stats["files_unchanged"]
+        items = [(source_file, self.files.get(source_file)) for source_file in source_files]
+        chunks = map_chunks(translate_chunk, items, jobs,
+                            initializer=init_translation_worker,
+                            initargs=(str(self.base_dir), language_codes, not incremental))
+        for results in chunks:
+            for source_file, entry, written, skipped, error in results:
+                if error is not None:
+                    print(f"❌ Erro ao traduzir {source_file}: {error}")
+                    continue
+                self.record_page(source_file, entry, written, skipped)
+        
+        removed = self.remove_orphans(integrations_dir, source_files)
+        if incremental:
+            print(f"♻️  Modo incremental: {self.stats['files_unchanged'] - unchanged_before} traduções "
+                  f"inalteradas (puladas), {removed} páginas removidas")
+        
+        # Variantes traduzidas registradas no manifesto do site
+        self.site.save()
     
     def generate_translation_manifest(self):
         """
@@ -589,11 +792,12 @@ class TranslationGenerator:
                 for lang in Language
             },
             "statistics": self.stats,
+            "files": self.files,
         }
         
-        manifest_path = self.translated_dir / "manifest.json"
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        self.translated_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = self.translated_dir / TRANSLATION_MANIFEST
+        write_atomic(manifest_path, json.dumps(manifest, indent=1, ensure_ascii=False, sort_keys=True).encode('utf-8'))
         
         print(f"✅ Manifesto de tradução gerado: {manifest_path}")
         return manifest
@@ -732,7 +936,12 @@ def print_stats(stats: Dict):
     print("=" * 70)
     print(f"Arquivos processados: {stats['files_processed']}")
     print(f"Arquivos traduzidos: {stats['files_translated']}")
+    print(f"Traduções inalteradas (puladas): {stats.get('files_unchanged', 0)}")
+    print(f"Páginas removidas: {stats.get('files_removed', 0)}")
     print(f"Total de traduções: {stats['total_translations']}")
+    for language_code, language_stats in sorted(stats.get('languages', {}).items()):
+        print(f"  • {language_code}: {language_stats['files']} arquivos "
+              f"({language_stats['bytes'] / 1024 / 1024:.1f}MB)")
     print("=" * 70 + "\n")
 
 # ============================================================================
@@ -758,6 +967,17 @@ def main():
         default=["en"],
         help="Idiomas para traduzir (padrão: en)"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Processos para traduzir as integrações (0 = todos os núcleos)"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Traduzir só páginas alteradas desde o último run (translated/manifest.json)"
+    )
     parser.add_argument(
         "--setup",
         action="store_true",
@@ -805,7 +1025,8 @@ def main():
     if args.translate_index or args.all:
         print("\n📄 Traduzindo index.html...")
         try:
-            generator.translate_file("index.html", languages=selected_languages)
+            generator.translate_file("index.html", languages=selected_languages, incremental=args.incremental)
+            generator.site.save()
             print("✅ index.html traduzido com sucesso")
         except Exception as e:
             print(f"❌ Erro: {e}")
@@ -813,7 +1034,8 @@ def main():
     # Traduzir integrações
     if args.translate_integrations or args.all:
         print("\n🔌 Traduzindo páginas de integrações...")
-        generator.translate_integrations()
+        generator.translate_integrations(languages=selected_languages, jobs=resolve_jobs(args.jobs),
+                                         incremental=args.incremental)
         print("✅ Integrações traduzidas com sucesso")
     
     # Gerar manifesto
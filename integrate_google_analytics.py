@@ -19,7 +19,10 @@ import re
 from pathlib import Path
 import argparse
 import logging
-from bs4 import BeautifulSoup
+
+from html_rewriter import parse_html
+from page_enrichment import MEASUREMENT_ID_PATTERN, generate_ga4_snippet, has_ga4
+from site_manifest import load_site_manifest, relative_path, section_files
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -34,113 +37,15 @@ class GoogleAnalyticsIntegrator:
         self.files_processed = 0
         self.files_updated = 0
         self.files_skipped = 0
+        self.site = load_site_manifest('.')
         
     def generate_ga4_snippet(self) -> str:
         """Gera snippet do Google Analytics 4"""
-        return f"""
-<!-- Google Analytics 4 -->
-<script async src="https://www.googletagmanager.com/gtag/js?id={self.measurement_id}"></script>
-<script>
-    window.dataLayer = window.dataLayer || [];
-    function gtag(){{dataLayer.push(arguments);}}
-    gtag('js', new Date());
-    
-    // Configuração básica
-    gtag('config', '{self.measurement_id}', {{
-        'send_page_view': true,
-        'anonymize_ip': true,
-        'allow_google_signals': true,
-        'allow_ad_personalization_signals': false
-    }});
-    
-    // Eventos personalizados para templates
-    document.addEventListener('DOMContentLoaded', function() {{
-        
-        // Track download de template (clique em botões de download)
-        const downloadButtons = document.querySelectorAll('a[href*=".json"], button[class*="download"], a[class*="download"]');
-        downloadButtons.forEach(function(btn) {{
-            btn.addEventListener('click', function(e) {{
-                gtag('event', 'template_download', {{
-                    'event_category': 'engagement',
-                    'event_label': window.location.pathname,
-                    'value': 1
-                }});
-            }});
-        }});
-        
-        // Track scroll depth (75% da página)
-        let scrollTracked = false;
-        window.addEventListener('scroll', function() {{
-            if (scrollTracked) return;
-            
-            const scrollPercent = (window.scrollY + window.innerHeight) / document.documentElement.scrollHeight * 100;
-            if (scrollPercent >= 75) {{
-                gtag('event', 'scroll', {{
-                    'event_category': 'engagement',
-                    'event_label': '75_percent',
-                    'value': 75
-                }});
-                scrollTracked = true;
-            }}
-        }});
-        
-        // Track tempo na página (2+ minutos = engajamento alto)
-        setTimeout(function() {{
-            gtag('event', 'time_on_page', {{
-                'event_category': 'engagement',
-                'event_label': '2_minutes',
-                'value': 120
-            }});
-        }}, 120000); // 2 minutos
-        
-        // Track clique em links internos (navegação)
-        const internalLinks = document.querySelectorAll('a[href^="/"], a[href^="./"]');
-        internalLinks.forEach(function(link) {{
-            link.addEventListener('click', function(e) {{
-                gtag('event', 'internal_navigation', {{
-                    'event_category': 'navigation',
-                    'event_label': this.getAttribute('href'),
-                    'value': 1
-                }});
-            }});
-        }});
-        
-        // Track expansão de FAQ (se existir)
-        const faqItems = document.querySelectorAll('details.faq-item');
-        faqItems.forEach(function(item, index) {{
-            item.addEventListener('toggle', function() {{
-                if (this.open) {{
-                    gtag('event', 'faq_expansion', {{
-                        'event_category': 'engagement',
-                        'event_label': 'faq_item_' + (index + 1),
-                        'value': 1
-                    }});
-                }}
-            }});
-        }});
-        
-        // Track copy de prompt LLM (se existir)
-        const llmSection = document.querySelector('.llm-friendly');
-        if (llmSection) {{
-            const promptBox = llmSection.querySelector('div[style*="monospace"]');
-            if (promptBox) {{
-                promptBox.addEventListener('click', function() {{
-                    gtag('event', 'llm_prompt_interaction', {{
-                        'event_category': 'engagement',
-                        'event_label': 'prompt_clicked',
-                        'value': 1
-                    }});
-                }});
-            }}
-        }}
-    }});
-</script>
-"""
+        return generate_ga4_snippet(self.measurement_id)
     
     def has_ga4(self, html_content: str) -> bool:
         """Verifica se já possui GA4"""
-        return 'googletagmanager.com/gtag/js' in html_content or \
-               f'gtag/js?id={self.measurement_id}' in html_content
+        return has_ga4(html_content, self.measurement_id)
     
     def integrate_ga4(self, filepath: str) -> bool:
         """Integra GA4 em um arquivo HTML"""
@@ -155,8 +60,8 @@ class GoogleAnalyticsIntegrator:
                 self.files_skipped += 1
                 return False
             
-            soup = BeautifulSoup(html_content, 'html.parser')
-            head = soup.find('head')
+            doc = parse_html(html_content)
+            head = doc.head
             
             if not head:
                 logger.warning(f"   ⚠️  Sem <head>: {os.path.basename(filepath)}")
@@ -166,13 +71,14 @@ class GoogleAnalyticsIntegrator:
             ga4_snippet = self.generate_ga4_snippet()
             
             # Inserir antes do </head>
-            ga4_tag = BeautifulSoup(ga4_snippet, 'html.parser')
-            head.append(ga4_tag)
+            head.append_html(ga4_snippet)
             
             # Salvar se não for dry-run
             if not self.dry_run:
+                output = doc.serialize()
                 with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(str(soup))
+                    f.write(output)
+                self.site.record_content(relative_path('.', filepath), output)
                 logger.info(f"   ✅ Integrado: {os.path.basename(filepath)}")
                 self.files_updated += 1
             else:
@@ -190,7 +96,11 @@ class GoogleAnalyticsIntegrator:
         logger.info(f"\n📂 Processando diretório: {directory}")
         
         path = Path(directory)
-        html_files = list(path.glob(pattern))
+        if pattern == "*.html":
+            # Lista do manifesto do site (o diretório só é listado se a seção não foi registrada)
+            html_files = section_files(directory, '.', self.site)
+        else:
+            html_files = list(path.glob(pattern))
         
         if not html_files:
             logger.info(f"   ℹ️  Nenhum arquivo HTML encontrado")
@@ -227,6 +137,9 @@ class GoogleAnalyticsIntegrator:
             if os.path.exists(directory):
                 self.process_directory(directory)
         
+        if self.files_updated:
+            self.site.save()
+        
         # Resumo
         self._print_summary()
     
@@ -264,7 +177,7 @@ def main():
     args = parser.parse_args()
     
     # Validar Measurement ID
-    if not re.match(r'^G-[A-Z0-9]{10}$', args.measurement_id):
+    if not MEASUREMENT_ID_PATTERN.match(args.measurement_id):
         logger.error("❌ Measurement ID inválido. Formato esperado: G-XXXXXXXXXX")
         logger.error("   Exemplo: G-ABC1234567")
         sys.exit(1)
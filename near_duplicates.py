@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Detecção de quase-duplicatas no catálogo e nas páginas geradas
+
+Os geradores combinatórios só evitam duplicatas exatas (mesmo slug ou
+mesmo software_a/software_b/tipo_evento), então o catálogo acumula páginas
+com título, descrição e passos praticamente iguais — o que desperdiça
+crawl budget. Este módulo agrupa essas páginas em clusters:
+
+    • texto de cada linha: título + descrição + passos (ou, com --pages, o
+      título, a meta description e o texto visível de <main> das páginas);
+    • shingles de 3 palavras, com hash CRC32 (estável entre execuções);
+    • assinatura MinHash de 32 posições por "one permutation hashing"
+      (um único hash por shingle, em vez de 32) + densificação dos bins
+      vazios;
+    • LSH em 8 bandas de 4 valores: os baldes em que a linha cai apontam
+      os clusters candidatos, e a linha entra no primeiro cujo
+      representante (a primeira linha do cluster) tem Jaccard exato dos
+      shingles acima do limiar; senão, abre um cluster novo.
+
+Comparar só com o representante evita o encadeamento do single-linkage
+(A~B e B~C juntando A e C mesmo com A e C distantes): todo membro está
+acima do limiar em relação ao representante, então dois membros quaisquer
+têm Jaccard de pelo menos ~2*limiar-1. Em troca, o resultado depende da
+ordem das linhas (a mesma do catálogo, então é estável entre execuções).
+
+O custo é linear no número de linhas (~15 s para reconstruir o índice de
+100k linhas; execuções incrementais só processam as linhas novas). O
+índice do catálogo fica em .catalogue_cache/<csv>.neardup.pickle: quando
+o catálogo só cresceu no final (caso dos geradores), apenas as linhas
+novas são processadas.
+
+Uso:
+    python near_duplicates.py                        # automacoes_db.csv
+    python near_duplicates.py --threshold 0.9 --json near_duplicates.json
+    python near_duplicates.py --pages integracoes    # páginas já geradas
+"""
+
+import argparse
+import html
+import json
+import pickle
+import re
+import zlib
+from collections import defaultdict
+from datetime import datetime
+from itertools import islice, repeat
+from operator import add, and_, mul
+from pathlib import Path
+
+from catalogue import CACHE_DIR_NAME, N8N_CSV, load_catalogue, resolve_path
+from output_writer import write_atomic
+from site_manifest import is_listing_page
+
+INDEX_VERSION = 2
+NUM_BINS = 32          # tamanho da assinatura MinHash
+BIN_BITS = 5           # log2(NUM_BINS)
+BAND_SIZE = 4          # valores por banda -> NUM_BINS // BAND_SIZE bandas
+SHINGLE_SIZE = 3       # palavras por shingle
+DEFAULT_THRESHOLD = 0.7
+EMPTY_BIN = 1 << 32
+
+WORD_PATTERN = re.compile(r'\w+')
+TITLE_PATTERN = re.compile(r'<title>(.*?)</title>', re.DOTALL | re.IGNORECASE)
+META_DESCRIPTION_PATTERN = re.compile(r'<meta\s+name="description"\s+content="([^"]*)"', re.IGNORECASE)
+MAIN_PATTERN = re.compile(r'<main\b.*?</main>', re.DOTALL | re.IGNORECASE)
+SCRIPT_PATTERN = re.compile(r'<(script|style)\b.*?</\1>', re.DOTALL | re.IGNORECASE)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+# ==================== TEXTO E ASSINATURAS ====================
+
+def row_text(row):
+    """Texto comparado de uma linha do catálogo: título + descrição + passos"""
+    return ' '.join(filter(None, (row.get('titulo_pagina'), row.get('descricao_curta'), row.get('passos_resumo'))))
+
+
+def page_text(content):
+    """Texto comparado de uma página gerada: título, meta description e texto de <main>"""
+    parts = []
+    for pattern in (TITLE_PATTERN, META_DESCRIPTION_PATTERN):
+        match = pattern.search(content)
+        if match:
+            parts.append(match.group(1))
+    main = MAIN_PATTERN.search(content)
+    if main:
+        parts.append(TAG_PATTERN.sub(' ', SCRIPT_PATTERN.sub(' ', main.group(0))))
+    return ' '.join(html.unescape(' '.join(parts)).split())
+
+
+_word_hashes = {}
+
+
+def shingles(text):
+    """Conjunto de hashes (32 bits) dos shingles de SHINGLE_SIZE palavras do texto
+
+    O hash de cada palavra é calculado uma vez (CRC32, estável entre
+    execuções) e o de cada shingle combina os das suas palavras com
+    aritmética feita em C (map), sem laço Python por shingle.
+    """
+    words = WORD_PATTERN.findall(text.lower())
+    hashes = list(map(_word_hashes.get, words))
+    if None in hashes:
+        for position, word in enumerate(words):
+            if hashes[position] is None:
+                hashes[position] = _word_hashes.setdefault(word, zlib.crc32(word.encode('utf-8')))
+    if not hashes:
+        return frozenset()
+    if len(hashes) < SHINGLE_SIZE:
+        hashes += [0] * (SHINGLE_SIZE - len(hashes))
+    first = map(mul, hashes, repeat(0x9E3779B1))
+    second = map(mul, islice(hashes, 1, None), repeat(0x85EBCA77))
+    combined = map(add, map(add, first, second), islice(hashes, 2, None))
+    return frozenset(map(and_, combined, repeat(0xFFFFFFFF)))
+
+
+def signature(shingle_set):
+    """Assinatura MinHash por one permutation hashing
+
+    O bin de cada shingle são os BIN_BITS bits baixos do hash; dentro do
+    bin vale o menor hash. Bins vazios copiam o próximo bin preenchido
+    (somando a distância, como na densificação por rotação), para que
+    textos curtos também tenham assinaturas comparáveis.
+    """
+    mask = NUM_BINS - 1
+    # em ordem decrescente, a última atribuição de cada bin é o menor hash
+    minimums = {value & mask: value for value in sorted(shingle_set, reverse=True)}
+    bins = list(map(minimums.get, range(NUM_BINS), repeat(EMPTY_BIN)))
+    if len(minimums) == NUM_BINS or not minimums:
+        return bins
+
+    dense = list(bins)
+    carry = None
+    distance = 0
+    for position in range(2 * NUM_BINS - 1, -1, -1):
+        index = position & mask
+        if bins[index] != EMPTY_BIN:
+            carry = bins[index]
+            distance = 0
+        else:
+            distance += 1
+            if position < NUM_BINS and carry is not None:
+                dense[index] = carry + distance * EMPTY_BIN
+    return dense
+
+
+def band_keys(bins):
+    """Chaves LSH (uma por banda) de uma assinatura"""
+    return [hash((band,) + tuple(bins[band * BAND_SIZE:(band + 1) * BAND_SIZE]))
+            for band in range(NUM_BINS // BAND_SIZE)]
+
+
+def jaccard(a, b):
+    if not a and not b:
+        return 1.0
+    common = len(a & b)
+    return common / (len(a) + len(b) - common)
+
+
+# ==================== ÍNDICE ====================
+
+class NearDuplicateIndex:
+    """Índice LSH incremental; os itens são identificados pela ordem em que entram"""
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self.keys = []        # identificador de cada item (slug ou arquivo)
+        self.parent = []      # union-find dos clusters (a raiz é o representante)
+        self.buckets = {}     # chave de banda -> primeiro item que caiu nela
+        self._shingles = {}   # cache (não persistido) de shingles dos representantes
+
+    def params(self):
+        return (INDEX_VERSION, NUM_BINS, BAND_SIZE, SHINGLE_SIZE, self.threshold)
+
+    def __getstate__(self):
+        return {'threshold': self.threshold, 'keys': self.keys, 'parent': self.parent, 'buckets': self.buckets}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._shingles = {}
+
+    def find(self, item):
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a, b):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    def extend(self, keys, texts):
+        """Indexa os itens de keys/texts a partir de len(self.keys)
+
+        keys e texts são as listas completas (itens antigos + novos); os
+        textos dos itens antigos só são lidos quando eles representam um
+        cluster candidato de um item novo. Cada item entra em no máximo um
+        cluster: o primeiro cujo representante passa no limiar.
+        """
+        start = len(self.keys)
+        for item in range(start, len(keys)):
+            item_shingles = shingles(texts[item])
+            self.keys.append(keys[item])
+            self.parent.append(item)
+            checked = set()
+            for key in band_keys(signature(item_shingles)):
+                leader = self.buckets.get(key)
+                if leader is None:
+                    self.buckets[key] = item
+                    continue
+                if self.find(item) != item:
+                    continue  # já entrou num cluster; só registra os baldes
+                root = self.find(leader)
+                if root in checked:
+                    continue
+                checked.add(root)
+                root_shingles = self._shingles.get(root)
+                if root_shingles is None:
+                    root_shingles = self._shingles[root] = shingles(texts[root])
+                if jaccard(item_shingles, root_shingles) >= self.threshold:
+                    self.union(item, root)
+            if self.find(item) == item:
+                self._shingles[item] = item_shingles
+        return len(keys) - start
+
+    def clusters(self):
+        """Clusters com 2+ itens (listas de posições), do maior para o menor"""
+        groups = defaultdict(list)
+        for item in range(len(self.keys)):
+            groups[self.find(item)].append(item)
+        return sorted((group for group in groups.values() if len(group) > 1), key=len, reverse=True)
+
+
+def index_path(path):
+    path = Path(path)
+    return path.parent / CACHE_DIR_NAME / f"{path.name}.neardup.pickle"
+
+
+def load_index(path, keys, threshold):
+    """Índice salvo, se for compatível e o catálogo só cresceu no final"""
+    try:
+        with open(index_path(path), 'rb') as f:
+            index = pickle.load(f)
+    except (FileNotFoundError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    if index.params() != NearDuplicateIndex(threshold).params():
+        return None
+    if len(index.keys) > len(keys) or index.keys != keys[:len(index.keys)]:
+        return None
+    return index
+
+
+def save_index(path, index):
+    index_path(path).parent.mkdir(exist_ok=True)
+    write_atomic(index_path(path), pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def catalogue_duplicates(path=N8N_CSV, threshold=DEFAULT_THRESHOLD, rebuild=False):
+    """(índice, itens indexados agora, textos) do catálogo, reaproveitando o índice salvo"""
+    path = resolve_path(path)
+    catalogue = load_catalogue(path)
+    keys = [row.get('slug_url') or '' for row in catalogue]
+    index = None if rebuild else load_index(path, keys, threshold)
+    if index is None:
+        index = NearDuplicateIndex(threshold)
+    texts = [row_text(row) for row in catalogue]
+    added = index.extend(keys, texts)
+    if added:
+        save_index(path, index)
+    return index, added, texts
+
+
+def page_duplicates(directory, threshold=DEFAULT_THRESHOLD):
+    """(índice, itens indexados, textos) das páginas .html de um diretório"""
+    files = sorted(Path(directory).glob('*.html'))
+    keys = [file.name for file in files if not is_listing_page(file.name)]
+    texts = [page_text((Path(directory) / key).read_text(encoding='utf-8')) for key in keys]
+    index = NearDuplicateIndex(threshold)
+    return index, index.extend(keys, texts), texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Agrupa linhas/páginas quase idênticas (MinHash + LSH)')
+    parser.add_argument('csv', nargs='?', default=str(N8N_CSV), help='Catálogo (padrão: automacoes_db.csv)')
+    parser.add_argument('--pages', help='Analisar as páginas .html deste diretório em vez do catálogo')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Similaridade de Jaccard mínima (padrão: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--json', help='Gravar todos os clusters neste arquivo JSON')
+    parser.add_argument('--top', type=int, default=10, help='Clusters mostrados no relatório')
+    parser.add_argument('--rebuild', action='store_true', help='Ignorar o índice salvo do catálogo')
+    args = parser.parse_args()
+
+    start_time = datetime.now()
+    if args.pages:
+        index, added, texts = page_duplicates(args.pages, args.threshold)
+        source = args.pages
+    else:
+        index, added, texts = catalogue_duplicates(args.csv, args.threshold, args.rebuild)
+        source = resolve_path(args.csv).name
+    clusters = index.clusters()
+    elapsed = (datetime.now() - start_time).total_seconds()
+
+    duplicated = sum(len(cluster) for cluster in clusters)
+    print(f"🔁 {source}: {len(index.keys)} itens ({added} indexados agora) em {elapsed:.2f}s")
+    print(f"   • Clusters de quase-duplicatas (Jaccard >= {args.threshold}): {len(clusters)}")
+    print(f"   • Itens em clusters: {duplicated} (redundantes: {duplicated - len(clusters)})")
+    for cluster in clusters[:args.top]:
+        print(f"\n   [{len(cluster)}] {texts[cluster[0]][:90]}")
+        for item in cluster[:3]:
+            print(f"       • {index.keys[item]}")
+        if len(cluster) > 3:
+            print(f"       • ... +{len(cluster) - 3}")
+
+    if args.json:
+        report = [{'size': len(cluster), 'keys': [index.keys[item] for item in cluster]} for cluster in clusters]
+        write_atomic(args.json, json.dumps(report, ensure_ascii=False, indent=2).encode('utf-8'))
+        print(f"\n💾 Clusters gravados em {args.json}")
+
+
+if __name__ == '__main__':
+    main()
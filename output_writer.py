@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Escrita de arquivos gerados sem reescrever o que não mudou
+
+write_if_changed() compara o conteúdo novo com o arquivo existente (tamanho
+e depois SHA-256) e só grava quando há diferença, usando arquivo temporário
++ rename atômico. Arquivos inalterados mantêm o mtime, não geram diff no git
+e não são reenviados no deploy.
+"""
+
+import hashlib
+import os
+import tempfile
+from contextlib import contextmanager
+
+DEFAULT_FILE_MODE = 0o644
+
+
+class WriteStats:
+    """Contadores de arquivos/bytes gravados e inalterados"""
+
+    def __init__(self):
+        self.written = 0
+        self.unchanged = 0
+        self.bytes_written = 0
+        self.bytes_unchanged = 0
+
+    def add(self, other):
+        """Soma os contadores de outro WriteStats (ex.: vindo de um worker)"""
+        self.written += other.written
+        self.unchanged += other.unchanged
+        self.bytes_written += other.bytes_written
+        self.bytes_unchanged += other.bytes_unchanged
+        return self
+
+    def summary(self):
+        """Resumo legível para os relatórios dos geradores"""
+        return (f"{self.written} gravados ({self.bytes_written / 1024:.1f}KB), "
+                f"{self.unchanged} inalterados ({self.bytes_unchanged / 1024:.1f}KB)")
+
+
+def _file_digest(path):
+    """SHA-256 do conteúdo de um arquivo, lido em blocos"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.digest()
+
+
+def write_atomic(path, data, mode=DEFAULT_FILE_MODE):
+    """Grava data (bytes) em path via arquivo temporário + rename atômico"""
+    path = os.fspath(path)
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f'.{os.path.basename(path)}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@contextmanager
+def open_atomic(path, mode=DEFAULT_FILE_MODE, encoding='utf-8', newline=''):
+    """Arquivo de texto para gravar em fluxo; path só é substituído se o bloco terminar sem erro"""
+    path = os.fspath(path)
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f'.{os.path.basename(path)}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding, newline=newline) as f:
+            yield f
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_if_changed(path, content, stats=None, encoding='utf-8'):
+    """Grava content em path apenas se for diferente do conteúdo atual
+
+    Retorna True se o arquivo foi gravado, False se já estava igual.
+    """
+    data = content.encode(encoding) if isinstance(content, str) else content
+    path = os.fspath(path)
+
+    try:
+        current = os.stat(path)
+    except FileNotFoundError:
+        current = None
+
+    if (current is not None and current.st_size == len(data)
+            and _file_digest(path) == hashlib.sha256(data).digest()):
+        if stats is not None:
+            stats.unchanged += 1
+            stats.bytes_unchanged += len(data)
+        return False
+
+    write_atomic(path, data, current.st_mode & 0o777 if current else DEFAULT_FILE_MODE)
+
+    if stats is not None:
+        stats.written += 1
+        stats.bytes_written += len(data)
+    return True
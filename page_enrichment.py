@@ -0,0 +1,617 @@
+#!/usr/bin/env python3
+"""
+Enriquecimento das páginas de integração no momento do render
+
+Reúne o que add_schemas_bulk.py, phase3_advanced_seo.py e
+integrate_google_analytics.py aplicavam depois do build (abrindo, parseando
+e reserializando cada página) como plugins que o build.py aplica ao HTML
+recém-renderizado, antes de gravar:
+
+    • schema     → JSON-LD @graph com HowTo + FAQPage + BreadcrumbList
+    • phase3     → meta description, breadcrumbs visíveis, FAQ visível (só
+                   com FAQPage no JSON-LD), bloco "Como Explicar para IA"
+                   e templates relacionados
+    • analytics  → snippet do Google Analytics 4 antes de </head>
+
+Os plugins trabalham sobre a string da página, sem parser de HTML:
+preenchem os slots marcados do template (ver html_slots.py) e, em
+templates sem slots, usam as âncoras </head>, <main> e </main>.
+Os geradores de conteúdo ficam aqui e são reutilizados pelos scripts
+avulsos, para que as duas formas produzam o mesmo conteúdo.
+"""
+
+import html
+import json
+import re
+
+from catalogue import split_steps
+from html_slots import fill_slot
+
+BASE_URL = "https://www.automationscookbook.com"
+
+MEASUREMENT_ID_PATTERN = re.compile(r'^G-[A-Z0-9]{10}$')
+
+SCHEMA_COMMENT = '<!-- Enhanced Schema.org (HowTo + FAQPage + BreadcrumbList) -->'
+
+LD_JSON_OPEN = re.compile(r'<script type="application/ld\+json">')
+META_DESCRIPTION = re.compile(r'<meta\b[^>]*\bname="description"[^>]*>')
+MAIN_OPEN = re.compile(r'<main\b[^>]*>')
+FAQ_PAGE_SCHEMA = re.compile(r'"@type"\s*:\s*"FAQPage"')
+
+
+# ==================== SCHEMA.ORG ====================
+
+def page_url(row):
+    """URL pública da página de uma linha do CSV"""
+    return f"{BASE_URL}/integracoes/{row.get('slug_url', '')}.html"
+
+
+def generate_howto_schema(template_data, html_url):
+    """Generate HowTo schema for a template"""
+    software_a = template_data.get('software_a', 'Software A')
+    software_b = template_data.get('software_b', 'Software B')
+    title = template_data.get('titulo_pagina', '')
+    description = template_data.get('descricao_curta', '')
+    steps = split_steps(template_data.get('passos_resumo'))
+
+    schema = {
+        "@context": "https://schema.org",
+        "@type": "HowTo",
+        "@id": f"{html_url}#howto",
+        "name": title,
+        "description": description,
+        "image": f"{BASE_URL}/assets/integrations/{software_a.lower()}-{software_b.lower()}.png",
+        "totalTime": "PT15M",
+        "estimatedCost": {
+            "@type": "MonetaryAmount",
+            "currency": "BRL",
+            "value": "0"
+        },
+        "tool": [
+            {"@type": "HowToTool", "name": "n8n (self-hosted ou cloud)"},
+            {"@type": "HowToTool", "name": f"Conta {software_a} com API"},
+            {"@type": "HowToTool", "name": f"Conta {software_b} com API"}
+        ],
+        "supply": [
+            {"@type": "HowToSupply", "name": f"Credenciais de API do {software_a}"},
+            {"@type": "HowToSupply", "name": f"API key do {software_b}"}
+        ],
+        "step": []
+    }
+
+    # Add steps
+    for i, step_text in enumerate(steps, 1):
+        schema["step"].append({
+            "@type": "HowToStep",
+            "position": i,
+            "name": step_text,
+            "text": f"No n8n, configure o node '{step_text}' seguindo as instruções da documentação oficial.",
+            "url": f"{html_url}#step{i}"
+        })
+
+    return schema
+
+
+def generate_faq_schema(template_data, html_url):
+    """Generate FAQPage schema for a template"""
+    software_a = template_data.get('software_a', 'Software A')
+    software_b = template_data.get('software_b', 'Software B')
+
+    schema = {
+        "@context": "https://schema.org",
+        "@type": "FAQPage",
+        "@id": f"{html_url}#faq",
+        "mainEntity": [
+            {
+                "@type": "Question",
+                "name": "Quanto tempo leva para configurar esta integração?",
+                "acceptedAnswer": {
+                    "@type": "Answer",
+                    "text": f"A configuração completa da integração entre {software_a} e {software_b} no n8n leva aproximadamente 15 minutos, incluindo criação de credenciais de API e testes iniciais."
+                }
+            },
+            {
+                "@type": "Question",
+                "name": f"Quais planos do {software_a} e {software_b} são necessários?",
+                "acceptedAnswer": {
+                    "@type": "Answer",
+                    "text": f"Você precisa de planos que permitam acesso à API em ambas as plataformas. Verifique a documentação oficial de {software_a} e {software_b} para requisitos específicos de API."
+                }
+            },
+            {
+                "@type": "Question",
+                "name": "Este template é gratuito?",
+                "acceptedAnswer": {
+                    "@type": "Answer",
+                    "text": "Sim, todos os templates do Automations Cookbook são 100% gratuitos e open-source sob licença MIT. Você pode usar, modificar e distribuir livremente."
+                }
+            },
+            {
+                "@type": "Question",
+                "name": "Preciso ter conhecimentos de programação?",
+                "acceptedAnswer": {
+                    "@type": "Answer",
+                    "text": "Não é necessário. O n8n é uma plataforma no-code/low-code. Este template já vem pronto para importar e usar. Conhecimentos básicos de APIs ajudam, mas não são obrigatórios."
+                }
+            },
+            {
+                "@type": "Question",
+                "name": "Como faço para personalizar este workflow?",
+                "acceptedAnswer": {
+                    "@type": "Answer",
+                    "text": "Após importar o template JSON no n8n, você pode adicionar ou remover nodes, ajustar lógicas com nodes IF/Switch, e personalizar mensagens e dados usando expressões do n8n."
+                }
+            },
+            {
+                "@type": "Question",
+                "name": "O workflow funciona em tempo real?",
+                "acceptedAnswer": {
+                    "@type": "Answer",
+                    "text": f"Sim! Quando configurado com triggers (webhooks ou polling), o n8n processa dados em tempo real entre {software_a} e {software_b}, geralmente em menos de 5 segundos."
+                }
+            }
+        ]
+    }
+
+    return schema
+
+
+def generate_breadcrumb_schema(template_data, html_url):
+    """Generate BreadcrumbList schema"""
+    title = template_data.get('titulo_pagina', '')
+
+    schema = {
+        "@context": "https://schema.org",
+        "@type": "BreadcrumbList",
+        "@id": f"{html_url}#breadcrumb",
+        "itemListElement": [
+            {
+                "@type": "ListItem",
+                "position": 1,
+                "name": "Home",
+                "item": BASE_URL
+            },
+            {
+                "@type": "ListItem",
+                "position": 2,
+                "name": "Integrações N8N",
+                "item": f"{BASE_URL}/integracoes/"
+            },
+            {
+                "@type": "ListItem",
+                "position": 3,
+                "name": title,
+                "item": html_url
+            }
+        ]
+    }
+
+    return schema
+
+
+def generate_schema_graph(template_data):
+    """HowTo + FAQPage + BreadcrumbList combinados em um @graph"""
+    html_url = page_url(template_data)
+    return {
+        "@context": "https://schema.org",
+        "@graph": [
+            generate_howto_schema(template_data, html_url),
+            generate_faq_schema(template_data, html_url),
+            generate_breadcrumb_schema(template_data, html_url),
+        ]
+    }
+
+
+def dump_schema_json(schema):
+    """JSON-LD pronto para ir dentro de <script> (sem '</' literal)"""
+    return json.dumps(schema, indent=2, ensure_ascii=False).replace('</', '<\\/')
+
+
+# ==================== PHASE 3 ====================
+
+def generate_faq_html(questions):
+    """Gera HTML formatado para FAQ"""
+    html_parts = ['''
+<section class="faq-section" style="margin-top: 3rem; padding: 2rem; background: #f8f9fa; border-radius: 8px;">
+    <h2 style="font-size: 1.8rem; margin-bottom: 1.5rem; color: #2c3e50;">❓ Perguntas Frequentes</h2>
+    <div class="faq-container">
+''']
+
+    for idx, q in enumerate(questions, 1):
+        question = html.escape(q.get('name', ''), quote=False)
+        answer = html.escape(q.get('acceptedAnswer', {}).get('text', ''), quote=False)
+
+        html_parts.append(f'''
+        <details class="faq-item" style="margin-bottom: 1rem; padding: 1rem; background: white; border-radius: 6px; border-left: 4px solid #3498db;">
+            <summary style="font-weight: 600; cursor: pointer; font-size: 1.1rem; color: #2c3e50;">
+                {idx}. {question}
+            </summary>
+            <div style="margin-top: 0.8rem; padding-left: 1rem; color: #555; line-height: 1.6;">
+                {answer}
+            </div>
+        </details>
+''')
+
+    html_parts.append('''
+    </div>
+</section>
+''')
+    return ''.join(html_parts)
+
+
+def generate_llm_prompt(template):
+    """Gera prompt otimizado para LLMs"""
+    software_a = template.get('software_a', '')
+    software_b = template.get('software_b', '')
+    tipo_evento = template.get('tipo_evento', '')
+    caso_uso = template.get('caso_uso_resumido', '')
+
+    return f"""Preciso criar uma automação no n8n que conecte {software_a} com {software_b}.
+
+🎯 OBJETIVO:
+Quando acontecer: {tipo_evento} no {software_a}
+Então fazer: Enviar dados para {software_b}
+
+📋 CONTEXTO:
+{caso_uso}
+
+❓ ME AJUDE COM:
+1. Qual webhook ou trigger usar no {software_a}
+2. Quais dados preciso capturar
+3. Como transformar os dados (se necessário)
+4. Como autenticar no {software_b}
+5. Qual ação executar no {software_b}
+
+💻 PLATAFORMA:
+n8n (ferramenta open-source de automação)
+
+🔗 REFERÊNCIA:
+Este template está documentado em: automationscookbook.com"""
+
+
+def generate_llm_section_html(template):
+    """Seção 'Como Explicar para IA' (LLM-friendly)"""
+    llm_prompt = html.escape(generate_llm_prompt(template), quote=False)
+    return f'''
+<section class="llm-friendly" style="margin-top: 3rem; padding: 2rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 8px; color: white;">
+    <h2 style="font-size: 1.8rem; margin-bottom: 1rem;">🤖 Como Explicar para IA (Prompt Pronto)</h2>
+    <p style="margin-bottom: 1.5rem; opacity: 0.9;">
+        Use este prompt com ChatGPT, Claude ou qualquer LLM para criar esta automação:
+    </p>
+
+    <div style="background: rgba(0,0,0,0.2); padding: 1.5rem; border-radius: 6px; font-family: 'Courier New', monospace; white-space: pre-wrap; line-height: 1.6; border-left: 4px solid #ffd700;">
+{llm_prompt}
+    </div>
+
+    <div style="margin-top: 1.5rem; padding: 1rem; background: rgba(255,255,255,0.1); border-radius: 6px;">
+        <strong>💡 Dica:</strong> Copie este prompt e cole no ChatGPT. A IA irá te guiar passo a passo na criação da automação.
+    </div>
+</section>
+'''
+
+
+def generate_meta_description(template):
+    """Meta description no formato Ação + Benefício + Plataforma + CTA"""
+    software_a = template.get('software_a', '')
+    software_b = template.get('software_b', '')
+    tipo_evento = template.get('tipo_evento', 'evento')
+
+    description = (
+        f"Automatize {software_a} → {software_b} quando {tipo_evento} acontecer. "
+        f"Template n8n pronto, gratuito e fácil de implementar. "
+        f"↓ Baixe o JSON agora!"
+    )
+
+    # Limitar a 155 caracteres
+    if len(description) > 155:
+        description = description[:152] + "..."
+    return description
+
+
+def generate_breadcrumbs_html(template):
+    """Breadcrumbs visíveis no topo da página"""
+    titulo = html.escape((template.get('titulo_pagina') or '')[:50], quote=False)
+    return f'''
+<nav class="breadcrumbs" style="padding: 1rem 0; margin-bottom: 1.5rem; font-size: 0.9rem;" aria-label="Breadcrumb">
+    <ol style="list-style: none; display: flex; gap: 0.5rem; padding: 0; margin: 0; flex-wrap: wrap;">
+        <li>
+            <a href="/" style="color: #3498db; text-decoration: none;">🏠 Home</a>
+        </li>
+        <li style="color: #999;">›</li>
+        <li>
+            <a href="/integracoes/" style="color: #3498db; text-decoration: none;">Integrações</a>
+        </li>
+        <li style="color: #999;">›</li>
+        <li style="color: #555;" aria-current="page">
+            {titulo}...
+        </li>
+    </ol>
+</nav>
+'''
+
+
+RELATED_TEMPLATES_HTML = '''
+<section class="related-templates" style="margin-top: 3rem; padding: 2rem; background: #ecf0f1; border-radius: 8px;">
+    <h2 style="font-size: 1.6rem; margin-bottom: 1rem; color: #2c3e50;">🔗 Templates Relacionados</h2>
+    <p style="margin-bottom: 1.5rem; color: #555;">
+        Explore outras automações similares:
+    </p>
+    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 1rem;">
+        <a href="/integracoes/" style="padding: 1rem; background: white; border-radius: 6px; text-decoration: none; color: #2c3e50; border-left: 4px solid #3498db; transition: transform 0.2s;" onmouseover="this.style.transform='translateX(5px)'" onmouseout="this.style.transform='translateX(0)'">
+            <strong>📚 Ver Todas as Integrações</strong>
+            <div style="font-size: 0.9rem; color: #777; margin-top: 0.3rem;">13.269+ templates disponíveis</div>
+        </a>
+
+        <a href="/guia-automacoes-n8n" style="padding: 1rem; background: white; border-radius: 6px; text-decoration: none; color: #2c3e50; border-left: 4px solid #e74c3c;">
+            <strong>📖 Guia Completo n8n</strong>
+            <div style="font-size: 0.9rem; color: #777; margin-top: 0.3rem;">Aprenda do zero</div>
+        </a>
+
+        <a href="/ai-agents" style="padding: 1rem; background: white; border-radius: 6px; text-decoration: none; color: #2c3e50; border-left: 4px solid #9b59b6;">
+            <strong>🤖 Para IAs e Agentes</strong>
+            <div style="font-size: 0.9rem; color: #777; margin-top: 0.3rem;">Dados estruturados para LLMs</div>
+        </a>
+    </div>
+</section>
+'''
+
+
+# ==================== GOOGLE ANALYTICS 4 ====================
+
+def generate_ga4_snippet(measurement_id):
+    """Gera snippet do Google Analytics 4"""
+    return f"""
+<!-- Google Analytics 4 -->
+<script async src="https://www.googletagmanager.com/gtag/js?id={measurement_id}"></script>
+<script>
+    window.dataLayer = window.dataLayer || [];
+    function gtag(){{dataLayer.push(arguments);}}
+    gtag('js', new Date());
+
+    // Configuração básica
+    gtag('config', '{measurement_id}', {{
+        'send_page_view': true,
+        'anonymize_ip': true,
+        'allow_google_signals': true,
+        'allow_ad_personalization_signals': false
+    }});
+
+    // Eventos personalizados para templates
+    document.addEventListener('DOMContentLoaded', function() {{
+
+        // Track download de template (clique em botões de download)
+        const downloadButtons = document.querySelectorAll('a[href*=".json"], button[class*="download"], a[class*="download"]');
+        downloadButtons.forEach(function(btn) {{
+            btn.addEventListener('click', function(e) {{
+                gtag('event', 'template_download', {{
+                    'event_category': 'engagement',
+                    'event_label': window.location.pathname,
+                    'value': 1
+                }});
+            }});
+        }});
+
+        // Track scroll depth (75% da página)
+        let scrollTracked = false;
+        window.addEventListener('scroll', function() {{
+            if (scrollTracked) return;
+
+            const scrollPercent = (window.scrollY + window.innerHeight) / document.documentElement.scrollHeight * 100;
+            if (scrollPercent >= 75) {{
+                gtag('event', 'scroll', {{
+                    'event_category': 'engagement',
+                    'event_label': '75_percent',
+                    'value': 75
+                }});
+                scrollTracked = true;
+            }}
+        }});
+
+        // Track tempo na página (2+ minutos = engajamento alto)
+        setTimeout(function() {{
+            gtag('event', 'time_on_page', {{
+                'event_category': 'engagement',
+                'event_label': '2_minutes',
+                'value': 120
+            }});
+        }}, 120000); // 2 minutos
+
+        // Track clique em links internos (navegação)
+        const internalLinks = document.querySelectorAll('a[href^="/"], a[href^="./"]');
+        internalLinks.forEach(function(link) {{
+            link.addEventListener('click', function(e) {{
+                gtag('event', 'internal_navigation', {{
+                    'event_category': 'navigation',
+                    'event_label': this.getAttribute('href'),
+                    'value': 1
+                }});
+            }});
+        }});
+
+        // Track expansão de FAQ (se existir)
+        const faqItems = document.querySelectorAll('details.faq-item');
+        faqItems.forEach(function(item, index) {{
+            item.addEventListener('toggle', function() {{
+                if (this.open) {{
+                    gtag('event', 'faq_expansion', {{
+                        'event_category': 'engagement',
+                        'event_label': 'faq_item_' + (index + 1),
+                        'value': 1
+                    }});
+                }}
+            }});
+        }});
+
+        // Track copy de prompt LLM (se existir)
+        const llmSection = document.querySelector('.llm-friendly');
+        if (llmSection) {{
+            const promptBox = llmSection.querySelector('div[style*="monospace"]');
+            if (promptBox) {{
+                promptBox.addEventListener('click', function() {{
+                    gtag('event', 'llm_prompt_interaction', {{
+                        'event_category': 'engagement',
+                        'event_label': 'prompt_clicked',
+                        'value': 1
+                    }});
+                }});
+            }}
+        }}
+    }});
+</script>
+"""
+
+
+def has_ga4(html_content, measurement_id=None):
+    """Verifica se a página já possui GA4"""
+    return 'googletagmanager.com/gtag/js' in html_content or \
+           (measurement_id is not None and f'gtag/js?id={measurement_id}' in html_content)
+
+
+# ==================== PONTOS DE ANCORAGEM ====================
+
+def _insert_at(page, position, fragment):
+    return page[:position] + fragment + page[position:]
+
+
+def _insert_before_head_end(page, fragment):
+    position = page.find('</head>')
+    if position == -1:
+        return None
+    return _insert_at(page, position, fragment)
+
+
+def _append_to_main(page, fragment):
+    """Insere no fim de <main> (ou de <body>, se a página não tiver <main>)"""
+    position = page.rfind('</main>')
+    if position == -1:
+        position = page.rfind('</body>')
+    if position == -1:
+        return None
+    return _insert_at(page, position, fragment)
+
+
+# ==================== PLUGINS ====================
+
+class SchemaPlugin:
+    """Substitui o JSON-LD do template pelo @graph HowTo + FAQPage + BreadcrumbList"""
+
+    name = 'schema'
+
+    def signature(self):
+        return self.name
+
+    def apply(self, page, row):
+        if '"@graph"' in page:
+            return page
+
+        script = (f'{SCHEMA_COMMENT}\n    <script type="application/ld+json">\n'
+                  f'{dump_schema_json(generate_schema_graph(row))}\n    </script>')
+
+        filled = fill_slot(page, 'jsonld', script)
+        if filled is not None:
+            return filled
+
+        head_end = page.find('</head>')
+        match = LD_JSON_OPEN.search(page, 0, head_end if head_end != -1 else len(page))
+        if match:
+            end = page.find('</script>', match.end())
+            if end != -1:
+                return page[:match.start()] + script + page[end + len('</script>'):]
+
+        return _insert_before_head_end(page, f'    {script}\n') or page
+
+
+class Phase3Plugin:
+    """Meta description, breadcrumbs, FAQ visível, bloco LLM e links internos"""
+
+    name = 'phase3'
+
+    def signature(self):
+        return self.name
+
+    def apply(self, page, row):
+        # Mesmos marcadores que phase3_advanced_seo.py usa para pular páginas
+        if 'class="faq-section"' in page or 'class="llm-friendly"' in page:
+            return page
+
+        description = html.escape(generate_meta_description(row))
+        meta = f'<meta content="{description}" name="description"/>'
+        page = (fill_slot(page, 'meta-description', meta)
+                or META_DESCRIPTION.sub(lambda _: meta, page, count=1))
+
+        if 'class="breadcrumbs"' not in page:
+            breadcrumbs = generate_breadcrumbs_html(row)
+            filled = fill_slot(page, 'main-start', breadcrumbs)
+            if filled is None:
+                match = MAIN_OPEN.search(page)
+                if match:
+                    filled = _insert_at(page, match.end(), breadcrumbs)
+            page = filled or page
+
+        # O FAQ visível acompanha o FAQPage do JSON-LD (plugin schema ou
+        # template); sem ele, as perguntas ficariam sem o markup correspondente
+        sections = []
+        if FAQ_PAGE_SCHEMA.search(page):
+            sections.append(generate_faq_html(generate_faq_schema(row, page_url(row))['mainEntity']))
+        if row.get('software_a') and row.get('software_b'):
+            sections.append(generate_llm_section_html(row))
+        if (row.get('tags') or '').split(',')[0]:
+            sections.append(RELATED_TEMPLATES_HTML)
+        content = ''.join(sections)
+        return fill_slot(page, 'main-end', content) or _append_to_main(page, content) or page
+
+
+class AnalyticsPlugin:
+    """Snippet do GA4 antes de </head> (páginas que ainda não têm gtag)"""
+
+    name = 'analytics'
+
+    def __init__(self, measurement_id):
+        self.measurement_id = measurement_id
+        self.snippet = generate_ga4_snippet(measurement_id)
+
+    def signature(self):
+        return f'{self.name}:{self.measurement_id}'
+
+    def apply(self, page, row):
+        if has_ga4(page, self.measurement_id):
+            return page
+        return (fill_slot(page, 'head-end', self.snippet)
+                or _insert_before_head_end(page, self.snippet) or page)
+
+
+AVAILABLE_PLUGINS = ('schema', 'phase3', 'analytics')
+
+
+def load_plugins(names, measurement_id=None):
+    """Instancia os plugins pedidos, na ordem em que são aplicados
+
+    O plugin analytics só é carregado com um Measurement ID válido.
+    """
+    plugins = []
+    for name in AVAILABLE_PLUGINS:
+        if name not in names:
+            continue
+        if name == 'schema':
+            plugins.append(SchemaPlugin())
+        elif name == 'phase3':
+            plugins.append(Phase3Plugin())
+        elif name == 'analytics':
+            if not measurement_id:
+                continue
+            if not MEASUREMENT_ID_PATTERN.match(measurement_id):
+                raise ValueError(f"Measurement ID inválido: {measurement_id} (formato esperado: G-XXXXXXXXXX)")
+            plugins.append(AnalyticsPlugin(measurement_id))
+    return plugins
+
+
+def plugins_signature(plugins):
+    """Identifica a configuração de plugins no manifesto de build"""
+    return ','.join(plugin.signature() for plugin in plugins)
+
+
+def enrich_page(page, row, plugins):
+    """Aplica os plugins, em ordem, ao HTML renderizado de uma linha"""
+    for plugin in plugins:
+        page = plugin.apply(page, row)
+    return page
@@ -14,13 +14,16 @@ Autor: AI Trend Hunter + SEO Master
 Data: 12 de Dezembro de 2025
 """
 
-import csv
 import os
 import re
-from bs4 import BeautifulSoup
 from typing import List, Dict, Tuple
 import logging
 
+from catalogue import load_catalogue
+from html_rewriter import HtmlDocument, parse_html
+from page_enrichment import (RELATED_TEMPLATES_HTML, generate_breadcrumbs_html, generate_faq_html,
+                             generate_llm_prompt, generate_llm_section_html, generate_meta_description)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -53,10 +56,8 @@ class Phase3SEOEnhancer:
         if dry_run:
             logger.info("⚠️  DRY RUN MODE - Nenhuma alteração será salva")
         
-        # Ler CSV
-        with open(self.csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            templates = list(reader)
+        # Ler CSV (catálogo compartilhado, com snapshot em cache)
+        templates = load_catalogue(self.csv_path).rows
         
         # Aplicar skip/limit
         if skip > 0:
@@ -97,10 +98,10 @@ class Phase3SEOEnhancer:
         with open(filepath, 'r', encoding='utf-8') as f:
             html_content = f.read()
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        doc = parse_html(html_content)
         
         # Verificar se já tem enhancements
-        if self._has_phase3_markers(soup):
+        if self._has_phase3_markers(doc):
             logger.info(f"✓ [{idx}/{total}] {slug} - Já possui Phase 3 enhancements")
             return
         
@@ -108,23 +109,23 @@ class Phase3SEOEnhancer:
         modified = False
         
         # 1. Adicionar FAQ visível
-        if self._add_visible_faq(soup, template):
+        if self._add_visible_faq(doc, template):
             modified = True
         
         # 2. Adicionar seção "Como Explicar para IA"
-        if self._add_llm_section(soup, template):
+        if self._add_llm_section(doc, template):
             modified = True
         
         # 3. Melhorar meta description
-        if self._improve_meta_description(soup, template):
+        if self._improve_meta_description(doc, template):
             modified = True
         
         # 4. Adicionar breadcrumbs visíveis
-        if self._add_visible_breadcrumbs(soup, template):
+        if self._add_visible_breadcrumbs(doc, template):
             modified = True
         
         # 5. Adicionar links internos
-        if self._add_internal_links(soup, template):
+        if self._add_internal_links(doc, template):
             modified = True
         
         if not modified:
@@ -133,33 +134,35 @@ class Phase3SEOEnhancer:
         # Salvar se não for dry-run
         if not dry_run:
             with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(str(soup))
+                f.write(doc.serialize())
             logger.info(f"✅ [{idx}/{total}] {slug} - Enhanced")
             self.templates_enhanced += 1
         else:
             logger.info(f"🔍 [{idx}/{total}] {slug} - Would be enhanced (dry-run)")
     
-    def _has_phase3_markers(self, soup: BeautifulSoup) -> bool:
+    def _has_phase3_markers(self, doc: HtmlDocument) -> bool:
         """Verifica se template já tem Phase 3 enhancements"""
         # Procurar por marcadores específicos
-        faq_section = soup.find('section', {'class': 'faq-section'})
-        llm_section = soup.find('section', {'class': 'llm-friendly'})
+        faq_section = doc.find('section', class_='faq-section')
+        llm_section = doc.find('section', class_='llm-friendly')
         
         return faq_section is not None or llm_section is not None
     
-    def _add_visible_faq(self, soup: BeautifulSoup, template: Dict) -> bool:
+    def _add_visible_faq(self, doc: HtmlDocument, template: Dict) -> bool:
         """Adiciona seção FAQ visível baseada no FAQPage schema"""
         
         # Buscar FAQPage schema existente
-        faq_schema = soup.find('script', {'type': 'application/ld+json'})
+        faq_schema = doc.find('script', attrs={'type': 'application/ld+json'})
         if not faq_schema:
             return False
         
         import json
         try:
-            schema_data = json.loads(faq_schema.string)
+            schema_data = json.loads(faq_schema.get_text())
             
-            # Verificar se é FAQPage
+            # Verificar se é FAQPage (solto, em lista ou no @graph do add_schemas_bulk.py)
+            if isinstance(schema_data, dict) and '@graph' in schema_data:
+                schema_data = schema_data['@graph']
             if not isinstance(schema_data, list):
                 schema_data = [schema_data]
             
@@ -176,10 +179,9 @@ class Phase3SEOEnhancer:
             faq_html = self._generate_faq_html(faq_page['mainEntity'])
             
             # Inserir antes do footer
-            main_content = soup.find('main') or soup.find('body')
+            main_content = doc.find('main') or doc.body
             if main_content:
-                faq_section = BeautifulSoup(faq_html, 'html.parser')
-                main_content.append(faq_section)
+                main_content.append_html(faq_html)
                 return True
         
         except Exception as e:
@@ -189,34 +191,9 @@ class Phase3SEOEnhancer:
     
     def _generate_faq_html(self, questions: List[Dict]) -> str:
         """Gera HTML formatado para FAQ"""
-        html = '''
-<section class="faq-section" style="margin-top: 3rem; padding: 2rem; background: #f8f9fa; border-radius: 8px;">
-    <h2 style="font-size: 1.8rem; margin-bottom: 1.5rem; color: #2c3e50;">❓ Perguntas Frequentes</h2>
-    <div class="faq-container">
-'''
-        
-        for idx, q in enumerate(questions, 1):
-            question = q.get('name', '')
-            answer = q.get('acceptedAnswer', {}).get('text', '')
-            
-            html += f'''
-        <details class="faq-item" style="margin-bottom: 1rem; padding: 1rem; background: white; border-radius: 6px; border-left: 4px solid #3498db;">
-            <summary style="font-weight: 600; cursor: pointer; font-size: 1.1rem; color: #2c3e50;">
-                {idx}. {question}
-            </summary>
-            <div style="margin-top: 0.8rem; padding-left: 1rem; color: #555; line-height: 1.6;">
-                {answer}
-            </div>
-        </details>
-'''
-        
-        html += '''
-    </div>
-</section>
-'''
-        return html
+        return generate_faq_html(questions)
     
-    def _add_llm_section(self, soup: BeautifulSoup, template: Dict) -> bool:
+    def _add_llm_section(self, doc: HtmlDocument, template: Dict) -> bool:
         """Adiciona seção 'Como Explicar para IA' (LLM-friendly)"""
         
         software_a = template.get('software_a', '')
@@ -226,136 +203,60 @@ class Phase3SEOEnhancer:
         if not software_a or not software_b:
             return False
         
-        # Gerar prompt otimizado para LLMs
-        llm_prompt = self._generate_llm_prompt(template)
-        
-        llm_html = f'''
-<section class="llm-friendly" style="margin-top: 3rem; padding: 2rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 8px; color: white;">
-    <h2 style="font-size: 1.8rem; margin-bottom: 1rem;">🤖 Como Explicar para IA (Prompt Pronto)</h2>
-    <p style="margin-bottom: 1.5rem; opacity: 0.9;">
-        Use este prompt com ChatGPT, Claude ou qualquer LLM para criar esta automação:
-    </p>
-    
-    <div style="background: rgba(0,0,0,0.2); padding: 1.5rem; border-radius: 6px; font-family: 'Courier New', monospace; white-space: pre-wrap; line-height: 1.6; border-left: 4px solid #ffd700;">
-{llm_prompt}
-    </div>
-    
-    <div style="margin-top: 1.5rem; padding: 1rem; background: rgba(255,255,255,0.1); border-radius: 6px;">
-        <strong>💡 Dica:</strong> Copie este prompt e cole no ChatGPT. A IA irá te guiar passo a passo na criação da automação.
-    </div>
-</section>
-'''
+        llm_html = generate_llm_section_html(template)
         
         # Inserir antes do footer
-        main_content = soup.find('main') or soup.find('body')
+        main_content = doc.find('main') or doc.body
         if main_content:
-            llm_section = BeautifulSoup(llm_html, 'html.parser')
-            main_content.append(llm_section)
+            main_content.append_html(llm_html)
             return True
         
         return False
     
     def _generate_llm_prompt(self, template: Dict) -> str:
         """Gera prompt otimizado para LLMs"""
-        software_a = template.get('software_a', '')
-        software_b = template.get('software_b', '')
-        tipo_evento = template.get('tipo_evento', '')
-        caso_uso = template.get('caso_uso_resumido', '')
-        
-        prompt = f"""Preciso criar uma automação no n8n que conecte {software_a} com {software_b}.
-
-🎯 OBJETIVO:
-Quando acontecer: {tipo_evento} no {software_a}
-Então fazer: Enviar dados para {software_b}
-
-📋 CONTEXTO:
-{caso_uso}
-
-❓ ME AJUDE COM:
-1. Qual webhook ou trigger usar no {software_a}
-2. Quais dados preciso capturar
-3. Como transformar os dados (se necessário)
-4. Como autenticar no {software_b}
-5. Qual ação executar no {software_b}
-
-💻 PLATAFORMA:
-n8n (ferramenta open-source de automação)
-
-🔗 REFERÊNCIA:
-Este template está documentado em: automationscookbook.com"""
-        
-        return prompt
+        return generate_llm_prompt(template)
     
-    def _improve_meta_description(self, soup: BeautifulSoup, template: Dict) -> bool:
+    def _improve_meta_description(self, doc: HtmlDocument, template: Dict) -> bool:
         """Melhora a meta description com fórmula otimizada"""
         
-        meta_desc = soup.find('meta', {'name': 'description'})
+        meta_desc = doc.find('meta', attrs={'name': 'description'})
         if not meta_desc:
             # Criar nova meta description
-            meta_desc = soup.new_tag('meta', attrs={'name': 'description'})
-            head = soup.find('head')
-            if head:
-                head.append(meta_desc)
+            head = doc.head
+            if not head:
+                return False
+            head.append_html('<meta content="" name="description"/>')
+            meta_desc = head.find('meta', attrs={'name': 'description'})
         
         # Fórmula: Ação + Benefício + Plataforma + CTA
-        software_a = template.get('software_a', '')
-        software_b = template.get('software_b', '')
-        tipo_evento = template.get('tipo_evento', 'evento')
-        
-        new_description = (
-            f"Automatize {software_a} → {software_b} quando {tipo_evento} acontecer. "
-            f"Template n8n pronto, gratuito e fácil de implementar. "
-            f"↓ Baixe o JSON agora!"
-        )
-        
-        # Limitar a 155 caracteres
-        if len(new_description) > 155:
-            new_description = new_description[:152] + "..."
+        new_description = generate_meta_description(template)
         
         current_desc = meta_desc.get('content', '')
         if current_desc != new_description:
-            meta_desc['content'] = new_description
+            meta_desc.set('content', new_description)
             return True
         
         return False
     
-    def _add_visible_breadcrumbs(self, soup: BeautifulSoup, template: Dict) -> bool:
+    def _add_visible_breadcrumbs(self, doc: HtmlDocument, template: Dict) -> bool:
         """Adiciona breadcrumbs visíveis no topo da página"""
         
         # Verificar se já existe
-        if soup.find('nav', {'class': 'breadcrumbs'}):
+        if doc.find('nav', class_='breadcrumbs'):
             return False
         
-        titulo = template.get('titulo_pagina', '')
-        
-        breadcrumb_html = f'''
-<nav class="breadcrumbs" style="padding: 1rem 0; margin-bottom: 1.5rem; font-size: 0.9rem;" aria-label="Breadcrumb">
-    <ol style="list-style: none; display: flex; gap: 0.5rem; padding: 0; margin: 0; flex-wrap: wrap;">
-        <li>
-            <a href="/" style="color: #3498db; text-decoration: none;">🏠 Home</a>
-        </li>
-        <li style="color: #999;">›</li>
-        <li>
-            <a href="/integracoes/" style="color: #3498db; text-decoration: none;">Integrações</a>
-        </li>
-        <li style="color: #999;">›</li>
-        <li style="color: #555;" aria-current="page">
-            {titulo[:50]}...
-        </li>
-    </ol>
-</nav>
-'''
+        breadcrumb_html = generate_breadcrumbs_html(template)
         
         # Inserir no início do main
-        main_content = soup.find('main')
+        main_content = doc.find('main')
         if main_content:
-            breadcrumb = BeautifulSoup(breadcrumb_html, 'html.parser')
-            main_content.insert(0, breadcrumb)
+            main_content.prepend_html(breadcrumb_html)
             return True
         
         return False
     
-    def _add_internal_links(self, soup: BeautifulSoup, template: Dict) -> bool:
+    def _add_internal_links(self, doc: HtmlDocument, template: Dict) -> bool:
         """Adiciona seção de templates relacionados"""
         
         # Buscar templates relacionados por tags
@@ -363,36 +264,12 @@ Este template está documentado em: automationscookbook.com"""
         if not tags or not tags[0]:
             return False
         
-        related_html = f'''
-<section class="related-templates" style="margin-top: 3rem; padding: 2rem; background: #ecf0f1; border-radius: 8px;">
-    <h2 style="font-size: 1.6rem; margin-bottom: 1rem; color: #2c3e50;">🔗 Templates Relacionados</h2>
-    <p style="margin-bottom: 1.5rem; color: #555;">
-        Explore outras automações similares:
-    </p>
-    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 1rem;">
-        <a href="/integracoes/" style="padding: 1rem; background: white; border-radius: 6px; text-decoration: none; color: #2c3e50; border-left: 4px solid #3498db; transition: transform 0.2s;" onmouseover="this.style.transform='translateX(5px)'" onmouseout="this.style.transform='translateX(0)'">
-            <strong>📚 Ver Todas as Integrações</strong>
-            <div style="font-size: 0.9rem; color: #777; margin-top: 0.3rem;">13.269+ templates disponíveis</div>
-        </a>
-        
-        <a href="/guia-automacoes-n8n" style="padding: 1rem; background: white; border-radius: 6px; text-decoration: none; color: #2c3e50; border-left: 4px solid #e74c3c;">
-            <strong>📖 Guia Completo n8n</strong>
-            <div style="font-size: 0.9rem; color: #777; margin-top: 0.3rem;">Aprenda do zero</div>
-        </a>
-        
-        <a href="/ai-agents" style="padding: 1rem; background: white; border-radius: 6px; text-decoration: none; color: #2c3e50; border-left: 4px solid #9b59b6;">
-            <strong>🤖 Para IAs e Agentes</strong>
-            <div style="font-size: 0.9rem; color: #777; margin-top: 0.3rem;">Dados estruturados para LLMs</div>
-        </a>
-    </div>
-</section>
-'''
+        related_html = RELATED_TEMPLATES_HTML
         
         # Inserir antes do footer
-        main_content = soup.find('main') or soup.find('body')
+        main_content = doc.find('main') or doc.body
         if main_content:
-            related_section = BeautifulSoup(related_html, 'html.parser')
-            main_content.append(related_section)
+            main_content.append_html(related_html)
             return True
         
         return False
@@ -4,10 +4,12 @@ Refinamento de títulos e metas para templates prioritários
 Foco: CRM, WhatsApp, E-commerce, Marketing (200-500 templates)
 """
 
-import csv
 import json
 from collections import defaultdict
 
+from catalogue import load_catalogue
+from catalogue_db import open_catalogue_db, template_ids_matching
+
 # Softwares prioritários por categoria
 PRIORITY_SOFTWARE = {
     'CRM': ['Pipedrive', 'HubSpot', 'RD Station', 'Salesforce', 'Kommo', 'Zoho CRM'],
@@ -16,18 +18,13 @@ PRIORITY_SOFTWARE = {
     'Marketing': ['Facebook', 'Google Ads', 'Instagram', 'LinkedIn', 'Meta Ads', 'TikTok']
 }
 
-def categorize_template(software_a, software_b, tags):
-    """Identifica categoria do template"""
-    combined = f"{software_a} {software_b} {tags}".lower()
-    categories = []
-    
+def categorize_templates(db):
+    """Categorias de cada template prioritário: {id: [categorias]}, uma consulta indexada por categoria"""
+    categories = defaultdict(list)
     for category, softwares in PRIORITY_SOFTWARE.items():
-        for software in softwares:
-            if software.lower() in combined:
-                categories.append(category)
-                break
-    
-    return categories if categories else ['Outros']
+        for template_id in template_ids_matching(db, softwares):
+            categories[template_id].append(category)
+    return categories
 
 def optimize_title(software_a, software_b, tipo_evento):
     """
@@ -87,40 +84,38 @@ def main():
     stats = defaultdict(int)
     category_templates = defaultdict(list)
     
-    with open('automacoes_db.csv', 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        
-        for row in reader:
-            software_a = row['software_a']
-            software_b = row['software_b']
-            tipo_evento = row['tipo_evento']
-            tags = row.get('tags', '')
-            
-            categories = categorize_template(software_a, software_b, tags)
-            
-            if categories != ['Outros']:
-                template = {
-                    'slug': row['slug_url'],
-                    'software_a': software_a,
-                    'software_b': software_b,
-                    'tipo_evento': tipo_evento,
-                    'categories': categories,
-                    'title_old': row['titulo_pagina'],
-                    'title_new': optimize_title(software_a, software_b, tipo_evento),
-                    'meta_old': row['descricao_curta'],
-                    'meta_new': optimize_meta(software_a, software_b, tipo_evento, row['caso_uso_resumido']),
-                    'url': f"https://www.automationscookbook.com/integracoes/{row['slug_url']}.html"
-                }
-                
-                priority_templates.append(template)
-                
-                for cat in categories:
-                    stats[cat] += 1
-                    category_templates[cat].append(template)
-                
-                if len(priority_templates) >= 500:
-                    break
+    catalogue = load_catalogue('automacoes_db.csv')
+    categories_by_id = categorize_templates(open_catalogue_db('automacoes_db.csv'))
     
+    for template_id in sorted(categories_by_id):
+        row = catalogue[template_id]
+        categories = categories_by_id[template_id]
+        software_a = row['software_a']
+        software_b = row['software_b']
+        tipo_evento = row['tipo_evento']
+        
+        template = {
+            'slug': row['slug_url'],
+            'software_a': software_a,
+            'software_b': software_b,
+            'tipo_evento': tipo_evento,
+            'categories': categories,
+            'title_old': row['titulo_pagina'],
+            'title_new': optimize_title(software_a, software_b, tipo_evento),
+            'meta_old': row['descricao_curta'],
+            'meta_new': optimize_meta(software_a, software_b, tipo_evento, row['caso_uso_resumido']),
+            'url': f"https://www.automationscookbook.com/integracoes/{row['slug_url']}.html"
+        }
+        
+        priority_templates.append(template)
+        
+        for cat in categories:
+            stats[cat] += 1
+            category_templates[cat].append(template)
+        
+        if len(priority_templates) >= 500:
+            break
+
     print(f"✅ Templates prioritários identificados: {len(priority_templates)}\n")
     print("📊 Distribuição por categoria:")
     for cat, count in sorted(stats.items(), key=lambda x: x[1], reverse=True):
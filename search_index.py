@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Índice de busca pré-construído para os diretórios de integrações
+
+Gera, no build, um índice invertido compacto (token -> lista de ids) que o
+navegador consulta com assets/js/catalog-search.js em vez de varrer todas
+as integrações a cada tecla.
+
+Formato do JSON:
+    {
+      "version": 1,
+      "docs": [[arquivo, título, rótulo], ...],
+      "tokens": ["ads", "airtable", ...],      # ordenados (busca por prefixo)
+      "postings": [[0, 3, 2], ...]             # ids com delta encoding
+    }
+
+Tokens são normalizados sem acentos ("integração" -> "integracao"), então
+a busca por "notificacao" encontra "Notificação".
+"""
+
+import json
+import re
+import unicodedata
+
+INDEX_VERSION = 1
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def fold(text):
+    """Minúsculas e sem acentos (mesma regra do catalog-search.js)"""
+    decomposed = unicodedata.normalize('NFD', text)
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch)).lower()
+
+
+def tokenize(text):
+    """Divide um texto em tokens normalizados"""
+    return TOKEN_PATTERN.findall(fold(text))
+
+
+def build_search_index(docs):
+    """Monta o índice a partir de dicts com file, name, label e keywords"""
+    postings = {}
+    doc_rows = []
+    for doc_id, doc in enumerate(docs):
+        doc_rows.append([doc['file'], doc['name'], doc['label']])
+        text = ' '.join([doc['name']] + list(doc.get('keywords', [])))
+        for token in set(tokenize(text)):
+            postings.setdefault(token, []).append(doc_id)
+
+    tokens = sorted(postings)
+    encoded = []
+    for token in tokens:
+        previous = 0
+        deltas = []
+        for doc_id in postings[token]:
+            deltas.append(doc_id - previous)
+            previous = doc_id
+        encoded.append(deltas)
+
+    return {
+        'version': INDEX_VERSION,
+        'docs': doc_rows,
+        'tokens': tokens,
+        'postings': encoded,
+    }
+
+
+def dump_search_index(index):
+    """Serializa o índice no formato compacto servido ao navegador"""
+    return json.dumps(index, ensure_ascii=False, separators=(',', ':'))
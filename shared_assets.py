@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Blocos inline repetidos em todas as páginas -> assets externos com hash
+
+Cada página de integração carregava, inline, o mesmo CSS base e o mesmo
+script de eventos do GA4 (~4,5 KB de ~23 KB), repetidos em 12,5k arquivos.
+O build renderiza algumas linhas de amostra, espalhadas pelo catálogo
+(sample_rows), identifica os blocos <style>/<script> (sem atributos)
+idênticos em todas elas e grava cada um uma única vez em
+assets/shared/<hash>.css|js. As páginas passam a referenciar o arquivo:
+
+    <style>...</style>   ->  <link rel="stylesheet" href="../assets/shared/3f9a1c0b7d2e4a55.css">
+    <script>...</script> ->  <script src="../assets/shared/8c41d2e0a9b7f613.js"></script>
+
+    • o nome é o SHA-256 do conteúdo: conteúdo novo = URL nova, então os
+      arquivos podem ser servidos com cache "immutable" (netlify.toml);
+    • o <script src> não é async/defer, então a ordem de execução é a mesma
+      do bloco inline;
+    • blocos que dependem da linha (JSON-LD, textos da página) diferem entre
+      as amostras e continuam inline, assim como blocos pequenos (snippet do
+      GTM), que não compensam uma requisição a mais.
+
+Uso:
+    shared = SharedAssets.detect([render(row) for row in sample_rows(rows)])
+    shared.write()
+    page = shared.apply(render(row))
+"""
+
+import hashlib
+import os
+import re
+
+from output_writer import write_if_changed
+
+ASSETS_DIR = os.path.join('assets', 'shared')
+ASSETS_URL = '../assets/shared'    # relativo às páginas de integracoes/ e integracoes-zapier/
+MIN_ASSET_BYTES = 512              # abaixo disso o bloco fica inline
+HASH_LENGTH = 16
+SAMPLE_SIZE = 5                    # linhas renderizadas para detectar os blocos comuns
+
+INLINE_BLOCK_PATTERN = re.compile(r'<(style|script)>(.*?)</\1>', re.S)
+ASSET_EXTENSIONS = {'style': 'css', 'script': 'js'}
+
+
+def inline_blocks(page):
+    """Blocos <style>/<script> inline sem atributos: lista de (bloco, tag, conteúdo)"""
+    return [(m.group(0), m.group(1), m.group(2)) for m in INLINE_BLOCK_PATTERN.finditer(page)]
+
+
+def sample_rows(rows, size=SAMPLE_SIZE):
+    """Até size linhas espalhadas pela lista (a primeira, a última e o meio)
+
+    O catálogo vem ordenado por software_a: com as primeiras linhas, todas do
+    mesmo software, um bloco que varia por software pareceria comum.
+    """
+    rows = list(rows)
+    if len(rows) <= size:
+        return rows
+    step = (len(rows) - 1) / (size - 1)
+    return [rows[round(number * step)] for number in range(size)]
+
+
+def asset_content(body):
+    return body.strip() + '\n'
+
+
+def asset_name(kind, content):
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:HASH_LENGTH]
+    return f'{digest}.{ASSET_EXTENSIONS[kind]}'
+
+
+def reference_tag(kind, url):
+    if kind == 'style':
+        return f'<link rel="stylesheet" href="{url}">'
+    return f'<script src="{url}"></script>'
+
+
+class SharedAssets:
+    """Blocos inline compartilhados e os arquivos que os substituem"""
+
+    def __init__(self, assets=None, url_prefix=ASSETS_URL):
+        # bloco inline -> (nome do arquivo, conteúdo do arquivo, tag de referência)
+        self.assets = {}
+        for block, (kind, body) in (assets or {}).items():
+            content = asset_content(body)
+            name = asset_name(kind, content)
+            self.assets[block] = (name, content, reference_tag(kind, f'{url_prefix}/{name}'))
+
+    @classmethod
+    def detect(cls, pages, min_bytes=MIN_ASSET_BYTES, url_prefix=ASSETS_URL):
+        """Blocos presentes, byte a byte, em todas as páginas de amostra
+
+        Com menos de duas amostras não há como separar o que é comum do que
+        depende da linha, então nada é extraído.
+        """
+        if len(pages) < 2:
+            return cls(url_prefix=url_prefix)
+        common = None
+        for page in pages:
+            found = {block: (kind, body) for block, kind, body in inline_blocks(page)
+                     if len(body.encode('utf-8')) >= min_bytes}
+            common = found if common is None else {block: value for block, value in common.items()
+                                                   if block in found}
+        return cls(common, url_prefix)
+
+    def __bool__(self):
+        return bool(self.assets)
+
+    @property
+    def names(self):
+        return sorted(name for name, _, _ in self.assets.values())
+
+    def saved_bytes(self):
+        """Bytes a menos por página (bloco inline - tag de referência)"""
+        return sum(len(block.encode('utf-8')) - len(tag.encode('utf-8'))
+                   for block, (_, _, tag) in self.assets.items())
+
+    def apply(self, page):
+        """Troca os blocos compartilhados da página pelas referências"""
+        for block, (_, _, tag) in self.assets.items():
+            page = page.replace(block, tag)
+        return page
+
+    def write(self, directory=ASSETS_DIR, stats=None):
+        """Grava os assets (só os que ainda não existem com o mesmo conteúdo)"""
+        if not self.assets:
+            return
+        os.makedirs(directory, exist_ok=True)
+        for name, content, _ in self.assets.values():
+            write_if_changed(os.path.join(directory, name), content, stats)
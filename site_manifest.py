@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Manifesto do site: índice persistente caminho -> metadados das páginas
+
+Sitemaps, /llm, GA4, traduções, servidor i18n e testes faziam glob("*.html")
+em diretórios com até 12,5k arquivos (e o servidor, resolve() + exists()
+por requisição), o que é lento no volume de build montado em rede. Agora
+quem grava as páginas registra o que gravou em site_manifest.json:
+
+    {"version": 1, "sections": ["integracoes", ...],
+     "files": {"integracoes/slack-para-notion-n8n.html": {
+         "slug": "slack-para-notion-n8n", "size": 48213, "sha256": "...",
+         "lastmod": "2026-10-18", "mtime_ns": 1792300000000000000, "languages": ["en"]}}}
+
+    • build.py e build_zapier.py registram as páginas que renderizam (e
+      removem as que apagam) sem listar o diretório, com o mtime do arquivo
+      gravado, então um --refresh que inclua a seção não recalcula o hash;
+    • i18n_service.py registra as variantes traduzidas (languages);
+    • integrate_google_analytics.py atualiza o hash das páginas que altera;
+    • seções escritas por outros scripts (raiz, blog/) são listadas por
+      "python site_manifest.py --refresh", uma vez por build.
+
+Uma seção (diretório) só é usada pelos consumidores depois de listada ao
+menos uma vez (campo sections); até lá, section_files() lista o diretório
+como antes. lastmod só muda quando o conteúdo (sha256) muda.
+
+save() relê o arquivo sob um lock (site_manifest.json.lock) e aplica só
+as entradas que o processo alterou, então scripts rodando em paralelo não
+apagam as páginas registradas um pelo outro.
+
+Uso:
+    from site_manifest import section_files
+    for path in section_files('integracoes'):
+        ...
+
+    python site_manifest.py                      # resumo por seção
+    python site_manifest.py --refresh . blog     # relista essas seções
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import posixpath
+import re
+from contextlib import contextmanager
+from datetime import date, datetime
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem lock entre processos
+    fcntl = None
+
+from output_writer import write_atomic
+
+BASE_DIR = Path(__file__).parent
+MANIFEST_FILE = 'site_manifest.json'
+LOCK_FILE = 'site_manifest.json.lock'
+MANIFEST_VERSION = 1
+ROOT_SECTION = '.'
+
+# Seções listadas por --refresh sem argumentos
+DEFAULT_SECTIONS = (ROOT_SECTION, 'blog', 'integracoes', 'integracoes-zapier')
+
+# index.html e pagina-N.html: índice paginado do diretório (build.index_page_filename)
+LISTING_PAGE_PATTERN = re.compile(r'^(?:index|pagina-\d+)\.html$')
+
+
+def section_of(path):
+    return posixpath.dirname(path) or ROOT_SECTION
+
+
+def is_listing_page(name):
+    """Página de índice do diretório (não é uma página de integração)"""
+    return LISTING_PAGE_PATTERN.match(posixpath.basename(name)) is not None
+
+
+def relative_path(base_dir, path):
+    """Caminho relativo (posix) de um arquivo do site, como chave do manifesto"""
+    return Path(os.path.relpath(path, base_dir)).as_posix()
+
+
+def content_digest(data):
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+class SiteManifest:
+    """Entradas do manifesto + seções já listadas"""
+
+    def __init__(self, base_dir=BASE_DIR, files=None, sections=()):
+        self.base_dir = Path(base_dir)
+        self.files = files if files is not None else {}
+        self.sections = set(sections)
+        self._by_section = None
+        self._touched = set()    # caminhos alterados (ou removidos) por este processo
+
+    @property
+    def path(self):
+        return self.base_dir / MANIFEST_FILE
+
+    def get(self, path):
+        return self.files.get(path)
+
+    def section_paths(self, section):
+        """Caminhos registrados de uma seção, em ordem alfabética"""
+        if self._by_section is None:
+            by_section = {}
+            for path in sorted(self.files):
+                by_section.setdefault(section_of(path), []).append(path)
+            self._by_section = by_section
+        return self._by_section.get(section, [])
+
+    def record(self, path, size, sha256, mtime_ns=None, lastmod=None):
+        """Registra (ou atualiza) um arquivo; lastmod só muda se o conteúdo mudou"""
+        previous = self.files.get(path)
+        if previous and previous['sha256'] == sha256:
+            lastmod = previous['lastmod']
+        self.files[path] = {
+            'slug': posixpath.splitext(posixpath.basename(path))[0],
+            'size': size,
+            'sha256': sha256,
+            'lastmod': lastmod or date.today().isoformat(),
+            'mtime_ns': mtime_ns,
+            'languages': previous['languages'] if previous else [],
+        }
+        self._touched.add(path)
+        if not previous:
+            self._by_section = None
+
+    def record_content(self, path, content):
+        """Registra um arquivo a partir do conteúdo que acabou de ser gravado
+
+        O mtime é lido do disco, para o próximo --refresh não recalcular o hash.
+        """
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        try:
+            mtime_ns = os.stat(self.base_dir / path).st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+        self.record(path, len(data), content_digest(data), mtime_ns)
+
+    def remove(self, path):
+        if self.files.pop(path, None) is not None:
+            self._touched.add(path)
+            self._by_section = None
+
+    def add_language(self, path, language):
+        """Marca que existe a variante translated/<language>/<path>"""
+        entry = self.files.get(path)
+        if entry is not None and language not in entry['languages']:
+            entry['languages'] = sorted(entry['languages'] + [language])
+            self._touched.add(path)
+
+    def remove_language(self, path, language):
+        """Desmarca a variante (tradução removida ou desatualizada)"""
+        entry = self.files.get(path)
+        if entry is not None and language in entry['languages']:
+            entry['languages'] = [code for code in entry['languages'] if code != language]
+            self._touched.add(path)
+
+    def has_variant(self, path, language):
+        entry = self.files.get(path)
+        return entry is not None and language in entry['languages']
+
+    def scan_section(self, section):
+        """Lista o diretório (os.scandir) e sincroniza as entradas .html da seção
+
+        O hash só é recalculado quando tamanho ou mtime mudaram.
+        """
+        directory = self.base_dir / section
+        found = set()
+        if directory.is_dir():
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.html') or not entry.is_file():
+                        continue
+                    path = entry.name if section == ROOT_SECTION else f'{section}/{entry.name}'
+                    found.add(path)
+                    info = entry.stat()
+                    previous = self.files.get(path)
+                    if previous and previous['size'] == info.st_size and previous['mtime_ns'] == info.st_mtime_ns:
+                        continue
+                    with open(entry.path, 'rb') as f:
+                        data = f.read()
+                    lastmod = datetime.fromtimestamp(info.st_mtime).date().isoformat()
+                    self.record(path, len(data), content_digest(data), info.st_mtime_ns, lastmod)
+        for path in set(self.section_paths(section)) - found:
+            self.remove(path)
+        self.sections.add(section)
+        return len(found)
+
+    def ensure_section(self, section):
+        """Lista a seção se ela ainda não foi listada (primeira execução)"""
+        if section not in self.sections:
+            self.scan_section(section)
+
+    def save(self):
+        """Grava o manifesto mesclando com o que está no disco
+
+        Vários scripts (build, build_zapier, GA4, i18n) podem rodar ao mesmo
+        tempo: sob um lock de arquivo, o manifesto é relido e só as entradas
+        que este processo alterou ou removeu são aplicadas sobre ele; as
+        demais ficam como o outro processo gravou.
+        """
+        with manifest_lock(self.base_dir):
+            files, sections = read_manifest(self.base_dir)
+            for path in self._touched:
+                if path in self.files:
+                    files[path] = self.files[path]
+                else:
+                    files.pop(path, None)
+            sections.update(self.sections)
+            data = {
+                'version': MANIFEST_VERSION,
+                'sections': sorted(sections),
+                'files': files,
+            }
+            write_atomic(self.path, json.dumps(data, ensure_ascii=False, sort_keys=True,
+                                               separators=(',', ':')).encode('utf-8'))
+        self.files = files
+        self.sections = sections
+        self._touched = set()
+        self._by_section = None
+
+
+@contextmanager
+def manifest_lock(base_dir):
+    """Lock exclusivo (flock) em site_manifest.json.lock durante a releitura + gravação"""
+    if fcntl is None:
+        yield
+        return
+    with open(Path(base_dir) / LOCK_FILE, 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def read_manifest(base_dir):
+    """(files, sections) do manifesto salvo; vazio se não existe ou é de outra versão"""
+    try:
+        with open(Path(base_dir) / MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}, set()
+    if data.get('version') != MANIFEST_VERSION:
+        return {}, set()
+    return data.get('files', {}), set(data.get('sections', ()))
+
+
+def load_site_manifest(base_dir=BASE_DIR):
+    """Manifesto salvo (ou um manifesto vazio, se não existe ou é de outra versão)"""
+    files, sections = read_manifest(base_dir)
+    return SiteManifest(base_dir, files, sections)
+
+
+def section_files(section, base_dir=BASE_DIR, manifest=None):
+    """Arquivos .html de uma seção: do manifesto, ou listando o diretório se ela não foi registrada"""
+    base_dir = Path(base_dir)
+    manifest = manifest or load_site_manifest(base_dir)
+    if section in manifest.sections:
+        return [base_dir / path for path in manifest.section_paths(section)]
+    directory = base_dir / section
+    return sorted(directory.glob('*.html')) if directory.is_dir() else []
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Manifesto das páginas do site (site_manifest.json)')
+    parser.add_argument('--base-dir', default=str(BASE_DIR), help='Raiz do site (padrão: diretório do script)')
+    parser.add_argument('--refresh', nargs='*', metavar='SEÇÃO',
+                        help=f"Listar de novo estas seções (sem nomes: {', '.join(DEFAULT_SECTIONS)})")
+    args = parser.parse_args()
+
+    manifest = load_site_manifest(args.base_dir)
+    if args.refresh is not None:
+        start_time = datetime.now()
+        for section in args.refresh or DEFAULT_SECTIONS:
+            count = manifest.scan_section(section)
+            print(f"📂 {section}: {count} páginas")
+        manifest.save()
+        elapsed = (datetime.now() - start_time).total_seconds()
+        print(f"✅ {manifest.path.name} atualizado em {elapsed:.2f}s")
+
+    print(f"🗂️  {len(manifest.files)} páginas no manifesto")
+    for section in sorted(manifest.sections):
+        paths = manifest.section_paths(section)
+        translated = sum(1 for path in paths if manifest.files[path]['languages'])
+        print(f"   • {section}: {len(paths)} páginas ({translated} com tradução)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Motor de templates pré-compilado para os geradores de páginas
+
+O template HTML é lido uma única vez e quebrado em segmentos literais e
+slots ({{ nome }}). Cada página é renderizada com um único ''.join(), em vez
+de uma passada de str.replace() sobre o template inteiro por coluna do CSV.
+
+Uso:
+    template = compile_template(open('template_page.html').read())
+    unknown = template.unknown_placeholders(csv_columns)
+    html = template.render({'titulo_pagina': '...', ...})
+"""
+
+import re
+
+# {{ nome }} — mesmo formato usado em template_page.html
+PLACEHOLDER_PATTERN = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+
+class CompiledTemplate:
+    """Template já dividido em literais e slots"""
+
+    def __init__(self, parts, raw_slots):
+        # parts alterna literal, slot, literal, slot, ..., literal
+        self.parts = parts
+        self.raw_slots = raw_slots
+
+    @property
+    def placeholders(self):
+        """Nomes de todos os placeholders presentes no template"""
+        return set(self.parts[1::2])
+
+    def unknown_placeholders(self, known_keys):
+        """Placeholders que não serão preenchidos por nenhuma das chaves conhecidas"""
+        return sorted(self.placeholders - set(known_keys))
+
+    def render(self, context, strict=False):
+        """Renderiza o template com os valores de context
+
+        Placeholders sem valor em context são mantidos como no template
+        original (mesmo comportamento do antigo loop de str.replace), a não
+        ser que strict=True, caso em que um KeyError é lançado.
+        """
+        parts = list(self.parts)
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            if name in context:
+                parts[i] = context[name]
+            elif strict:
+                raise KeyError(f"Placeholder sem valor: {name}")
+            else:
+                parts[i] = self.raw_slots[i // 2]
+        return ''.join(parts)
+
+
+def compile_template(text):
+    """Compila o texto de um template em um CompiledTemplate"""
+    parts = []
+    raw_slots = []
+    last = 0
+    for match in PLACEHOLDER_PATTERN.finditer(text):
+        parts.append(text[last:match.start()])
+        parts.append(match.group(1))
+        raw_slots.append(match.group(0))
+        last = match.end()
+    parts.append(text[last:])
+    return CompiledTemplate(parts, raw_slots)
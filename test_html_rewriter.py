@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+🧪 Testes do html_rewriter.py
+Documento sem edição volta byte a byte; o documento editado é reserializado
+inteiro, com as diferenças de markup descritas no módulo.
+"""
+
+import pytest
+
+from html_rewriter import BACKENDS, lxml_html, parse_html
+
+PAGE = """<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+    <title>Slack + Notion</title>
+</head>
+<body>
+    <main>
+        <svg viewBox="0 0 24 24"><path d="M0 0h24v24H0z"/></svg>
+        <a href="busca.html?q=ação&amp;p=2">Busca &amp; filtros</a>
+    </main>
+</body>
+</html>
+"""
+
+
+def available_backends():
+    return [backend for backend in BACKENDS if backend != 'lxml' or lxml_html is not None]
+
+
+@pytest.mark.parametrize('backend', available_backends())
+def test_unchanged_document_round_trips(backend):
+    doc = parse_html(PAGE, backend)
+    doc.find('main').find_all('a')
+    assert not doc.modified
+    assert doc.serialize() == PAGE
+
+
+@pytest.mark.parametrize('backend', available_backends())
+def test_edit_marks_document_modified(backend):
+    doc = parse_html(PAGE, backend)
+    doc.head.append_html('<meta name="robots" content="index">')
+    assert doc.modified
+    assert 'name="robots"' in doc.serialize()
+
+
+@pytest.mark.parametrize('backend', available_backends())
+def test_edited_document_churn(backend):
+    """Diferenças fora do trecho editado (documentadas em html_rewriter.py)"""
+    doc = parse_html(PAGE, backend)
+    doc.find('main').set('id', 'conteudo')
+    output = doc.serialize()
+    assert 'viewbox="0 0 24 24"' in output
+    assert '<path d="M0 0h24v24H0z"></path>' in output
+    assert 'Busca &amp; filtros' in output
+    if backend == 'lxml':
+        assert 'href="busca.html?q=a%C3%A7%C3%A3o&amp;p=2"' in output
@@ -9,6 +9,10 @@ import re
 from pathlib import Path
 from html.parser import HTMLParser
 
+from catalogue import load_catalogue
+from site_manifest import is_listing_page, section_files
+from template_engine import compile_template
+
 class HTMLValidator(HTMLParser):
     def __init__(self):
         super().__init__()
@@ -146,11 +150,33 @@ def test_html_file(filepath):
             'status': 'ERRO'
         }
 
+def check_template_placeholders(template_file='template_page.html', csv_file='automacoes_db.csv'):
+    """Verifica, antes de qualquer página, se todo placeholder do template tem valor"""
+    from build import COMPUTED_FIELDS
+
+    with open(template_file, 'r', encoding='utf-8') as f:
+        template = compile_template(f.read())
+    columns = load_catalogue(csv_file).fieldnames
+
+    unknown = template.unknown_placeholders(list(columns) + list(COMPUTED_FIELDS))
+    if unknown:
+        print(f"❌ Placeholders sem coluna no CSV: {', '.join(unknown)}")
+        return False
+    print(f"✅ {len(template.placeholders)} placeholders do template cobertos pelo CSV")
+    return True
+
 def main():
-    integracoes_dir = Path('/workspaces/fabrica-n8n/integracoes')
+    print("\n📐 Verificando placeholders do template...")
+    try:
+        check_template_placeholders()
+    except FileNotFoundError as e:
+        print(f"⚠️  Não foi possível verificar o template: {e}")
+
+    site_dir = Path('/workspaces/fabrica-n8n')
+    integracoes_dir = site_dir / 'integracoes'
     
-    # Encontrar todos os HTMLs gerados
-    html_files = sorted([f for f in integracoes_dir.glob('*.html') if f.name != 'index.html'])
+    # Encontrar todos os HTMLs gerados (pelo manifesto do site, sem listar o diretório)
+    html_files = [f for f in section_files('integracoes', site_dir) if not is_listing_page(f.name)]
     
     print("=" * 70)
     print("🧪 TESTE DE VALIDAÇÃO DE PÁGINAS HTML")
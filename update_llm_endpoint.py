@@ -5,41 +5,33 @@ Conta templates N8N, Zapier e artigos do blog automaticamente
 """
 
 import os
-import csv
 import re
-from pathlib import Path
+
+from catalogue import count_rows
+from site_manifest import section_files
 
 def count_n8n_templates():
     """Conta templates N8N no CSV"""
-    csv_file = 'automacoes_db.csv'
-    if not os.path.exists(csv_file):
+    try:
+        return count_rows('automacoes_db.csv')
+    except FileNotFoundError:
         return 0
-    
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        return sum(1 for row in reader)
 
 def count_zapier_templates():
     """Conta templates Zapier no CSV"""
-    csv_file = 'automacoes_zapier_db.csv'
-    if not os.path.exists(csv_file):
+    try:
+        return count_rows('automacoes_zapier_db.csv')
+    except FileNotFoundError:
         return 0
-    
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        return sum(1 for row in reader)
 
 def count_blog_articles():
     """Conta artigos do blog"""
-    blog_dir = Path('blog')
-    if not blog_dir.exists():
-        return 0
-    
     # Excluir templates e arquivos especiais
     exclude_files = {'email_template_welcome.html', 'template_page.html', 'index.html'}
     
+    # Lista do manifesto do site (sem listar blog/, se a seção já foi registrada)
     html_files = [
-        f for f in blog_dir.glob('*.html')
+        f for f in section_files('blog', '.')
         if f.name not in exclude_files
     ]
     
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Validação e normalização do catálogo antes do build, em fluxo
+
+As linhas do CSV iam direto para o HTML: slug vazio era pulado em
+silêncio, aspas e barras invertidas quebravam o JSON-LD e passos gravados
+um por linha ("1. ...\\n2. ...") viravam um único passo. Este estágio lê o
+catálogo linha a linha e aplica regras por coluna. A memória cresce só com
+o conjunto de slugs já vistos (um fingerprint de 8 bytes, ~80-100 bytes
+por slug com o overhead do set: ~10 MB para 100k linhas). Quando o store
+colunar (automacoes_db.parquet/, ver catalogue.resolve_path) está em uso,
+é ele que o build lê e é ele que é validado, carregado inteiro pelo
+pyarrow; a saída normalizada continua sendo um CSV.
+
+    • slug_url: obrigatório, só [a-z0-9%._-] e único no catálogo;
+    • colunas obrigatórias (catalogue.REQUIRED_FIELDS) não vazias;
+    • texto: caracteres de controle removidos e espaços colapsados;
+    • passos_resumo: separador normalizado para '|' (sem numeração);
+    • tags: separadas por ',' sem espaços nem itens vazios;
+    • colunas que o template insere em strings do JSON-LD (softwares,
+      título, descrição) sem '"' nem '\\';
+    • título e descrição dentro do limite de caracteres (aviso; erro com
+      --strict).
+
+Linhas com erro vão para <csv>_rejects.csv (número da linha, valores
+originais e motivos) e não entram na saída normalizada. O resumo é
+impresso e, opcionalmente, gravado em JSON; o código de saída é 1 quando
+há rejeições, para o pipeline parar antes do build.
+
+Uso:
+    python validate_catalogue.py                          # só verifica automacoes_db.csv (ou o store .parquet)
+    python validate_catalogue.py --in-place               # grava o CSV normalizado
+    python validate_catalogue.py automacoes_zapier_db.csv --output limpo.csv --summary-json resumo.json
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import re
+import sys
+from collections import Counter
+from contextlib import ExitStack
+from datetime import datetime
+from pathlib import Path
+
+import columnar_catalogue
+from catalogue import (N8N_CSV, REQUIRED_FIELDS, STEP_SEPARATOR, CatalogueError, resolve_path, split_steps,
+                       validate_fieldnames)
+from output_writer import open_atomic, write_atomic
+
+TITLE_MAX_LENGTH = 70          # o <title> ainda ganha " | Automations Cookbook"
+DESCRIPTION_MAX_LENGTH = 160   # meta description
+LENGTH_LIMITS = {'titulo_pagina': TITLE_MAX_LENGTH, 'descricao_curta': DESCRIPTION_MAX_LENGTH}
+
+# Colunas inseridas pelo template dentro de strings do JSON-LD
+JSON_LD_FIELDS = ('software_a', 'software_b', 'titulo_pagina', 'descricao_curta')
+JSON_UNSAFE_CHARACTERS = ('"', '\\')
+
+SLUG_PATTERN = re.compile(r'^[a-z0-9%._-]+$')
+CONTROL_PATTERN = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
+REJECTS_SUFFIX = '_rejects'
+
+# Regras (código -> descrição usada no resumo)
+RULES = {
+    'colunas': 'número de colunas diferente do cabeçalho',
+    'obrigatorio': 'coluna obrigatória vazia',
+    'slug-invalido': 'slug com caracteres fora de [a-z0-9%._-]',
+    'slug-duplicado': 'slug repetido (vale a primeira linha)',
+    'json-ld': 'aspas ou barra invertida em coluna do JSON-LD',
+    'tamanho': 'título/descrição acima do limite',
+}
+
+
+def normalize_text(value):
+    """Remove caracteres de controle e colapsa espaços/quebras de linha"""
+    if not value.isprintable():
+        value = CONTROL_PATTERN.sub('', value)
+    return ' '.join(value.split())
+
+
+def normalize_steps(value):
+    return STEP_SEPARATOR.join(normalize_text(step) for step in split_steps(value))
+
+
+def normalize_tags(value):
+    return ','.join(filter(None, (normalize_text(tag) for tag in value.split(','))))
+
+
+NORMALIZERS = {'passos_resumo': normalize_steps, 'tags': normalize_tags}
+
+
+def slug_fingerprint(slug):
+    return hashlib.blake2b(slug.encode('utf-8'), digest_size=8).digest()
+
+
+class ValidationStats:
+    """Contadores da validação (linhas, rejeições e ocorrências por regra)"""
+
+    def __init__(self):
+        self.rows = 0
+        self.valid = 0
+        self.rejected = 0
+        self.normalized = 0
+        self.warnings = 0
+        self.errors = Counter()
+        self.warning_counts = Counter()
+
+    def as_dict(self):
+        return {
+            'rows': self.rows,
+            'valid': self.valid,
+            'rejected': self.rejected,
+            'normalized': self.normalized,
+            'warnings': self.warnings,
+            'errors_by_rule': dict(self.errors),
+            'warnings_by_rule': dict(self.warning_counts),
+        }
+
+
+class RowValidator:
+    """Aplica as regras a cada linha; guarda só os fingerprints dos slugs já vistos"""
+
+    def __init__(self, fieldnames, strict=False):
+        self.fieldnames = list(fieldnames)
+        self.strict = strict
+        self.slugs = set()
+
+    def check(self, values):
+        """(valores normalizados, erros, avisos); erros/avisos são listas de (regra, detalhe)"""
+        if len(values) != len(self.fieldnames):
+            return values, [('colunas', f'{len(values)} colunas, esperado {len(self.fieldnames)}')], []
+
+        normalized = [NORMALIZERS.get(name, normalize_text)(value)
+                      for name, value in zip(self.fieldnames, values)]
+        row = dict(zip(self.fieldnames, normalized))
+        errors = []
+        warnings = []
+
+        for name in REQUIRED_FIELDS:
+            if not row[name]:
+                errors.append(('obrigatorio', name))
+
+        slug = row['slug_url']
+        if slug and not SLUG_PATTERN.match(slug):
+            errors.append(('slug-invalido', slug))
+
+        for name in JSON_LD_FIELDS:
+            if name in row and any(char in row[name] for char in JSON_UNSAFE_CHARACTERS):
+                errors.append(('json-ld', name))
+
+        for name, limit in LENGTH_LIMITS.items():
+            if len(row.get(name, '')) > limit:
+                issue = ('tamanho', f'{name} com {len(row[name])} caracteres (máx. {limit})')
+                (errors if self.strict else warnings).append(issue)
+
+        # o slug só é registrado por linhas aceitas, para a correção de uma
+        # linha rejeitada não virar duplicata
+        if slug and not errors:
+            fingerprint = slug_fingerprint(slug)
+            if fingerprint in self.slugs:
+                errors.append(('slug-duplicado', slug))
+            else:
+                self.slugs.add(fingerprint)
+        return normalized, errors, warnings
+
+
+def rejects_path(path):
+    path = Path(path)
+    if columnar_catalogue.is_store(path):
+        path = path.with_suffix('.csv')
+    return path.with_name(f'{path.stem}{REJECTS_SUFFIX}{path.suffix}')
+
+
+def read_rows(path, stack):
+    """(fieldnames, iterador de (número da linha, valores)) do CSV ou do store colunar
+
+    No store, o número é o da linha no CSV exportado (cabeçalho = linha 1).
+    """
+    if columnar_catalogue.is_store(path):
+        fieldnames, value_rows = columnar_catalogue.read_store(path)
+        rows = (['' if value is None else value for value in values] for values in value_rows)
+        return fieldnames, enumerate(rows, 2)
+    reader = csv.reader(stack.enter_context(open(path, 'r', encoding='utf-8', newline='')))
+    fieldnames = next(reader, [])
+    return fieldnames, ((reader.line_num, values) for values in reader)
+
+
+def format_issues(issues):
+    return '; '.join(f'{rule}: {detail}' for rule, detail in issues)
+
+
+def validate_catalogue(path, output=None, rejects=None, strict=False):
+    """Valida o catálogo em fluxo; grava a saída normalizada (se output) e as rejeições
+
+    path pode ser o CSV ou o store colunar (.parquet). Devolve um ValidationStats. O arquivo de rejeições só é criado quando
+    há linhas rejeitadas (e um arquivo antigo é removido quando não há).
+    """
+    path = Path(path)
+    rejects = Path(rejects) if rejects else rejects_path(path)
+    stats = ValidationStats()
+
+    with ExitStack() as stack:
+        fieldnames, rows = read_rows(path, stack)
+        validate_fieldnames(path, fieldnames)
+        validator = RowValidator(fieldnames, strict)
+
+        writer = None
+        if output:
+            writer = csv.writer(stack.enter_context(open_atomic(output)))
+            writer.writerow(fieldnames)
+        rejects_writer = None
+
+        for line_number, values in rows:
+            if not values:
+                continue
+            stats.rows += 1
+            normalized, errors, warnings = validator.check(values)
+            stats.warnings += len(warnings)
+            stats.warning_counts.update(rule for rule, _ in warnings)
+
+            if errors:
+                stats.rejected += 1
+                stats.errors.update(rule for rule, _ in errors)
+                if rejects_writer is None:
+                    rejects_writer = csv.writer(stack.enter_context(open_atomic(rejects)))
+                    rejects_writer.writerow(['linha'] + fieldnames + ['motivos'])
+                padding = [''] * (len(fieldnames) - len(values))
+                rejects_writer.writerow([line_number] + values + padding + [format_issues(errors)])
+                continue
+
+            stats.valid += 1
+            if normalized != values:
+                stats.normalized += 1
+            if writer:
+                writer.writerow(normalized)
+
+    if not stats.rejected:
+        rejects.unlink(missing_ok=True)
+    return stats
+
+
+def print_summary(path, stats, elapsed, output, rejects):
+    print(f"🧪 {Path(path).name}: {stats.rows} linhas em {elapsed:.2f}s")
+    print(f"   • Válidas: {stats.valid} (normalizadas: {stats.normalized})")
+    print(f"   • Rejeitadas: {stats.rejected}")
+    for rule, count in stats.errors.most_common():
+        print(f"      - {RULES[rule]}: {count}")
+    print(f"   • Avisos: {stats.warnings}")
+    for rule, count in stats.warning_counts.most_common():
+        print(f"      - {RULES[rule]}: {count}")
+    if output:
+        print(f"💾 CSV normalizado: {output}")
+    if stats.rejected:
+        print(f"❌ Linhas rejeitadas em {rejects}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Valida e normaliza o catálogo antes do build')
+    parser.add_argument('csv', nargs='?', default=str(N8N_CSV),
+                        help='CSV do catálogo (padrão: automacoes_db.csv; o store .parquet ao lado, se estiver em uso)')
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--output', help='Gravar as linhas válidas, normalizadas, neste CSV')
+    target.add_argument('--in-place', action='store_true', help='Substituir o próprio CSV pela versão normalizada')
+    parser.add_argument('--rejects', help='CSV das linhas rejeitadas (padrão: <csv>_rejects.csv)')
+    parser.add_argument('--summary-json', help='Gravar o resumo neste arquivo JSON')
+    parser.add_argument('--strict', action='store_true', help='Tratar avisos (limites de tamanho) como erros')
+    args = parser.parse_args()
+
+    path = resolve_path(args.csv)
+    if args.in_place and columnar_catalogue.is_store(path):
+        print(f"❌ Erro: --in-place não regrava o store colunar ({path.name}); use --output")
+        sys.exit(1)
+    output = path if args.in_place else args.output
+    rejects = Path(args.rejects) if args.rejects else rejects_path(path)
+
+    start_time = datetime.now()
+    try:
+        stats = validate_catalogue(path, output, rejects, args.strict)
+    except FileNotFoundError:
+        print(f"❌ Erro: '{args.csv}' não encontrado.")
+        sys.exit(1)
+    except CatalogueError as e:
+        print(f"❌ Erro: {e}")
+        sys.exit(1)
+    elapsed = (datetime.now() - start_time).total_seconds()
+
+    print_summary(path, stats, elapsed, output, rejects)
+    if args.summary_json:
+        write_atomic(args.summary_json, json.dumps(stats.as_dict(), ensure_ascii=False, indent=2).encode('utf-8'))
+    if stats.rejected:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -12,12 +12,13 @@ Testa:
 """
 
 import random
-import csv
 import os
 import json
 from pathlib import Path
 import logging
 
+from catalogue import load_catalogue
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -34,9 +35,7 @@ class RichResultsValidator:
         """Seleciona amostra aleatória de templates"""
         logger.info("🎲 Selecionando amostra aleatória de templates...")
         
-        with open('automacoes_db.csv', 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            templates = [row for row in reader if row.get('slug_url')]
+        templates = [row for row in load_catalogue('automacoes_db.csv') if row.get('slug_url')]
         
         # Selecionar 10 templates aleatórios
         sample = random.sample(templates, min(self.sample_size, len(templates)))